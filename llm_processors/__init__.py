@@ -1,9 +1,15 @@
 """LLM-based processors for team name normalization and score predictions."""
 
-from llm_processors.chatgpt_ncaaf import run_chatgpt_ncaaf
-from llm_processors.chatgpt_nfl import run_chatgpt_nfl
-from llm_processors.team_to_university import process_team_names
-from llm_processors.team_to_mascot import process_team_names_nfl
+import importlib
+
+# Processors are imported on first access (PEP 562), so importing one processor
+# doesn't load the OpenAI, Tavily and LangChain clients the others import at top level
+_PROCESSOR_MODULES = {
+    "run_chatgpt_ncaaf": ".chatgpt_ncaaf",
+    "run_chatgpt_nfl": ".chatgpt_nfl",
+    "process_team_names": ".team_to_university",
+    "process_team_names_nfl": ".team_to_mascot",
+}
 
 __all__ = [
     "run_chatgpt_ncaaf",
@@ -12,3 +18,17 @@ __all__ = [
     "process_team_names_nfl",
 ]
 
+
+def __getattr__(name):
+    """Import a processor function from its module the first time it is accessed."""
+    module_name = _PROCESSOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily imported processor functions alongside the module globals."""
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,180 @@
+"""Helpers for running chat completions through the OpenAI Batch API.
+
+The Batch API trades latency (results within the 24h completion window) for
+half-price tokens and a separate, larger rate-limit pool, which suits the
+offline team-name normalization jobs.
+"""
+
+import functools
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+from langchain_core.utils.function_calling import convert_to_openai_function
+from openai import OpenAI
+from pydantic import BaseModel
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import get_logger
+from utils import json_io
+
+logger = get_logger(__name__)
+
+
+# Terminal batch statuses that will never produce output
+FAILED_STATUSES = {"failed", "expired", "cancelling", "cancelled"}
+
+
+def build_chat_request(
+    custom_id: str,
+    messages: List[Dict[str, str]],
+    model: str = "gpt-4o-mini",
+    temperature: float = 0,
+    response_format: Optional[Dict] = None
+) -> Dict:
+    """
+    Build one JSONL line for a /v1/chat/completions batch.
+    
+    Args:
+        custom_id: Identifier used to match the output line back to its request
+        messages: Chat messages as role/content dictionaries
+        model: Model name
+        temperature: Sampling temperature
+        response_format: Optional response_format (e.g. from json_schema_response_format())
+        
+    Returns:
+        Batch request dictionary
+    """
+    body = {
+        "model": model,
+        "temperature": temperature,
+        "messages": messages,
+    }
+    if response_format is not None:
+        body["response_format"] = response_format
+    
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": body,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def json_schema_response_format(output_model: type[BaseModel]) -> Dict:
+    """
+    Build a strict structured-output response_format for a Pydantic model (cached per model).
+    
+    Args:
+        output_model: Pydantic model the response must satisfy
+        
+    Returns:
+        response_format dictionary for a chat completions request
+    """
+    function = convert_to_openai_function(output_model, strict=True)
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": function["name"],
+            "schema": function["parameters"],
+            "strict": True,
+        },
+    }
+
+
+def submit_batch(client: OpenAI, requests: List[Dict]) -> str:
+    """
+    Upload batch requests as a JSONL file and create the batch job.
+    
+    Args:
+        client: OpenAI API client
+        requests: Requests built with build_chat_request()
+        
+    Returns:
+        Batch ID
+    """
+    jsonl = "\n".join(json_io.dumps(request) for request in requests)
+    
+    batch_file = client.files.create(
+        file=("batch_requests.jsonl", jsonl.encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+    return batch.id
+
+
+def wait_for_batch(
+    client: OpenAI,
+    batch_id: str,
+    poll_interval: float = 30,
+    timeout: Optional[float] = None
+) -> Dict[str, str]:
+    """
+    Poll a batch until it completes and return the message content per request.
+    
+    Args:
+        client: OpenAI API client
+        batch_id: Batch ID returned by submit_batch()
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait (None waits for the full completion window)
+        
+    Returns:
+        Dictionary mapping custom_id to the assistant message content.
+        Requests that errored inside the batch are omitted.
+        
+    Raises:
+        RuntimeError: If the batch fails, expires or is cancelled
+        TimeoutError: If the batch does not finish within timeout
+    """
+    start_time = time.time()
+    
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        
+        if batch.status == "completed":
+            break
+        if batch.status in FAILED_STATUSES:
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+        if timeout is not None and time.time() - start_time > timeout:
+            raise TimeoutError(f"Batch {batch_id} did not complete within {timeout:.0f}s (status '{batch.status}')")
+        
+        logger.info(f"Batch {batch_id} status: {batch.status}, checking again in {poll_interval:.0f}s")
+        time.sleep(poll_interval)
+    
+    outputs = {}
+    if not batch.output_file_id:
+        logger.warning(f"Batch {batch_id} completed without an output file")
+        return outputs
+    
+    output_text = client.files.content(batch.output_file_id).text
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        item = json_io.loads(line)
+        custom_id = item.get("custom_id")
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            logger.error(f"Batch request {custom_id} failed: {item.get('error') or response.get('status_code')}")
+            continue
+        outputs[custom_id] = response["body"]["choices"][0]["message"]["content"]
+    
+    logger.info(f"Batch {batch_id} completed with {len(outputs)} successful responses")
+    return outputs
+
+
+def cancel_batch(client: OpenAI, batch_id: str) -> None:
+    """Best-effort cancellation of a batch that is no longer needed."""
+    try:
+        client.batches.cancel(batch_id)
+        logger.info(f"Cancelled batch {batch_id}")
+    except Exception as e:
+        logger.warning(f"Could not cancel batch {batch_id}: {e}")
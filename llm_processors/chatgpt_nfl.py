@@ -4,18 +4,28 @@ Uses Tavily API to search for predicted scores from multiple sources,
 then uses ChatGPT to extract and parse scores from unstructured text.
 """
 
-import json
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional
-from tavily import TavilyClient
-from openai import OpenAI
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+from pydantic import BaseModel, Field
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from utils import Config, get_logger
+from utils import json_io
+from utils.openai_throttle import OpenAIThrottle, estimate_tokens
+
+if TYPE_CHECKING:
+    # Client libraries are imported in run_chatgpt_nfl so importing this module stays cheap
+    from tavily import AsyncTavilyClient
+    from openai import AsyncOpenAI
 
 logger = get_logger(__name__)
 
@@ -23,22 +33,11 @@ logger = get_logger(__name__)
 # System prompt for ChatGPT score extraction (NFL version)
 SYSTEM_PROMPT = """You are an NFL (National Football League) game prediction extractor and formatter.
 
-Given raw web search results about a specific NFL game matchup, you must identify any predicted or expected scores mentioned in the text, average them if multiple appear, and return a clean JSON structure with the following fields:
-
-{
-  "<row_number>": {
-    "away_team": "<away_team_mascot_name>",
-    "home_team": "<home_team_mascot_name>",
-    "predicted_score_away": <integer>,
-    "predicted_score_home": <integer>
-  }
-}
+Given raw web search results about a specific NFL game matchup, you must identify any predicted or expected scores mentioned in the text, average them if multiple appear, and return the game's row number, team names and predicted scores.
 
 Rules:
-- Only return valid JSON.
 - Use integer values.
 - If no score is found, set both scores to 24 and 21 respectively (default NFL scores).
-- Do not include any commentary or extra text.
 - Only extract scores that look realistic (10–60 range for NFL games).
 - If multiple predictions appear, calculate their mean and round to nearest integer.
 - Never hallucinate or make up scores.
@@ -51,58 +50,217 @@ QUERY_VARIATIONS = [
     "{away_team} {home_team} NFL prediction",
 ]
 
+# Number of games sent to ChatGPT in a single extraction request
+BATCH_SIZE = 15
+
+# Prompt size bounds for a single game's Tavily text (scores sit near the top of each snippet)
+MAX_RESULT_CONTENT_CHARS = 500
+MAX_RAW_TEXT_CHARS = 12000  # ~3000 tokens
+
+# Matched sources used for the averaged fallback when ChatGPT finds nothing
+SCORE_SOURCES = ('fantasynerds', 'sportsline', 'florio', 'simms', 'dimers', 'oddshark')
+SPREAD_SOURCES = ('espn', 'dratings')  # Win probabilities (0-100)
+BASE_TOTAL_SCORE = 48  # Typical total score in NFL games
+
+# Pipeline concurrency: Tavily producers and in-flight OpenAI extraction batches
+# (OpenAI requests are additionally paced by OpenAIThrottle)
+MAX_CONCURRENT_TAVILY_REQUESTS = 10
+MAX_CONCURRENT_OPENAI_REQUESTS = 20
+
+# A batch is sent once it holds BATCH_SIZE games, once no new game has arrived for
+# BATCH_IDLE_TIMEOUT seconds, or BATCH_MAX_WAIT seconds after its first game
+BATCH_IDLE_TIMEOUT = 2.0
+BATCH_MAX_WAIT = 10.0
+
+
+class GamePrediction(BaseModel):
+    """Predicted scores ChatGPT extracted for one NFL game."""
+    row_number: str = Field(description="Row number of the game, exactly as given in the prompt")
+    away_team: str = Field(description="NFL mascot name of away team")
+    home_team: str = Field(description="NFL mascot name of home team")
+    predicted_score_away: int = Field(description="Predicted score for away team")
+    predicted_score_home: int = Field(description="Predicted score for home team")
+
+
+class GamePredictions(BaseModel):
+    """Predicted scores for every game in a batched extraction request."""
+    games: list[GamePrediction] = Field(description="One entry per game row number in the prompt")
+
+
+class TavilySearchCache:
+    """On-disk cache of Tavily search results keyed by the exact query string."""
+    
+    def __init__(self, cache_dir: str, ttl: float):
+        """
+        Initialize Tavily search cache.
+        
+        Args:
+            cache_dir: Directory holding one JSON file per cached query
+            ttl: Seconds a cached result stays valid
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, query: str) -> str:
+        """Get the cache file path for a query."""
+        key = hashlib.sha1(query.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, query: str) -> Optional[List[Dict]]:
+        """
+        Get cached results for a query.
+        
+        Args:
+            query: Exact Tavily query string
+            
+        Returns:
+            Cached result list, or None if missing, expired or unreadable
+        """
+        path = self._path(query)
+        try:
+            if os.path.getmtime(path) < time.time() - self.ttl:
+                return None
+            return json_io.load_json(path).get('results', [])
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def set(self, query: str, results: List[Dict]) -> None:
+        """
+        Store results for a query.
+        
+        Args:
+            query: Exact Tavily query string
+            results: Tavily result list
+        """
+        try:
+            json_io.dump_json(self._path(query), {"query": query, "results": results, "ts": time.time()}, indent=False)
+        except OSError as e:
+            logger.warning(f"Could not write Tavily cache for query '{query}': {e}")
+
 
-def collect_raw_tavily_results(
-    tavily_client: TavilyClient,
+async def collect_raw_tavily_results(
+    tavily_client: AsyncTavilyClient,
     away_team: str,
     home_team: str,
-    max_results: int = 5
+    max_results: int = 5,
+    cache: Optional[TavilySearchCache] = None
 ) -> str:
     """
     Collect all raw Tavily search results (titles + contents) for a game.
     
+    The query variations return largely the same pages, so results are
+    deduplicated by URL (or title when there is no URL) before joining.
+    Each snippet is truncated to MAX_RESULT_CONTENT_CHARS and the combined
+    text to MAX_RAW_TEXT_CHARS to bound the extraction prompt.
+    
     Args:
         tavily_client: Tavily API client
         away_team: Away team name (mascot)
         home_team: Home team name (mascot)
         max_results: Maximum results per query
+        cache: Optional on-disk cache consulted before calling Tavily
         
     Returns:
         Combined text string of all search results
     """
-    all_texts = []
-    
-    for query_template in QUERY_VARIATIONS:
+    async def search(query_template: str) -> List[Dict]:
+        query = query_template.format(away_team=away_team, home_team=home_team)
+        results = []
         try:
-            query = query_template.format(away_team=away_team, home_team=home_team)
-            logger.debug(f"Searching Tavily: {query}")
-            
-            response = tavily_client.search(
-                query=query,
-                max_results=max_results,
-                search_depth="basic"
-            )
-            
-            # Collect all titles and contents
-            for result in response.get('results', []):
-                title = result.get('title', '')
-                content = result.get('content', '')
-                if title or content:
-                    all_texts.append(f"Title: {title}\nContent: {content}\n")
-            
+            results = cache.get(query) if cache else None
+            if results is not None:
+                logger.debug(f"Using cached Tavily results: {query}")
+            else:
+                logger.debug(f"Searching Tavily: {query}")
+                response = await tavily_client.search(
+                    query=query,
+                    max_results=max_results,
+                    search_depth="basic"
+                )
+                results = response.get('results', [])
+                if cache:
+                    cache.set(query, results)
         except Exception as e:
             logger.warning(f"Error searching Tavily with query '{query}': {e}")
-            continue
+        
+        return results
+    
+    # Run all query variations concurrently, keeping their original order
+    all_texts = []
+    seen_urls = set()
+    for results in await asyncio.gather(*(search(query_template) for query_template in QUERY_VARIATIONS)):
+        for result in results:
+            title = result.get('title', '')
+            content = result.get('content', '')[:MAX_RESULT_CONTENT_CHARS]
+            if not title and not content:
+                continue
+            
+            url = result.get('url', '') or title
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            
+            all_texts.append(f"Title: {title}\nContent: {content}\n")
+    
+    return "\n---\n".join(all_texts)[:MAX_RAW_TEXT_CHARS]
+
+
+def _prediction_scores(prediction: GamePrediction) -> Dict[str, int]:
+    """Convert a validated game prediction into a score dict."""
+    return {
+        "predicted_score_away": prediction.predicted_score_away,
+        "predicted_score_home": prediction.predicted_score_home
+    }
+
+
+async def _create_completion(
+    openai_client: AsyncOpenAI,
+    user_prompt: str,
+    max_tokens: int,
+    output_model: type[BaseModel],
+    throttle: Optional[OpenAIThrottle] = None
+):
+    """
+    Send the score extraction prompt to ChatGPT, paced by the throttle if given.
     
-    return "\n---\n".join(all_texts)
+    Args:
+        openai_client: OpenAI API client
+        user_prompt: User prompt to send after SYSTEM_PROMPT
+        max_tokens: Completion token budget
+        output_model: Pydantic model the response must satisfy (strict structured output)
+        throttle: Optional rate limiter shared by all requests
+        
+    Returns:
+        Chat completion response
+    """
+    # Imported lazily: the batch helpers pull in LangChain for the schema conversion
+    from llm_processors.batch import json_schema_response_format
+    
+    async def request():
+        return await openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.0,
+            max_tokens=max_tokens,
+            response_format=json_schema_response_format(output_model)
+        )
+    
+    if throttle is None:
+        return await request()
+    return await throttle.run(request, estimate_tokens(SYSTEM_PROMPT + user_prompt, max_tokens))
 
 
-def extract_scores_with_chatgpt(
-    openai_client: OpenAI,
+async def extract_scores_with_chatgpt(
+    openai_client: AsyncOpenAI,
     raw_text: str,
     row_number: str,
     away_team: str,
-    home_team: str
+    home_team: str,
+    throttle: Optional[OpenAIThrottle] = None
 ) -> Optional[Dict[str, int]]:
     """
     Use ChatGPT to extract predicted scores from raw Tavily search results.
@@ -113,11 +271,11 @@ def extract_scores_with_chatgpt(
         row_number: Row number as string
         away_team: Away team name (mascot)
         home_team: Home team name (mascot)
+        throttle: Optional rate limiter shared by all requests
         
     Returns:
         Dictionary with predicted scores or None if failed
     """
-    content = None
     try:
         user_prompt = f"""Extract predicted scores for the following NFL game from the web search results below.
 
@@ -125,80 +283,83 @@ Game: {away_team} vs {home_team}
 Row Number: {row_number}
 
 Web Search Results:
-{raw_text}
-
-Return the JSON with row_number as the key and include away_team, home_team, predicted_score_away, and predicted_score_home."""
+{raw_text}"""
         
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.0,
-            max_tokens=500
-        )
+        response = await _create_completion(openai_client, user_prompt, 500, GamePrediction, throttle)
         
-        content = response.choices[0].message.content.strip()
+        # The strict response schema guarantees the shape; validation converts it to a model
+        prediction = GamePrediction.model_validate_json(response.choices[0].message.content)
+        return _prediction_scores(prediction)
         
-        # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
+    except Exception as e:
+        logger.error(f"Row {row_number}: Error extracting scores with ChatGPT: {e}")
+        return None
+
+
+async def extract_scores_batch(
+    openai_client: AsyncOpenAI,
+    chunk: Dict[str, Dict[str, str]],
+    throttle: Optional[OpenAIThrottle] = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    Use a single ChatGPT request to extract predicted scores for several games.
+    
+    Args:
+        openai_client: OpenAI API client
+        chunk: Mapping of row number to a dict with away_team, home_team and raw_text
+        throttle: Optional rate limiter shared by all requests
         
-        parsed_result = json.loads(content)
+    Returns:
+        Dictionary mapping row number to predicted scores. Rows that ChatGPT
+        did not return (or returned malformed) are omitted.
+    """
+    try:
+        game_blocks = "\n\n".join(
+            f"=== Row {row_number}: {game['away_team']} vs {game['home_team']} ===\n{game['raw_text']}"
+            for row_number, game in chunk.items()
+        )
+        user_prompt = f"""Extract predicted scores for each of the following NFL games from the web search results below.
+Each game is introduced by a header line with its row number and matchup.
+
+{game_blocks}
+
+Return one entry in games for EVERY row number listed above ({', '.join(chunk.keys())})."""
         
-        # Validate structure
-        if not isinstance(parsed_result, dict):
-            raise ValueError("ChatGPT did not return a dictionary")
+        response = await _create_completion(openai_client, user_prompt, 100 * len(chunk) + 100, GamePredictions, throttle)
         
-        # Extract the result for this row number
-        if row_number in parsed_result:
-            result = parsed_result[row_number]
-            # Ensure we have the required fields
-            if 'predicted_score_away' in result and 'predicted_score_home' in result:
-                # Convert to integers if they're not already
-                return {
-                    "predicted_score_away": int(result['predicted_score_away']),
-                    "predicted_score_home": int(result['predicted_score_home'])
-                }
+        predictions = GamePredictions.model_validate_json(response.choices[0].message.content)
         
-        logger.warning(f"Row {row_number}: ChatGPT response missing expected structure")
-        return None
+        # Dispatch each game of the combined response by its row number
+        results = {}
+        for prediction in predictions.games:
+            row_number = prediction.row_number.strip()
+            if row_number in chunk and row_number not in results:
+                results[row_number] = _prediction_scores(prediction)
+        return results
         
-    except json.JSONDecodeError as e:
-        logger.error(f"Row {row_number}: Failed to parse ChatGPT JSON response: {e}")
-        try:
-            logger.debug(f"Raw response: {content[:200]}")
-        except:
-            pass
-        return None
     except Exception as e:
-        logger.error(f"Row {row_number}: Error extracting scores with ChatGPT: {e}")
-        return None
+        logger.error(f"Rows {', '.join(chunk.keys())}: Error extracting batched scores with ChatGPT: {e}")
+        return {}
 
 
-def process_single_game(
-    tavily_client: TavilyClient,
-    openai_client: OpenAI,
+async def collect_game_context(
+    tavily_client: AsyncTavilyClient,
     game: Dict,
-    row_number: str
-) -> tuple[str, Optional[Dict[str, int]]]:
+    row_number: str,
+    cache: Optional[TavilySearchCache] = None
+) -> tuple[str, Optional[Dict[str, str]]]:
     """
-    Process a single game to get predicted scores using ChatGPT.
+    Collect the Tavily search results for a single game.
     
     Args:
         tavily_client: Tavily API client
-        openai_client: OpenAI API client
         game: Game dictionary with away_team and home_team
         row_number: Sheet row number as string
+        cache: Optional on-disk Tavily cache
         
     Returns:
-        Tuple of (row_number, score_dict) or (row_number, None) if failed
+        Tuple of (row_number, context_dict) where context_dict holds away_team,
+        home_team and raw_text, or (row_number, None) if nothing was found
     """
     away_team = game.get('away_team', '').strip()
     home_team = game.get('home_team', '').strip()
@@ -210,39 +371,246 @@ def process_single_game(
     logger.info(f"Processing row {row_number}: {away_team} vs {home_team}")
     
     # Collect raw Tavily search results
-    raw_results = collect_raw_tavily_results(
+    raw_results = await collect_raw_tavily_results(
         tavily_client, 
         away_team, 
         home_team, 
-        max_results=5
+        max_results=5,
+        cache=cache
     )
     
     if not raw_results or not raw_results.strip():
         logger.warning(f"Row {row_number}: No Tavily results found for {away_team} vs {home_team}")
         return (row_number, None)
     
-    # Use ChatGPT to extract scores from raw results
-    scores = extract_scores_with_chatgpt(
-        openai_client,
-        raw_results,
-        row_number,
-        away_team,
-        home_team
-    )
+    return (row_number, {
+        "away_team": away_team,
+        "home_team": home_team,
+        "raw_text": raw_results
+    })
+
+
+async def extract_scores_for_games(
+    openai_client: AsyncOpenAI,
+    contexts: Dict[str, Dict[str, str]],
+    throttle: Optional[OpenAIThrottle] = None,
+    batch_size: int = BATCH_SIZE
+) -> Dict[str, Dict[str, int]]:
+    """
+    Extract scores for all collected games, batching several games per request.
+    
+    Games missing from a batched response are retried individually.
+    
+    Args:
+        openai_client: OpenAI API client
+        contexts: Mapping of row number to collected game context
+        throttle: Optional rate limiter shared by all requests
+        batch_size: Number of games per ChatGPT request
+        
+    Returns:
+        Dictionary mapping row number to predicted scores
+    """
+    row_numbers = list(contexts.keys())
+    chunks = [
+        {row: contexts[row] for row in row_numbers[i:i + batch_size]}
+        for i in range(0, len(row_numbers), batch_size)
+    ]
+    
+    async def extract_single(row: str) -> tuple[str, Optional[Dict[str, int]]]:
+        context = contexts[row]
+        scores = await extract_scores_with_chatgpt(
+            openai_client,
+            context['raw_text'],
+            row,
+            context['away_team'],
+            context['home_team'],
+            throttle=throttle
+        )
+        return (row, scores)
+    
+    results = {}
+    for chunk_results in await asyncio.gather(*(extract_scores_batch(openai_client, chunk, throttle) for chunk in chunks)):
+        results.update(chunk_results)
+    
+    # Fall back to per-game extraction for rows the batched responses missed
+    missing_rows = [row for row in row_numbers if row not in results]
+    if missing_rows:
+        logger.warning(f"Batched extraction missed rows {missing_rows}, retrying individually")
+        for row, scores in await asyncio.gather(*(extract_single(row) for row in missing_rows)):
+            if scores:
+                results[row] = scores
     
-    if scores:
+    for row_number, scores in results.items():
         logger.info(f"Row {row_number}: Extracted scores - {scores['predicted_score_away']}-{scores['predicted_score_home']}")
-        return (row_number, scores)
-    else:
-        logger.warning(f"Row {row_number}: Failed to extract scores with ChatGPT")
-        return (row_number, None)
+    
+    return results
+
+
+async def gather_predictions(
+    tavily_client: AsyncTavilyClient,
+    openai_client: AsyncOpenAI,
+    games: List[Dict],
+    cache: Optional[TavilySearchCache] = None,
+    throttle: Optional[OpenAIThrottle] = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    Collect Tavily results and extract scores as a two-stage pipeline.
+    
+    Tavily producers push each game's context onto a queue as soon as it is
+    collected. A single batcher groups queued contexts into requests of up to
+    BATCH_SIZE games and starts each request without waiting for the previous
+    one, so extraction overlaps with the remaining Tavily searches.
+    
+    Args:
+        tavily_client: Tavily API client
+        openai_client: OpenAI API client
+        games: Games from sheets_games.json
+        cache: Optional on-disk Tavily cache
+        throttle: Optional OpenAI rate limiter
+        
+    Returns:
+        Dictionary mapping row number to predicted scores
+    """
+    tavily_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TAVILY_REQUESTS)
+    openai_semaphore = asyncio.Semaphore(MAX_CONCURRENT_OPENAI_REQUESTS)
+    queue: asyncio.Queue = asyncio.Queue()
+    results = {}
+    
+    async def produce(game: Dict, row_num: str) -> None:
+        try:
+            async with tavily_semaphore:
+                _, context = await collect_game_context(tavily_client, game, row_num, cache=cache)
+        except Exception as e:
+            logger.error(f"Error processing game row {row_num}: {e}")
+            return
+        
+        if context:
+            await queue.put((row_num, context))
+        else:
+            logger.warning(f"Failed to get predictions for row {row_num}")
+    
+    async def produce_all() -> None:
+        await asyncio.gather(*(
+            produce(game, str(game.get('row_number', ''))) for game in games
+        ))
+        # Stop signal for the batcher once every game has been collected
+        await queue.put(None)
+    
+    async def extract(contexts: Dict[str, Dict[str, str]]) -> None:
+        async with openai_semaphore:
+            try:
+                results.update(await extract_scores_for_games(openai_client, contexts, throttle=throttle))
+            except Exception as e:
+                logger.error(f"Rows {', '.join(contexts.keys())}: Error extracting scores: {e}")
+    
+    async def batch_and_extract() -> tuple[int, int]:
+        loop = asyncio.get_running_loop()
+        requests = []
+        game_count = 0
+        finished = False
+        
+        while not finished:
+            item = await queue.get()
+            if item is None:
+                break
+            
+            # Keep collecting until the batch is full, arrivals pause, or it has waited long enough
+            contexts = {item[0]: item[1]}
+            deadline = loop.time() + BATCH_MAX_WAIT
+            while len(contexts) < BATCH_SIZE:
+                timeout = min(BATCH_IDLE_TIMEOUT, deadline - loop.time())
+                if timeout <= 0:
+                    break
+                try:
+                    next_item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if next_item is None:
+                    finished = True
+                    break
+                contexts[next_item[0]] = next_item[1]
+            
+            game_count += len(contexts)
+            requests.append(asyncio.create_task(extract(contexts)))
+        
+        await asyncio.gather(*requests)
+        return game_count, len(requests)
+    
+    _, (game_count, batch_count) = await asyncio.gather(produce_all(), batch_and_extract())
+    
+    if game_count:
+        logger.info(f"Sent {game_count} games to ChatGPT in {batch_count} batched requests")
+        if batch_count > math.ceil(game_count / BATCH_SIZE):
+            logger.warning(
+                f"Tavily results arrived slowly, so {batch_count} batches were needed "
+                f"instead of {math.ceil(game_count / BATCH_SIZE)}"
+            )
+    
+    return results
+
+
+def _average_source_scores(game_data: Dict) -> Optional[tuple[Dict[str, int], List[str]]]:
+    """
+    Average the matched source predictions for one game in a single pass.
+    
+    Score sources contribute their rounded predicted scores; spread sources
+    (win probabilities) are converted to scores by splitting BASE_TOTAL_SCORE.
+    
+    Args:
+        game_data: One row of matched_sheets_rows from matched_games.json
+        
+    Returns:
+        Tuple of (scores dict, sources used), or None if no source had data
+    """
+    total_away = 0
+    total_home = 0
+    sources_used = []
+    
+    for source in SCORE_SOURCES:
+        prediction = game_data.get(source)
+        if not isinstance(prediction, dict):
+            continue
+        away = prediction.get('predicted_score_away')
+        home = prediction.get('predicted_score_home')
+        if away is not None and home is not None:
+            total_away += round(float(away))
+            total_home += round(float(home))
+            sources_used.append(source)
+    
+    for source in SPREAD_SOURCES:
+        prediction = game_data.get(source)
+        if not isinstance(prediction, dict):
+            continue
+        spread_away = prediction.get('spread_away')
+        spread_home = prediction.get('spread_home')
+        if spread_away is None or spread_home is None:
+            continue
+        # Normalize spreads to sum to 100, then distribute base total
+        total_spread = float(spread_away) + float(spread_home)
+        if total_spread > 0:
+            total_away += round(float(spread_away) / total_spread * BASE_TOTAL_SCORE)
+            total_home += round(float(spread_home) / total_spread * BASE_TOTAL_SCORE)
+            sources_used.append(source)
+    
+    if not sources_used:
+        return None
+    
+    count = len(sources_used)
+    return (
+        {
+            "predicted_score_away": round(total_away / count),
+            "predicted_score_home": round(total_home / count)
+        },
+        sources_used
+    )
 
 
 def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
     """
     Main function to gather predictions using Tavily and ChatGPT for NFL.
     
-    Uses ChatGPT to extract scores from raw Tavily search results for each game.
+    Collects raw Tavily search results for each game and feeds them to
+    ChatGPT extraction as they arrive, batching games that are ready together.
     
     Args:
         config: Application configuration (loads from env if not provided)
@@ -250,6 +618,9 @@ def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    from tavily import AsyncTavilyClient
+    from openai import AsyncOpenAI
+    
     config = config or Config.from_env()
     
     # Load games from sheets (NFL)
@@ -258,8 +629,7 @@ def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
         logger.error(f"Sheets games file not found: {sheets_file}")
         return False
     
-    with open(sheets_file, 'r', encoding='utf-8') as f:
-        sheets_data = json.load(f)
+    sheets_data = json_io.load_json(sheets_file)
     
     games = sheets_data.get('games', [])
     if not games:
@@ -270,7 +640,7 @@ def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
     
     # Initialize Tavily client
     try:
-        tavily_client = TavilyClient(api_key=config.tavily_api_key)
+        tavily_client = AsyncTavilyClient(api_key=config.tavily_api_key)
         logger.info("Tavily client initialized")
     except Exception as e:
         logger.error(f"Failed to initialize Tavily client: {e}")
@@ -278,40 +648,22 @@ def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
     
     # Initialize OpenAI client for score extraction
     try:
-        openai_client = OpenAI(api_key=config.openai_api_key)
+        openai_client = AsyncOpenAI(api_key=config.openai_api_key)
         logger.info("OpenAI client initialized")
     except Exception as e:
         logger.error(f"Failed to initialize OpenAI client: {e}")
         return False
     
-    # Process games in parallel (5 at a time to avoid rate limits)
-    results = {}
+    # Reuse recent Tavily results across re-runs
+    cache = None
+    if config.tavily_cache_enabled:
+        cache = TavilySearchCache(config.get_data_path("tavily_cache", league="nfl"), config.tavily_cache_ttl)
     
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all tasks with row number tracking
-        futures = {}
-        for game in games:
-            row_num = str(game.get('row_number', ''))
-            future = executor.submit(
-                process_single_game, 
-                tavily_client, 
-                openai_client,
-                game, 
-                row_num
-            )
-            futures[future] = row_num
-        
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                row_num, score_dict = future.result()
-                if score_dict:
-                    results[row_num] = score_dict
-                else:
-                    logger.warning(f"Failed to get predictions for row {row_num}")
-            except Exception as e:
-                row_num = futures.get(future, "unknown")
-                logger.error(f"Error processing game row {row_num}: {e}")
+    # Pace OpenAI requests to the account's RPM/TPM limits
+    throttle = OpenAIThrottle(config.openai_rpm, config.openai_tpm)
+    
+    # Run the Tavily -> ChatGPT pipeline on one event loop
+    results = asyncio.run(gather_predictions(tavily_client, openai_client, games, cache=cache, throttle=throttle))
     
     # Verify all games have predictions
     expected_rows = {str(game.get('row_number', '')) for game in games}
@@ -324,75 +676,24 @@ def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
         matched_data = {}
         if os.path.exists(matched_file):
             try:
-                with open(matched_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    matched_data = data.get('matched_sheets_rows', {})
+                data = json_io.load_json(matched_file)
+                matched_data = data.get('matched_sheets_rows', {})
             except Exception as e:
                 logger.warning(f"Could not load matched_games.json for fallback: {e}")
         
         for row_num in missing_rows:
-            collected_scores = []
-            
-            if row_num in matched_data:
-                game_data = matched_data[row_num]
-                
-                # Collect scores from sources with direct scores (NFL sources)
-                for source in ['fantasynerds', 'sportsline', 'florio', 'simms', 'dimers', 'oddshark']:
-                    if source in game_data and isinstance(game_data[source], dict):
-                        away = game_data[source].get('predicted_score_away')
-                        home = game_data[source].get('predicted_score_home')
-                        if away is not None and home is not None:
-                            collected_scores.append({
-                                "predicted_score_away": round(float(away)),
-                                "predicted_score_home": round(float(home)),
-                                "source": source
-                            })
-                
-                # Convert spreads from ESPN and DRatings to scores
-                # Spreads are win probabilities (0-100), convert to scores using a base total
-                BASE_TOTAL_SCORE = 48  # Typical total score in NFL games
-                for source in ['espn', 'dratings']:
-                    if source in game_data and isinstance(game_data[source], dict):
-                        spread_away = game_data[source].get('spread_away')
-                        spread_home = game_data[source].get('spread_home')
-                        if spread_away is not None and spread_home is not None:
-                            # Convert win probabilities to scores
-                            # Normalize spreads to sum to 100, then distribute base total
-                            total_spread = float(spread_away) + float(spread_home)
-                            if total_spread > 0:
-                                away_score = (float(spread_away) / total_spread) * BASE_TOTAL_SCORE
-                                home_score = (float(spread_home) / total_spread) * BASE_TOTAL_SCORE
-                                collected_scores.append({
-                                    "predicted_score_away": round(away_score),
-                                    "predicted_score_home": round(home_score),
-                                    "source": source
-                                })
-            
-            # Calculate average if at least 3 sources available
-            if len(collected_scores) >= 3:
-                avg_away = round(sum(s['predicted_score_away'] for s in collected_scores) / len(collected_scores))
-                avg_home = round(sum(s['predicted_score_home'] for s in collected_scores) / len(collected_scores))
-                fallback_scores = {
-                    "predicted_score_away": avg_away,
-                    "predicted_score_home": avg_home
-                }
-                sources_used = [s['source'] for s in collected_scores]
-                logger.warning(f"Using averaged scores from {len(collected_scores)} sources ({', '.join(sources_used)}) for row {row_num}: {avg_away}-{avg_home}")
-            elif len(collected_scores) > 0:
-                # Use available sources if less than 3
-                avg_away = round(sum(s['predicted_score_away'] for s in collected_scores) / len(collected_scores))
-                avg_home = round(sum(s['predicted_score_home'] for s in collected_scores) / len(collected_scores))
-                fallback_scores = {
-                    "predicted_score_away": avg_away,
-                    "predicted_score_home": avg_home
-                }
-                sources_used = [s['source'] for s in collected_scores]
-                logger.warning(f"Using averaged scores from {len(collected_scores)} source(s) ({', '.join(sources_used)}) for row {row_num}: {avg_away}-{avg_home}")
-            else:
+            fallback = _average_source_scores(matched_data.get(row_num, {}))
+            if fallback is None:
                 # No sources available - don't add to results (will remain empty in sheets)
                 logger.warning(f"No matched data available for row {row_num}, leaving ChatGPT predictions empty")
                 continue  # Skip adding this row to results
             
+            fallback_scores, sources_used = fallback
+            label = "sources" if len(sources_used) >= 3 else "source(s)"
+            logger.warning(
+                f"Using averaged scores from {len(sources_used)} {label} ({', '.join(sources_used)}) "
+                f"for row {row_num}: {fallback_scores['predicted_score_away']}-{fallback_scores['predicted_score_home']}"
+            )
             results[row_num] = fallback_scores
     
     # Sort results by row number to maintain sheets order
@@ -400,8 +701,7 @@ def run_chatgpt_nfl(config: Optional[Config] = None) -> bool:
     
     # Save to output file (maintains order in Python 3.7+)
     output_file = config.get_data_path("chatgpt_matched.json", league="nfl")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(sorted_results, f, indent=2)
+    json_io.dump_json(output_file, sorted_results)
     
     logger.info(f"Saved predictions to {output_file}")
     logger.info(f"Total games processed: {len(sorted_results)}")
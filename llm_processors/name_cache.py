@@ -0,0 +1,71 @@
+"""Persistent raw team name -> normalized name cache shared across runs."""
+
+import os
+import sys
+from typing import Dict, Optional
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import get_logger
+from utils import json_io
+
+logger = get_logger(__name__)
+
+
+def normalize_key(name: str) -> str:
+    """Normalize a team name for cache lookup ("Penn St." and "penn st" share a key)."""
+    return " ".join(name.lower().replace(".", "").split())
+
+
+class TeamNameCache:
+    """
+    Team name conversions for one league, backed by a JSON file.
+    
+    Keys are normalized with normalize_key(), so spelling variants that only
+    differ in case, periods or spacing are converted once.
+    """
+    
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Args:
+            cache_file: JSON file to persist to (None keeps the cache in memory only)
+        """
+        self.cache_file = cache_file
+        self.entries: Dict[str, str] = {}
+        self.dirty = False
+    
+    def load(self) -> "TeamNameCache":
+        """Load entries from disk (missing or unreadable files start empty)."""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return self
+        
+        try:
+            entries = json_io.load_json(self.cache_file)
+            if isinstance(entries, dict):
+                self.entries = entries
+        except (OSError, json_io.JSONDecodeError) as e:
+            logger.warning(f"Could not load team name cache {self.cache_file}: {e}")
+        
+        return self
+    
+    def save(self) -> None:
+        """Persist entries if anything changed since loading."""
+        if not self.cache_file or not self.dirty:
+            return
+        
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        json_io.dump_json(self.cache_file, dict(sorted(self.entries.items())))
+        self.dirty = False
+        logger.info(f"Saved {len(self.entries)} team names to {self.cache_file}")
+    
+    def get(self, name: str) -> Optional[str]:
+        """Return the cached conversion for a raw name, or None."""
+        return self.entries.get(normalize_key(name))
+    
+    def put(self, name: str, value: str) -> None:
+        """Store the conversion for a raw name."""
+        key = normalize_key(name)
+        if key and value and self.entries.get(key) != value:
+            self.entries[key] = value
+            self.dirty = True
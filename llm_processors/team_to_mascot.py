@@ -1,22 +1,32 @@
-"""Convert NFL team names to standard mascot names using LLM."""
+"""Convert NFL team names to standard mascot names via alias lookup, with a cached LLM fallback."""
 
-import json
+import asyncio
+import functools
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, Callable
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
+from typing import Dict, Any, Optional
+from pydantic import BaseModel, Field, ValidationError
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from utils import Config, get_logger
+from llm_processors.name_cache import TeamNameCache, normalize_key
+from utils import Config, get_logger, lookup_nfl_mascot
+from utils import json_io
 
 logger = get_logger(__name__)
 
+# Persisted raw team name -> mascot cache, stored next to the LLM outputs
+MASCOT_CACHE_FILE = "mascot_cache.json"
+
+# All unknown names from every file go out in one request; only an unusually
+# large set (e.g. a fresh cache) is split to stay within the output token limit
+MAX_NAMES_PER_REQUEST = 150
+
+# Batch API polling: check every 30s, give up and fall back to live requests after 1h
+BATCH_POLL_INTERVAL = 30
+BATCH_WAIT_TIMEOUT = 60 * 60
+
 
 # ========== Pydantic Models ========== #
 
@@ -67,6 +77,17 @@ class SpreadGamesOutput(BaseModel):
     games: list[SpreadGameConverted] = Field(description="List of games with standard mascot names")
 
 
+class TeamNameConversion(BaseModel):
+    """A single raw team name and its standard mascot name."""
+    raw_name: str = Field(description="Team name exactly as given in the input list")
+    mascot: str = Field(description="Standard NFL mascot name (e.g., 'Ravens', 'Dolphins')")
+
+
+class TeamNamesOutput(BaseModel):
+    """Output for converted team names."""
+    conversions: list[TeamNameConversion] = Field(description="One conversion per input team name")
+
+
 # ========== Prompts ========== #
 
 SYSTEM_PROMPT = """You are an authoritative expert on NFL team identity.
@@ -102,7 +123,7 @@ RULES:
 6. Use standard NFL mascot names that are commonly recognized.
 7. If a name is already just the mascot, return it as-is."""
 
-USER_PROMPT_TEMPLATE = """Convert every NFL team name into its STANDARD MASCOT NAME.
+USER_PROMPT_TEMPLATE = """Convert every NFL team name in the list below into its STANDARD MASCOT NAME.
 
 RULES:
 - Extract only the mascot name (e.g., "Dolphins", "Ravens", "Bears").
@@ -111,11 +132,10 @@ RULES:
 - Handle lowercase or uppercase variations.
 - For special cases like "49ers", keep the number as part of the name.
 - Always return the standard, commonly recognized mascot name.
+- Return exactly one conversion per input name, copying the input name unchanged into raw_name.
 
 {data}
 
-{format_instructions}
-
 FINAL REMINDER:
 Return only the standard NFL mascot name. Remove city names, fix typos, and normalize to the standard format.
 Examples: "Miami Dolphins" → "Dolphins", "Baltimore" → "Ravens", "Cincinati" → "Bengals"."""
@@ -123,120 +143,206 @@ Examples: "Miami Dolphins" → "Dolphins", "Baltimore" → "Ravens", "Cincinati"
 
 # ========== Processing Functions ========== #
 
-def get_llm() -> ChatOpenAI:
-    """Get configured LLM instance."""
-    config = Config.from_env()
-    return ChatOpenAI(
+@functools.lru_cache(maxsize=None)
+def get_llm(output_model: Optional[type[BaseModel]] = None, openai_api_key: Optional[str] = None):
+    """
+    Get configured LLM instance, shared across calls with the same arguments.
+    
+    Args:
+        output_model: Pydantic model to enforce with OpenAI structured outputs
+        openai_api_key: OpenAI API key (read from the environment if not provided)
+        
+    Returns:
+        ChatOpenAI instance, or a runnable returning output_model instances
+    """
+    # Imported lazily: LangChain is slow to import and only needed when the LLM runs
+    from langchain_openai import ChatOpenAI
+    
+    if openai_api_key is None:
+        openai_api_key = Config.from_env().openai_api_key
+    llm = ChatOpenAI(
         model="gpt-4o-mini",
         temperature=0,
-        openai_api_key=config.openai_api_key
+        openai_api_key=openai_api_key
     )
+    if output_model is None:
+        return llm
+    return llm.with_structured_output(output_model, method="json_schema", strict=True)
 
 
-def process_sheets_games(file_path: str) -> Dict[str, Any]:
-    """Process sheets_games.json file."""
-    logger.info(f"Processing {file_path}")
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    llm = get_llm()
-    parser = PydanticOutputParser(pydantic_object=SheetsGamesOutput)
-    
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        data=json.dumps(data, indent=2),
-        format_instructions=parser.get_format_instructions()
-    )
+def collect_team_names(data: Dict[str, Any]) -> set[str]:
+    """Collect every raw away/home team name in a games file."""
+    names = set()
+    for game in data.get('games', []):
+        for key in ('away_team', 'home_team'):
+            name = game.get(key)
+            if isinstance(name, str) and name.strip():
+                names.add(name.strip())
+    return names
+
+
+async def normalize_names_with_llm(names: list[str], llm=None) -> Dict[str, str]:
+    """
+    Ask the LLM for the standard mascot name of each raw team name.
     
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=user_prompt)
-    ]
+    Names from all files share a single request; lists longer than
+    MAX_NAMES_PER_REQUEST are split into concurrent requests.
     
-    response = llm.invoke(messages)
-    result = parser.parse(response.content)
+    Args:
+        names: Raw team names not found in the cache
+        llm: Structured-output LLM returning TeamNamesOutput (defaults to get_llm())
+        
+    Returns:
+        Dictionary mapping raw name to mascot for every name the LLM returned
+    """
+    # The response schema is enforced by the API, so no format instructions in the prompt
+    if llm is None:
+        llm = get_llm(TeamNamesOutput)
     
-    return result.model_dump()
+    name_map = {}
+    for chunk_map in await asyncio.gather(*(_normalize_chunk(llm, chunk) for chunk in _chunk_names(names))):
+        name_map.update(chunk_map)
+    return name_map
 
 
-def process_prediction_games(file_path: str) -> Dict[str, Any]:
-    """Process prediction games files (fantasynerds, sportsline, florio, simms, dimers, oddshark)."""
-    logger.info(f"Processing {file_path}")
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    llm = get_llm()
-    parser = PydanticOutputParser(pydantic_object=PredictionGamesOutput)
+def _chunk_names(names: list[str]) -> list[list[str]]:
+    """Split raw team names into request-sized chunks."""
+    return [names[i:i + MAX_NAMES_PER_REQUEST] for i in range(0, len(names), MAX_NAMES_PER_REQUEST)]
+
+
+def _conversion_map(result: TeamNamesOutput, names: list[str]) -> Dict[str, str]:
+    """Map each requested raw name to its mascot, dropping names that weren't asked for."""
+    requested = set(names)
+    return {
+        conversion.raw_name.strip(): conversion.mascot.strip()
+        for conversion in result.conversions
+        if conversion.raw_name.strip() in requested and conversion.mascot.strip()
+    }
+
+
+async def _normalize_chunk(llm, names: list[str]) -> Dict[str, str]:
+    """Convert one request's worth of raw team names with the structured-output LLM."""
+    from langchain_core.messages import HumanMessage, SystemMessage
     
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        data=json.dumps(data, indent=2),
-        format_instructions=parser.get_format_instructions()
-    )
+    user_prompt = USER_PROMPT_TEMPLATE.format(data=json_io.dumps({"names": names}))
     
     messages = [
         SystemMessage(content=SYSTEM_PROMPT),
         HumanMessage(content=user_prompt)
     ]
     
-    response = llm.invoke(messages)
-    result = parser.parse(response.content)
+    result = await llm.ainvoke(messages)
     
-    return result.model_dump()
+    return _conversion_map(result, names)
 
 
-def process_spread_games(file_path: str) -> Dict[str, Any]:
-    """Process spread games files (espn, dratings)."""
-    logger.info(f"Processing {file_path}")
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    llm = get_llm()
-    parser = PydanticOutputParser(pydantic_object=SpreadGamesOutput)
+def normalize_names_with_batch(names: list[str], config: Config) -> Dict[str, str]:
+    """
+    Ask for the standard mascot name of each raw team name through the OpenAI Batch API.
     
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        data=json.dumps(data, indent=2),
-        format_instructions=parser.get_format_instructions()
+    Args:
+        names: Raw team names not found in the alias table or cache
+        config: Application configuration
+        
+    Returns:
+        Dictionary mapping raw name to mascot for every name the batch returned
+        (empty if the batch did not finish within BATCH_WAIT_TIMEOUT)
+    """
+    # Imported lazily: the batch helpers pull in LangChain, like the live path
+    from openai import OpenAI
+    from llm_processors.batch import (
+        build_chat_request, cancel_batch, json_schema_response_format, submit_batch, wait_for_batch
     )
     
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=user_prompt)
+    client = OpenAI(api_key=config.openai_api_key)
+    chunks = _chunk_names(names)
+    requests = [
+        build_chat_request(
+            str(index),
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": USER_PROMPT_TEMPLATE.format(data=json_io.dumps({"names": chunk}))}
+            ],
+            response_format=json_schema_response_format(TeamNamesOutput)
+        )
+        for index, chunk in enumerate(chunks)
     ]
     
-    response = llm.invoke(messages)
-    result = parser.parse(response.content)
+    batch_id = submit_batch(client, requests)
+    try:
+        outputs = wait_for_batch(client, batch_id, poll_interval=BATCH_POLL_INTERVAL, timeout=BATCH_WAIT_TIMEOUT)
+    except TimeoutError as e:
+        logger.warning(f"{e}; falling back to live requests")
+        cancel_batch(client, batch_id)
+        return {}
+    
+    name_map = {}
+    for custom_id, content in outputs.items():
+        try:
+            result = TeamNamesOutput.model_validate_json(content)
+        except ValidationError as e:
+            # Names from this request stay unresolved, so the live path retries them
+            logger.error(f"Invalid batch output for request {custom_id}: {e}")
+            continue
+        name_map.update(_conversion_map(result, chunks[int(custom_id)]))
+    return name_map
+
+
+def convert_games(data: Dict[str, Any], output_model: type[BaseModel], name_map: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Rebuild a games file with mascot names, validated against its output model.
+    
+    Args:
+        data: Loaded games file
+        output_model: Pydantic model describing the converted file
+        name_map: Raw name -> mascot mapping
+        
+    Returns:
+        Converted file as a dictionary
+    """
+    converted = dict(data)
+    converted['games'] = []
+    for game in data.get('games', []):
+        game = dict(game)
+        for key in ('away_team', 'home_team'):
+            name = game.get(key)
+            if isinstance(name, str):
+                game[key] = name_map.get(name.strip(), name.strip())
+        converted['games'].append(game)
     
-    return result.model_dump()
+    return output_model.model_validate(converted).model_dump()
 
 
-def process_single_file(
-    input_file: str, 
-    output_file: str, 
-    processor_func: Callable
-) -> tuple[str, str, bool, str]:
-    """Process a single file and return the result."""
-    try:
-        logger.info(f"Processing {input_file}...")
-        
-        # Process the file
-        result = processor_func(input_file)
-        
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        # Save the result
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
-        
-        logger.info(f"Successfully saved {output_file}")
-        return (input_file, output_file, True, "")
-        
-    except Exception as e:
-        error_msg = f"Error processing {input_file}: {str(e)}"
-        logger.error(error_msg)
-        return (input_file, output_file, False, str(e))
+def process_sheets_games(data: Dict[str, Any], name_map: Dict[str, str]) -> Dict[str, Any]:
+    """Process sheets_games.json data."""
+    return convert_games(data, SheetsGamesOutput, name_map)
+
+
+def process_prediction_games(data: Dict[str, Any], name_map: Dict[str, str]) -> Dict[str, Any]:
+    """Process prediction games data (fantasynerds, sportsline, florio, simms, dimers, oddshark)."""
+    return convert_games(data, PredictionGamesOutput, name_map)
+
+
+def process_spread_games(data: Dict[str, Any], name_map: Dict[str, str]) -> Dict[str, Any]:
+    """Process spread games data (espn, dratings)."""
+    return convert_games(data, SpreadGamesOutput, name_map)
+
+
+def resolve_from_cache(names: set[str], name_map: Dict[str, str], name_cache: TeamNameCache) -> None:
+    """Add cached mascots for every name not already in name_map."""
+    for name in names - name_map.keys():
+        mascot = name_cache.get(name)
+        if mascot:
+            name_map[name] = mascot
+
+
+def save_result(output_file: str, result: Dict[str, Any]) -> None:
+    """Save a converted result, creating the output directory if needed."""
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    
+    json_io.dump_json(output_file, result)
+    
+    logger.info(f"Successfully saved {output_file}")
 
 
 def process_team_names_nfl(config=None):
@@ -274,21 +380,80 @@ def process_team_names_nfl(config=None):
          process_spread_games)
     ]
     
-    logger.info("Starting concurrent processing of all NFL files...")
+    results = []
+    loaded_files = []
     
-    # Use ThreadPoolExecutor to process files concurrently
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all tasks
-        future_to_file = {
-            executor.submit(process_single_file, input_file, output_file, processor_func): input_file
-            for input_file, output_file, processor_func in files_to_process
-        }
+    # Load every file and gather the distinct raw team names across all of them
+    raw_names = set()
+    for input_file, output_file, processor_func in files_to_process:
+        try:
+            data = json_io.load_json(input_file)
+            raw_names |= collect_team_names(data)
+            loaded_files.append((input_file, output_file, processor_func, data))
+        except Exception as e:
+            logger.error(f"Error processing {input_file}: {str(e)}")
+            results.append((input_file, output_file, False, str(e)))
+    
+    # Resolve names from the static alias table first
+    name_map = {}
+    for name in raw_names:
+        mascot = lookup_nfl_mascot(name)
+        if mascot:
+            name_map[name] = mascot
+    
+    # Anything left comes from the cache of earlier LLM conversions
+    name_cache = TeamNameCache(config.get_llm_mascot_path(MASCOT_CACHE_FILE)).load()
+    resolve_from_cache(raw_names, name_map, name_cache)
+    
+    # Spellings that only differ in case, periods or spacing are sent once
+    unknown_keys = {}
+    for name in sorted(raw_names - name_map.keys()):
+        unknown_keys.setdefault(normalize_key(name), name)
+    unknown_names = sorted(unknown_keys.values())
+    
+    if not unknown_names:
+        logger.info(f"All {len(raw_names)} team names resolved without LLM")
+    elif config.enable_llm_fallback:
+        logger.info(f"Normalizing {len(unknown_names)} unrecognized team names with LLM ({len(raw_names) - len(unknown_names)} resolved locally)")
+        conversions = {}
+        if config.use_batch_api:
+            logger.info("Submitting unrecognized team names to the OpenAI Batch API...")
+            try:
+                conversions = normalize_names_with_batch(unknown_names, config)
+            except Exception as e:
+                logger.error(f"Batch processing failed: {e}; falling back to live requests")
         
-        # Collect results as they complete
-        results = []
-        for future in as_completed(future_to_file):
-            result = future.result()
-            results.append(result)
+        # Interactive runs (and anything the batch could not handle) use live requests
+        live_names = [name for name in unknown_names if name not in conversions]
+        if live_names:
+            try:
+                llm = get_llm(TeamNamesOutput, config.openai_api_key)
+                conversions.update(asyncio.run(normalize_names_with_llm(live_names, llm=llm)))
+            except Exception as e:
+                logger.error(f"Error normalizing team names with LLM: {e}")
+        
+        if conversions:
+            for name, mascot in conversions.items():
+                name_cache.put(name, mascot)
+            resolve_from_cache(raw_names, name_map, name_cache)
+            try:
+                name_cache.save()
+            except OSError as e:
+                logger.error(f"Could not save mascot cache {name_cache.cache_file}: {e}")
+    
+    missing = sorted(raw_names - name_map.keys())
+    if missing:
+        logger.warning(f"No mascot found for {missing}, keeping raw names")
+    
+    # Rebuild each output file locally from the resolved names
+    for input_file, output_file, processor_func, data in loaded_files:
+        try:
+            save_result(output_file, processor_func(data, name_map))
+            results.append((input_file, output_file, True, ""))
+        except Exception as e:
+            error_msg = f"Error processing {input_file}: {str(e)}"
+            logger.error(error_msg)
+            results.append((input_file, output_file, False, str(e)))
     
     # Print summary
     print("\n" + "="*50)
@@ -1,22 +1,42 @@
 """Convert team names to official university names using LLM."""
 
-import json
+import asyncio
+import functools
 import os
+import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
+from openai import OpenAI
+from pydantic import BaseModel, Field, ValidationError
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from llm_processors.batch import (
+    build_chat_request, cancel_batch, json_schema_response_format, submit_batch, wait_for_batch
+)
+from llm_processors.name_cache import TeamNameCache, normalize_key
 from utils import Config, get_logger
+from utils import json_io
 
 logger = get_logger(__name__)
 
+# Persisted team name -> university cache (data/ncaaf/)
+UNIVERSITY_CACHE_FILE = "team_name_cache.json"
+
+# Maximum number of in-flight per-game LLM requests (live path)
+MAX_CONCURRENT_REQUESTS = 20
+
+# Batch API polling: check every 30s, give up and fall back to live requests after 1h
+BATCH_POLL_INTERVAL = 30
+BATCH_WAIT_TIMEOUT = 60 * 60
+
+# Names already in official form ("University of X", "X University", "X Polytechnic Y")
+# are used as-is instead of being sent to the LLM
+OFFICIAL_NAME_RE = re.compile(r'^(?:University of .+|.+ University|.+ Polytechnic .+)$')
+
 
 # ========== Pydantic Models ========== #
 
@@ -67,6 +87,20 @@ class SpreadGamesOutput(BaseModel):
     games: list[SpreadGameConverted] = Field(description="List of games with full university names")
 
 
+# Game model used inside each output model
+GAME_MODELS = {
+    SheetsGamesOutput: SheetsGameConverted,
+    PredictionGamesOutput: PredictionGameConverted,
+    SpreadGamesOutput: SpreadGameConverted,
+}
+
+
+class TeamPairConverted(BaseModel):
+    """Official university names for a single game's two teams."""
+    away_team: str = Field(description="Registered full university name of away team")
+    home_team: str = Field(description="Registered full university name of home team")
+
+
 # ========== Prompts ========== #
 
 SYSTEM_PROMPT = """You are an authoritative expert on NCAA college football team identity.
@@ -92,135 +126,288 @@ RULES:
 4. Do not shorten or use nicknames; always spell out the full institutional name.
 5. Campus or city details may be included if part of the official registered name."""
 
-USER_PROMPT_TEMPLATE = """Convert every NCAAF team name into its REGISTERED FULL UNIVERSITY NAME.
+GAME_PROMPT_TEMPLATE = """Convert both NCAAF team names into their REGISTERED FULL UNIVERSITY NAMES.
 
-RULES:
-- Write the exact official university name as registered (e.g., NCAA / school's legal name).
-- Ignore mascots, short forms, or nicknames — replace them with the official university name.
-- If the name contains "State" or "St.", keep it.
-- If it doesn't, do NOT add "State" yourself.
-- The output must always be the exact, correct university name — not abbreviations or fan versions.
+Away team: {away_team}
+Home team: {home_team}"""
 
-{data}
-
-{format_instructions}
-
-FINAL REMINDER:
-Write only the team's registered full university name as it officially exists. 
-If the team name includes "State" or "St.", include it. If it doesn't, don't.
-No nicknames, mascots, abbreviations, or invented forms — just the correct, full, official university name."""
+# Built once and reused by every per-game request
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
 
 
 # ========== Processing Functions ========== #
 
-def get_llm() -> ChatOpenAI:
-    """Get configured LLM instance."""
-    config = Config.from_env()
+@functools.lru_cache(maxsize=None)
+def get_llm(openai_api_key: Optional[str] = None) -> ChatOpenAI:
+    """
+    Get configured LLM instance, shared across calls with the same API key.
+    
+    Args:
+        openai_api_key: OpenAI API key (read from the environment if not provided)
+        
+    Returns:
+        ChatOpenAI instance
+    """
+    if openai_api_key is None:
+        openai_api_key = Config.from_env().openai_api_key
     return ChatOpenAI(
         model="gpt-4o-mini",
         temperature=0,
-        openai_api_key=config.openai_api_key
+        openai_api_key=openai_api_key
     )
 
 
-def process_sheets_games(file_path: str) -> Dict[str, Any]:
-    """Process sheets_games.json file."""
-    logger.info(f"Processing {file_path}")
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    llm = get_llm()
-    parser = PydanticOutputParser(pydantic_object=SheetsGamesOutput)
-    
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        data=json.dumps(data, indent=2),
-        format_instructions=parser.get_format_instructions()
+def to_structured_llm(llm: ChatOpenAI):
+    """Wrap an LLM so it returns validated TeamPairConverted objects."""
+    return llm.with_structured_output(TeamPairConverted, method="json_schema", strict=True)
+
+
+@functools.lru_cache(maxsize=None)
+def get_structured_llm(openai_api_key: Optional[str] = None):
+    """Get the shared structured-output LLM for an API key."""
+    return to_structured_llm(get_llm(openai_api_key))
+
+
+def load_data(file_path: str) -> Dict[str, Any]:
+    """Load a scraped games JSON file."""
+    return json_io.load_json(file_path)
+
+
+def build_game_prompt(game: Dict[str, Any]) -> str:
+    """Build the user prompt asking for one game's two university names."""
+    return GAME_PROMPT_TEMPLATE.format(
+        away_team=game.get('away_team', ''),
+        home_team=game.get('home_team', '')
     )
+
+
+async def convert_game(
+    llm,
+    game: Dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Any]:
+    """
+    Convert one game's team names with a small dedicated LLM request.
     
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=user_prompt)
-    ]
+    Args:
+        llm: Shared structured-output LLM returning TeamPairConverted
+        game: Game dictionary with away_team and home_team
+        semaphore: Limits in-flight requests across all files
+        
+    Returns:
+        Copy of the game with university names for away_team and home_team
+    """
+    user_prompt = build_game_prompt(game)
     
-    response = llm.invoke(messages)
-    result = parser.parse(response.content)
+    async with semaphore:
+        pair = await llm.ainvoke([SYSTEM_MESSAGE, HumanMessage(content=user_prompt)])
     
-    return result.model_dump()
+    return {**game, "away_team": pair.away_team, "home_team": pair.home_team}
 
 
-def process_prediction_games(file_path: str) -> Dict[str, Any]:
-    """Process dimers_games.json and oddshark_games.json files."""
-    logger.info(f"Processing {file_path}")
+def lookup_university(name: str, cache: TeamNameCache) -> Optional[str]:
+    """
+    Resolve a team name without the LLM.
     
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    Args:
+        name: Raw team name
+        cache: Team name cache
+        
+    Returns:
+        Cached university name, the name itself if already official, or None
+    """
+    university = cache.get(name)
+    if university is None and name and OFFICIAL_NAME_RE.match(name.strip()):
+        return ' '.join(name.split())
+    return university
+
+
+def find_uncached_games(datas: list[Dict[str, Any]], cache: TeamNameCache) -> list[Dict[str, Any]]:
+    """
+    Pick the games that still need an LLM request, each uncached name appearing once.
     
-    llm = get_llm()
-    parser = PydanticOutputParser(pydantic_object=PredictionGamesOutput)
+    Args:
+        datas: Loaded games files
+        cache: Team name cache
+        
+    Returns:
+        Games containing at least one name not already resolved or requested
+    """
+    requested = set()
+    games = []
+    for data in datas:
+        for game in data.get('games', []):
+            names = {game.get('away_team', ''), game.get('home_team', '')}
+            new_names = {normalize_key(name) for name in names if name and lookup_university(name, cache) is None} - requested
+            if new_names:
+                requested |= new_names
+                games.append(game)
+    return games
+
+
+async def resolve_uncached_names(
+    datas: list[Dict[str, Any]],
+    cache: TeamNameCache,
+    llm: Optional[ChatOpenAI] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    openai_api_key: Optional[str] = None
+) -> None:
+    """
+    Convert every name missing from the cache with per-game LLM requests.
     
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        data=json.dumps(data, indent=2),
-        format_instructions=parser.get_format_instructions()
-    )
+    Each request only carries one game's two team names, so the model
+    generates a few tokens per call instead of re-emitting the whole file.
     
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=user_prompt)
-    ]
+    Args:
+        datas: Loaded games files
+        cache: Team name cache, updated in place
+        llm: Shared LLM instance (created if not provided)
+        semaphore: Shared request limiter (created if not provided)
+        openai_api_key: API key for the shared LLM when llm is not provided
+    """
+    games = find_uncached_games(datas, cache)
+    if not games:
+        return
+    
+    logger.info(f"Converting {len(games)} games with uncached team names ({len(cache.entries)} names cached)")
+    # The API enforces the response schema and returns validated objects
+    structured_llm = to_structured_llm(llm) if llm is not None else get_structured_llm(openai_api_key)
+    semaphore = semaphore or asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
-    response = llm.invoke(messages)
-    result = parser.parse(response.content)
+    async def convert_and_cache(game: Dict[str, Any]) -> None:
+        # Each response is recorded as soon as it arrives, while others are still in flight
+        try:
+            result = await convert_game(structured_llm, game, semaphore)
+        except Exception as e:
+            logger.error(f"Error converting {game.get('away_team')} vs {game.get('home_team')}: {e}")
+            return
+        for key in ('away_team', 'home_team'):
+            cache.put(game.get(key, ''), result[key])
     
-    return result.model_dump()
+    await asyncio.gather(*(convert_and_cache(game) for game in games))
 
 
-def process_spread_games(file_path: str) -> Dict[str, Any]:
-    """Process espn_games.json and dratings_games.json files."""
-    logger.info(f"Processing {file_path}")
+def apply_cached_names(data: Dict[str, Any], output_model: type[BaseModel], cache: TeamNameCache) -> Dict[str, Any]:
+    """
+    Rebuild a games file with cached university names.
     
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    Args:
+        data: Loaded games file
+        output_model: Pydantic model the converted file must satisfy
+        cache: Team name cache
+        
+    Returns:
+        Converted file contents (names missing from the cache are kept as-is)
+    """
+    games = []
+    for game in data.get('games', []):
+        game = dict(game)
+        for key in ('away_team', 'home_team'):
+            name = game.get(key, '')
+            university = lookup_university(name, cache)
+            if university is None:
+                logger.warning(f"No university name found for '{name}', keeping raw name")
+            else:
+                game[key] = university
+        games.append(game)
     
-    llm = get_llm()
-    parser = PydanticOutputParser(pydantic_object=SpreadGamesOutput)
+    return construct_output(output_model, data, games)
+
+
+def construct_output(output_model: type[BaseModel], data: Dict[str, Any], games: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Shape a converted file like output_model without re-validating it.
     
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        data=json.dumps(data, indent=2),
-        format_instructions=parser.get_format_instructions()
-    )
+    The games were produced by our own scrapers (already validated there), so
+    model_construct only filters the fields instead of re-checking every value.
     
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=user_prompt)
-    ]
+    Args:
+        output_model: Output model for the file type
+        data: Loaded games file (top-level fields)
+        games: Converted game dictionaries
+        
+    Returns:
+        Converted file contents
+    """
+    game_model = GAME_MODELS[output_model]
+    return output_model.model_construct(
+        **{**data, "games": [game_model.model_construct(**game) for game in games]}
+    ).model_dump()
+
+
+async def process_games_file(
+    file_path: str,
+    output_model: type[BaseModel],
+    llm: Optional[ChatOpenAI] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    cache: Optional[TeamNameCache] = None
+) -> Dict[str, Any]:
+    """
+    Convert one JSON file on its own, only sending uncached team names to the LLM.
     
-    response = llm.invoke(messages)
-    result = parser.parse(response.content)
+    process_team_names() does not go through here: it loads every file once and
+    resolves their names together before rebuilding each file from the cache.
+    
+    Args:
+        file_path: Path to the scraped JSON file
+        output_model: Pydantic model the converted file must satisfy
+        llm: Shared LLM instance (created if needed)
+        semaphore: Shared request limiter (created if needed)
+        cache: Team name cache (in-memory only if not provided)
+        
+    Returns:
+        Converted file contents
+    """
+    logger.info(f"Processing {file_path}")
     
-    return result.model_dump()
+    cache = cache if cache is not None else TeamNameCache()
+    # File reads happen off the event loop
+    data = await asyncio.to_thread(load_data, file_path)
+    
+    await resolve_uncached_names([data], cache, llm, semaphore)
+    return apply_cached_names(data, output_model, cache)
+
+
+async def process_sheets_games(file_path: str) -> Dict[str, Any]:
+    """Process sheets_games.json file."""
+    return await process_games_file(file_path, SheetsGamesOutput)
+
+
+async def process_prediction_games(file_path: str) -> Dict[str, Any]:
+    """Process dimers_games.json and oddshark_games.json files."""
+    return await process_games_file(file_path, PredictionGamesOutput)
+
+
+async def process_spread_games(file_path: str) -> Dict[str, Any]:
+    """Process espn_games.json and dratings_games.json files."""
+    return await process_games_file(file_path, SpreadGamesOutput)
+
+
+def save_result(output_file: str, result: Dict[str, Any]) -> None:
+    """Save a converted result, creating the output directory if needed."""
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    
+    json_io.dump_json(output_file, result)
+    
+    logger.info(f"Successfully saved {output_file}")
 
 
 def process_single_file(
     input_file: str, 
     output_file: str, 
-    processor_func: Callable
+    output_model: type[BaseModel],
+    data: Dict[str, Any],
+    cache: TeamNameCache
 ) -> tuple[str, str, bool, str]:
-    """Process a single file and return the result."""
+    """Rebuild a single loaded file from the team name cache, save it and return the result."""
     try:
         logger.info(f"Processing {input_file}...")
         
         # Process the file
-        result = processor_func(input_file)
-        
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        result = apply_cached_names(data, output_model, cache)
         
         # Save the result
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
-        
-        logger.info(f"Successfully saved {output_file}")
+        save_result(output_file, result)
         return (input_file, output_file, True, "")
         
     except Exception as e:
@@ -229,45 +416,153 @@ def process_single_file(
         return (input_file, output_file, False, str(e))
 
 
-def process_team_names(config=None):
-    """Process all NCAAF JSON files to convert team names to university names."""
+def process_files_live(
+    files_to_process: list[tuple],
+    cache: Optional[TeamNameCache] = None,
+    openai_api_key: Optional[str] = None
+) -> list[tuple[str, str, bool, str]]:
+    """
+    Process loaded files with concurrent live LLM requests for uncached team names.
+    
+    Args:
+        files_to_process: List of (input_file, output_file, output_model, data) tuples
+        cache: Team name cache, updated in place
+        openai_api_key: OpenAI API key (read from the environment if not provided)
+        
+    Returns:
+        Result tuple for every file
+    """
+    cache = cache if cache is not None else TeamNameCache()
+    
+    # Resolve uncached names across all files first so each is requested once,
+    # running all LLM requests concurrently on one event loop
+    asyncio.run(resolve_uncached_names(
+        [data for _, _, _, data in files_to_process], cache, openai_api_key=openai_api_key
+    ))
+    
+    return [
+        process_single_file(input_file, output_file, output_model, data, cache)
+        for input_file, output_file, output_model, data in files_to_process
+    ]
+
+
+def resolve_uncached_names_batch(
+    datas: list[Dict[str, Any]],
+    cache: TeamNameCache,
+    config: Config
+) -> None:
+    """
+    Convert every name missing from the cache through the OpenAI Batch API.
+    
+    Each uncached game becomes its own small request, matched back to its game
+    by custom_id, so the cache never depends on the model keeping games in order.
+    Names the batch does not return stay uncached for the live path.
+    
+    Args:
+        datas: Loaded games files
+        cache: Team name cache, updated in place
+        config: Application configuration
+    """
+    games = find_uncached_games(datas, cache)
+    if not games:
+        return
+    
+    client = OpenAI(api_key=config.openai_api_key)
+    requests = [
+        build_chat_request(
+            str(index),
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_game_prompt(game)}
+            ],
+            response_format=json_schema_response_format(TeamPairConverted)
+        )
+        for index, game in enumerate(games)
+    ]
+    
+    batch_id = submit_batch(client, requests)
+    try:
+        outputs = wait_for_batch(client, batch_id, poll_interval=BATCH_POLL_INTERVAL, timeout=BATCH_WAIT_TIMEOUT)
+    except TimeoutError as e:
+        logger.warning(f"{e}; falling back to live requests")
+        cancel_batch(client, batch_id)
+        return
+    
+    for custom_id, content in outputs.items():
+        game = games[int(custom_id)]
+        try:
+            pair = TeamPairConverted.model_validate_json(content)
+        except ValidationError as e:
+            # Left uncached, so the live path retries this game
+            logger.error(f"Invalid batch output for {game.get('away_team')} vs {game.get('home_team')}: {e}")
+            continue
+        for key in ('away_team', 'home_team'):
+            cache.put(game.get(key, ''), getattr(pair, key))
+
+
+def process_team_names(config=None, use_batch_api=None):
+    """
+    Process all NCAAF JSON files to convert team names to university names.
+    
+    Args:
+        config: Application configuration (loads from env if not provided)
+        use_batch_api: Submit the uncached games as one OpenAI Batch API job
+            before any live requests (defaults to config.use_batch_api)
+    """
     if config is None:
         config = Config.from_env()
+    if use_batch_api is None:
+        use_batch_api = config.use_batch_api
     league = "ncaaf"
     
     files_to_process = [
         (config.get_games_scraped_path("sheets_games.json", league=league), 
          config.get_llm_university_path("sheets_games_llm.json"), 
-         process_sheets_games),
+         SheetsGamesOutput),
         (config.get_games_scraped_path("dimers_games.json", league=league), 
          config.get_llm_university_path("dimers_games_llm.json"), 
-         process_prediction_games),
+         PredictionGamesOutput),
         (config.get_games_scraped_path("oddshark_games.json", league=league), 
          config.get_llm_university_path("oddshark_games_llm.json"), 
-         process_prediction_games),
+         PredictionGamesOutput),
         (config.get_games_scraped_path("espn_games.json", league=league), 
          config.get_llm_university_path("espn_games_llm.json"), 
-         process_spread_games),
+         SpreadGamesOutput),
         (config.get_games_scraped_path("dratings_games.json", league=league), 
          config.get_llm_university_path("dratings_games_llm.json"), 
-         process_spread_games)
+         SpreadGamesOutput)
     ]
     
-    logger.info("Starting concurrent processing of all files...")
+    cache = TeamNameCache(config.get_data_path(UNIVERSITY_CACHE_FILE, league=league)).load()
     
-    # Use ThreadPoolExecutor to process files concurrently
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all tasks
-        future_to_file = {
-            executor.submit(process_single_file, input_file, output_file, processor_func): input_file
-            for input_file, output_file, processor_func in files_to_process
-        }
-        
-        # Collect results as they complete
-        results = []
-        for future in as_completed(future_to_file):
-            result = future.result()
-            results.append(result)
+    # Load every file once; the batch and live paths work from these copies
+    results = []
+    loaded_files = []
+    for input_file, output_file, output_model in files_to_process:
+        try:
+            loaded_files.append((input_file, output_file, output_model, load_data(input_file)))
+        except Exception as e:
+            error_msg = f"Error processing {input_file}: {str(e)}"
+            logger.error(error_msg)
+            results.append((input_file, output_file, False, str(e)))
+    
+    # Skip the LLM entirely when every team name is already cached
+    has_uncached = bool(find_uncached_games([data for _, _, _, data in loaded_files], cache))
+    if not has_uncached:
+        logger.info("All team names found in cache, skipping LLM")
+    
+    if use_batch_api and has_uncached:
+        logger.info("Submitting uncached games to the OpenAI Batch API...")
+        try:
+            resolve_uncached_names_batch([data for _, _, _, data in loaded_files], cache, config)
+        except Exception as e:
+            logger.error(f"Batch processing failed: {e}; falling back to live requests")
+    
+    # Interactive runs (and any names the batch could not resolve) use live requests,
+    # then every file is rebuilt locally from the cache
+    logger.info(f"Starting concurrent processing of {len(loaded_files)} files...")
+    results.extend(process_files_live(loaded_files, cache, config.openai_api_key))
+    cache.save()
     
     # Print summary
     print("\n" + "="*50)
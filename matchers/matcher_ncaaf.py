@@ -1,18 +1,29 @@
 """Match games across multiple data sources."""
 
-import json
+import functools
 import os
+import re
 import sys
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 
-from fuzzywuzzy import fuzz
+# Add project root to Python path (once, even if several modules run this)
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from rapidfuzz import fuzz, process, utils as fuzz_utils
 from utils import Config, get_logger
+from utils import json_io
 
 logger = get_logger(__name__)
 
+# Below this many sheet x source game pairs, sources are matched one after another
+# (thread startup costs more than the scoring itself)
+PARALLEL_MATCH_MIN_PAIRS = 10_000
+
 
 class GameMatcher:
     """Match games across multiple prediction sources."""
@@ -32,6 +43,22 @@ class GameMatcher:
         "Storrs", "Kennesaw", "Lubbock"
     ]
     
+    # Any campus keyword as a whole word (longest first), "University at" prefix, and " at " delimiter
+    _CAMPUS_RE = re.compile(
+        r'\s+(?:' + '|'.join(re.escape(k) for k in sorted(CAMPUS_KEYWORDS, key=len, reverse=True)) + r')(?=\s|$)'
+    )
+    _UNIV_AT_RE = re.compile(r'^university at ', re.IGNORECASE)
+    _AT_RE = re.compile(r' at ', re.IGNORECASE)
+    
+    # (attribute, LLM-processed file, scraped fallback file) for every data source
+    DATA_FILES = (
+        ('sheets_data', 'sheets_games_llm.json', 'sheets_games.json'),
+        ('dimers_data', 'dimers_games_llm.json', 'dimers_games.json'),
+        ('oddshark_data', 'oddshark_games_llm.json', 'oddshark_games.json'),
+        ('espn_data', 'espn_games_llm.json', 'espn_games.json'),
+        ('dratings_data', 'dratings_games_llm.json', 'dratings_games.json')
+    )
+    
     def __init__(self, config: Optional[Config] = None, fuzzy_threshold: int = 85):
         """
         Initialize game matcher.
@@ -47,12 +74,19 @@ class GameMatcher:
         self.oddshark_data: Optional[Dict] = None
         self.espn_data: Optional[Dict] = None
         self.dratings_data: Optional[Dict] = None
+        self.normalize_team_name.cache_clear()
         logger.info(f"GameMatcher initialized with fuzzy_threshold={fuzzy_threshold}")
     
-    def normalize_team_name(self, team_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def normalize_team_name(team_name: str) -> str:
         """
         Normalize a university name by removing campus identifiers.
         
+        Results are memoized: the same names recur across every source and sheet row.
+        They are also interned, so names that normalize alike share one string object
+        and index lookups compare by identity.
+        
         Args:
             team_name: Team name to normalize
             
@@ -62,29 +96,19 @@ class GameMatcher:
         if not team_name:
             return team_name
         
-        name = team_name.strip()
-        
         # Replace "University at" → "University of"
-        if name.lower().startswith("university at "):
-            name = "University of " + name[14:]
+        name = GameMatcher._UNIV_AT_RE.sub('University of ', team_name.strip())
         
         # Remove everything after a comma
-        if ',' in name:
-            name = name.split(',')[0]
+        name = name.split(',', 1)[0]
         
         # Remove everything after ' at ' (if used as delimiter)
-        if ' at ' in name.lower():
-            at_pos = name.lower().find(' at ')
-            name = name[:at_pos]
+        name = GameMatcher._AT_RE.split(name, 1)[0]
         
         # Remove known campus identifiers
-        for keyword in self.CAMPUS_KEYWORDS:
-            if name.endswith(" " + keyword):
-                name = name[: -len(keyword) - 1]
-            elif f" {keyword} " in name:
-                name = name.replace(f" {keyword} ", " ")
+        name = GameMatcher._CAMPUS_RE.sub(' ', name)
         
-        return name.strip()
+        return sys.intern(' '.join(name.split()))
     
     def load_json_file(self, file_path: str) -> Dict:
         """Load JSON data from file."""
@@ -93,43 +117,37 @@ class GameMatcher:
             return {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                if not isinstance(data, dict):
-                    logger.warning(f"Invalid data structure in {file_path}")
-                    return {}
-                return data
-        except json.JSONDecodeError as e:
+            data = json_io.load_json(file_path)
+            if not isinstance(data, dict):
+                logger.warning(f"Invalid data structure in {file_path}")
+                return {}
+            return data
+        except json_io.JSONDecodeError as e:
             logger.error(f"Invalid JSON in file {file_path}: {e}")
             return {}
         except Exception as e:
             logger.error(f"Error loading file {file_path}: {e}")
             return {}
     
-    def find_matching_game(
-        self, 
-        away_team: str, 
-        home_team: str, 
-        games_list: List[Dict]
-    ) -> Optional[Dict]:
+    def build_source_index(self, games_list: List[Dict]) -> Tuple[Dict, List[str], List[str], List[Dict]]:
         """
-        Find a matching game using normalization and fuzzy matching.
+        Normalize every game of a source once for repeated matching.
         
         Args:
-            away_team: Away team name to match
-            home_team: Home team name to match
-            games_list: List of games to search
+            games_list: List of games from one source
             
         Returns:
-            Matching game dict or None
+            Tuple of (exact index mapping (normalized_away, normalized_home) to the
+            first such game, normalized away names, normalized home names, games),
+            the last three aligned by position for the fuzzy fallback
         """
+        exact_index = {}
+        away_choices = []
+        home_choices = []
+        games = []
         if not games_list or not isinstance(games_list, list):
-            return None
-        
-        normalized_away = self.normalize_team_name(away_team)
-        normalized_home = self.normalize_team_name(home_team)
+            return exact_index, away_choices, home_choices, games
         
-        # Try exact match first
         for game in games_list:
             if not isinstance(game, dict):
                 continue
@@ -140,57 +158,179 @@ class GameMatcher:
             try:
                 game_away = self.normalize_team_name(game['away_team'])
                 game_home = self.normalize_team_name(game['home_team'])
-                
-                if normalized_away == game_away and normalized_home == game_home:
-                    return game
             except Exception as e:
                 logger.debug(f"Error processing game: {e}")
                 continue
+            
+            exact_index.setdefault((game_away, game_home), game)
+            away_choices.append(game_away)
+            home_choices.append(game_home)
+            games.append(game)
         
-        # Fallback: fuzzy matching
-        for game in games_list:
-            if not isinstance(game, dict):
-                continue
-            if 'away_team' not in game or 'home_team' not in game:
-                continue
+        return exact_index, away_choices, home_choices, games
+    
+    def match_in_index(
+        self,
+        normalized_away: str,
+        normalized_home: str,
+        source_index: Tuple[Dict, List[str], List[str], List[Dict]]
+    ) -> Optional[Dict]:
+        """
+        Find a matching game in a source index built by build_source_index().
+        
+        Args:
+            normalized_away: Normalized away team name to match
+            normalized_home: Normalized home team name to match
+            source_index: Index of one source
             
-            try:
-                game_away = self.normalize_team_name(game['away_team'])
-                game_home = self.normalize_team_name(game['home_team'])
-                
-                if (fuzz.token_set_ratio(normalized_away, game_away) >= self.fuzzy_threshold and
-                    fuzz.token_set_ratio(normalized_home, game_home) >= self.fuzzy_threshold):
-                    return game
-            except Exception as e:
-                logger.debug(f"Error in fuzzy matching: {e}")
-                continue
+        Returns:
+            Matching game dict or None
+        """
+        exact_index, away_choices, home_choices, games = source_index
+        
+        # Try exact match first
+        game = exact_index.get((normalized_away, normalized_home))
+        if game is not None:
+            return game
+        
+        # Fallback: fuzzy matching. Score the away side against the whole source at once,
+        # then the home side only for away hits; the first game (in source order) passing
+        # on both sides wins.
+        try:
+            away_hits = process.extract(
+                normalized_away, away_choices,
+                scorer=fuzz.token_set_ratio, processor=fuzz_utils.default_process,
+                score_cutoff=self.fuzzy_threshold, limit=None
+            )
+            for index in sorted(index for _, _, index in away_hits):
+                home_score = fuzz.token_set_ratio(
+                    normalized_home, home_choices[index],
+                    processor=fuzz_utils.default_process, score_cutoff=self.fuzzy_threshold
+                )
+                if home_score >= self.fuzzy_threshold:
+                    return games[index]
+        except Exception as e:
+            logger.debug(f"Error in fuzzy matching: {e}")
         
-        logger.debug(f"No match found for {away_team} @ {home_team}")
+        logger.debug(f"No match found for {normalized_away} @ {normalized_home}")
         return None
     
-    def load_all_data(self):
-        """Load all JSON files from games_scraped/ and llm_university/, preferring LLM-processed versions."""
-        # Load sheets data - try LLM processed version first, fallback to regular
-        self.sheets_data = self.load_json_file(self.config.get_llm_university_path('sheets_games_llm.json'))
-        if not self.sheets_data or not self.sheets_data.get('games'):
-            self.sheets_data = self.load_json_file(self.config.get_games_scraped_path('sheets_games.json', league="ncaaf"))
+    def match_source(
+        self,
+        sheet_pairs: List[Tuple[str, str]],
+        source_index: Tuple[Dict, List[str], List[str], List[Dict]],
+        workers: int = -1
+    ) -> List[Optional[Dict]]:
+        """
+        Match every sheet game against one source in bulk.
         
-        # Load all scraper outputs - try LLM processed versions first (from llm_university), fallback to scraped versions
-        self.dimers_data = self.load_json_file(self.config.get_llm_university_path('dimers_games_llm.json'))
-        if not self.dimers_data or not self.dimers_data.get('games'):
-            self.dimers_data = self.load_json_file(self.config.get_games_scraped_path('dimers_games.json', league="ncaaf"))
+        Rows without an exact match are fuzzy-scored against the whole source in two
+        rapidfuzz cdist calls, giving the same result as match_in_index() row by row.
+        Home names are only scored against games that some row matched on the away side.
+        
+        Args:
+            sheet_pairs: List of (normalized_away, normalized_home) sheet games
+            source_index: Index of one source
+            workers: Threads used by each cdist call (-1 for all cores)
+            
+        Returns:
+            Matching game dict or None for each sheet game, in order
+        """
+        exact_index, away_choices, home_choices, games = source_index
+        matches = [exact_index.get(pair) for pair in sheet_pairs]
         
-        self.oddshark_data = self.load_json_file(self.config.get_llm_university_path('oddshark_games_llm.json'))
-        if not self.oddshark_data or not self.oddshark_data.get('games'):
-            self.oddshark_data = self.load_json_file(self.config.get_games_scraped_path('oddshark_games.json', league="ncaaf"))
+        pending = [row for row, match in enumerate(matches) if match is None]
+        if not pending or not games:
+            return matches
         
-        self.espn_data = self.load_json_file(self.config.get_llm_university_path('espn_games_llm.json'))
-        if not self.espn_data or not self.espn_data.get('games'):
-            self.espn_data = self.load_json_file(self.config.get_games_scraped_path('espn_games.json', league="ncaaf"))
+        scoring = dict(
+            scorer=fuzz.token_set_ratio,
+            processor=fuzz_utils.default_process,
+            score_cutoff=self.fuzzy_threshold,
+            dtype=np.uint8,
+            workers=workers
+        )
+        try:
+            away_scores = process.cdist([sheet_pairs[row][0] for row in pending], away_choices, **scoring)
+            away_passing = away_scores >= self.fuzzy_threshold
+            columns = np.flatnonzero(away_passing.any(axis=0))
+            if not columns.size:
+                return matches
+            home_scores = process.cdist(
+                [sheet_pairs[row][1] for row in pending],
+                [home_choices[column] for column in columns],
+                **scoring
+            )
+        except Exception as e:
+            logger.debug(f"Error in fuzzy matching: {e}")
+            return matches
         
-        self.dratings_data = self.load_json_file(self.config.get_llm_university_path('dratings_games_llm.json'))
-        if not self.dratings_data or not self.dratings_data.get('games'):
-            self.dratings_data = self.load_json_file(self.config.get_games_scraped_path('dratings_games.json', league="ncaaf"))
+        # The first game (in source order) passing on both sides wins
+        passing = away_passing[:, columns] & (home_scores >= self.fuzzy_threshold)
+        first_passing = passing.argmax(axis=1)
+        for row, has_match, index in zip(pending, passing.any(axis=1), first_passing):
+            if has_match:
+                matches[row] = games[columns[index]]
+        
+        return matches
+    
+    def find_matching_game(
+        self, 
+        away_team: str, 
+        home_team: str, 
+        games_list: List[Dict]
+    ) -> Optional[Dict]:
+        """
+        Find a matching game using normalization and fuzzy matching.
+        
+        Args:
+            away_team: Away team name to match
+            home_team: Home team name to match
+            games_list: List of games to search
+            
+        Returns:
+            Matching game dict or None
+        """
+        # Fast path: LLM-converted names are usually identical across files
+        if isinstance(games_list, list):
+            for game in games_list:
+                if (isinstance(game, dict) and game.get('away_team') == away_team
+                        and game.get('home_team') == home_team):
+                    return game
+        
+        return self.match_in_index(
+            self.normalize_team_name(away_team),
+            self.normalize_team_name(home_team),
+            self.build_source_index(games_list)
+        )
+    
+    def load_all_data(self):
+        """Load all JSON files from games_scraped/ and llm_university/, preferring LLM-processed versions."""
+        # Try LLM processed versions first (from llm_university), fallback to scraped versions.
+        # Each round reads its files concurrently; fallbacks are only read where needed.
+        with ThreadPoolExecutor(max_workers=len(self.DATA_FILES)) as executor:
+            loaded = dict(zip(
+                (attr for attr, _, _ in self.DATA_FILES),
+                executor.map(
+                    self.load_json_file,
+                    [self.config.get_llm_university_path(llm_file) for _, llm_file, _ in self.DATA_FILES]
+                )
+            ))
+            
+            fallbacks = [
+                (attr, scraped_file) for attr, _, scraped_file in self.DATA_FILES
+                if not loaded[attr] or not loaded[attr].get('games')
+            ]
+            loaded.update(zip(
+                (attr for attr, _ in fallbacks),
+                executor.map(
+                    self.load_json_file,
+                    [self.config.get_games_scraped_path(scraped_file, league="ncaaf") for _, scraped_file in fallbacks]
+                )
+            ))
+        
+        for attr, data in loaded.items():
+            setattr(self, attr, data)
         
         logger.info("All data files loaded")
     
@@ -213,14 +353,20 @@ class GameMatcher:
             "matched_sheets_rows": {}
         }
         
-        # Prepare source data
+        # Prepare source data, normalizing every source game once
         sources = {
             'dimers': self.dimers_data.get('games', []) if self.dimers_data else [],
             'oddshark': self.oddshark_data.get('games', []) if self.oddshark_data else [],
             'espn': self.espn_data.get('games', []) if self.espn_data else [],
             'dratings': self.dratings_data.get('games', []) if self.dratings_data else []
         }
+        source_indexes = {
+            source_name: self.build_source_index(games_list)
+            for source_name, games_list in sources.items()
+        }
         
+        # Validate and normalize sheet games
+        sheet_rows = []
         for sheet_game in self.sheets_data['games']:
             if not isinstance(sheet_game, dict):
                 logger.warning(f"Invalid sheet game format: {sheet_game}")
@@ -231,38 +377,53 @@ class GameMatcher:
                 continue
             
             try:
-                away_team = sheet_game['away_team']
-                home_team = sheet_game['home_team']
                 row_number = str(sheet_game['row_number'])
-                
-                normalized_away = self.normalize_team_name(away_team)
-                normalized_home = self.normalize_team_name(home_team)
-                
-                matched_game = {
-                    "sheets": {
-                        "away_team": normalized_away, 
-                        "home_team": normalized_home
-                    }
-                }
-                
-                for source_name, games_list in sources.items():
-                    match = self.find_matching_game(away_team, home_team, games_list)
-                    if match:
-                        try:
-                            normalized_match = match.copy()
-                            normalized_match['away_team'] = self.normalize_team_name(match.get('away_team', ''))
-                            normalized_match['home_team'] = self.normalize_team_name(match.get('home_team', ''))
-                            matched_game[source_name] = normalized_match
-                            results[f"{source_name}_matched"] += 1
-                        except Exception as e:
-                            logger.warning(f"Error normalizing match from {source_name}: {e}")
-                
-                results["matched_sheets_rows"][row_number] = matched_game
-            
+                normalized_away = self.normalize_team_name(sheet_game['away_team'])
+                normalized_home = self.normalize_team_name(sheet_game['home_team'])
+                sheet_rows.append((row_number, (normalized_away, normalized_home)))
             except Exception as e:
                 logger.error(f"Error processing sheet game: {e}")
                 continue
         
+        # Match all sheet games against each source at once; large workloads score
+        # the sources on parallel threads (rapidfuzz releases the GIL while scoring)
+        sheet_pairs = [pair for _, pair in sheet_rows]
+        total_pairs = len(sheet_pairs) * sum(len(games_list) for games_list in sources.values())
+        if total_pairs < PARALLEL_MATCH_MIN_PAIRS:
+            source_matches = {
+                source_name: self.match_source(sheet_pairs, source_index)
+                for source_name, source_index in source_indexes.items()
+            }
+        else:
+            with ThreadPoolExecutor(max_workers=len(source_indexes)) as executor:
+                futures = {
+                    source_name: executor.submit(self.match_source, sheet_pairs, source_index, 1)
+                    for source_name, source_index in source_indexes.items()
+                }
+                source_matches = {source_name: future.result() for source_name, future in futures.items()}
+        
+        for position, (row_number, (normalized_away, normalized_home)) in enumerate(sheet_rows):
+            matched_game = {
+                "sheets": {
+                    "away_team": normalized_away, 
+                    "home_team": normalized_home
+                }
+            }
+            
+            for source_name, matches in source_matches.items():
+                match = matches[position]
+                if match:
+                    try:
+                        normalized_match = match.copy()
+                        normalized_match['away_team'] = self.normalize_team_name(match.get('away_team', ''))
+                        normalized_match['home_team'] = self.normalize_team_name(match.get('home_team', ''))
+                        matched_game[source_name] = normalized_match
+                        results[f"{source_name}_matched"] += 1
+                    except Exception as e:
+                        logger.warning(f"Error normalizing match from {source_name}: {e}")
+            
+            results["matched_sheets_rows"][row_number] = matched_game
+        
         logger.info(f"Matching complete: {results['dimers_matched']} Dimers, "
                    f"{results['oddshark_matched']} OddShark, "
                    f"{results['espn_matched']} ESPN, "
@@ -275,8 +436,7 @@ class GameMatcher:
         try:
             output_path = self.config.get_data_path(output_file, league="ncaaf")
             
-            with open(output_path, 'w', encoding='utf-8') as file:
-                json.dump(results, file, indent=2, ensure_ascii=False)
+            json_io.dump_json(output_path, results)
             
             logger.info(f"Results saved to {output_path}")
         except Exception as e:
@@ -1,22 +1,49 @@
 """Match NFL games across multiple data sources using simplified mascot name matching."""
 
-import json
+import functools
 import os
 import sys
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 
-from fuzzywuzzy import fuzz
-from utils import Config, get_logger
+# Add project root to Python path (once, even if several modules run this)
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from rapidfuzz import fuzz, process
+from utils import Config, get_logger, NFL_MASCOTS
+from utils import json_io
+from utils.nfl_teams import NFL_TEAMS
 
 logger = get_logger(__name__)
 
+# Lowercase mascots for the "City Mascot" check in normalize_team_name
+MASCOT_KEYS = frozenset(mascot.lower() for mascot in NFL_MASCOTS)
+
+# Normalized form of the spellings sources use most ("Raiders", "raiders",
+# "Las Vegas Raiders"), resolved without parsing
+NORMALIZED_NAMES = {
+    spelling: mascot.lower()
+    for city, mascot, _ in NFL_TEAMS
+    for spelling in (mascot, mascot.lower(), f"{city} {mascot}")
+}
+
 
 class NFLGameMatcher:
     """Match NFL games across multiple prediction sources using mascot names."""
     
+    # Prediction sources, in matching and reporting order
+    SOURCES = ('fantasynerds', 'sportsline', 'florio', 'simms', 'dimers', 'oddshark', 'espn', 'dratings')
+    
+    # (attribute, LLM-processed file, scraped fallback file) for the sheet and every source
+    DATA_FILES = tuple(
+        (f'{name}_data', f'{name}_games_llm.json', f'{name}_games.json')
+        for name in ('sheets',) + SOURCES
+    )
+    
     def __init__(self, config: Optional[Config] = None, fuzzy_threshold: int = 80):
         """
         Initialize NFL game matcher.
@@ -36,12 +63,25 @@ class NFLGameMatcher:
         self.oddshark_data: Optional[Dict] = None
         self.espn_data: Optional[Dict] = None
         self.dratings_data: Optional[Dict] = None
+        # (LLM-processed path, scraped fallback path) per data attribute, resolved once
+        self.data_paths = {
+            attr: (
+                self.config.get_llm_mascot_path(llm_file),
+                self.config.get_games_scraped_path(scraped_file, league="nfl")
+            )
+            for attr, llm_file, scraped_file in self.DATA_FILES
+        }
+        self.normalize_team_name.cache_clear()
         logger.info(f"NFLGameMatcher initialized with fuzzy_threshold={fuzzy_threshold}")
     
-    def normalize_team_name(self, team_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def normalize_team_name(team_name: str) -> str:
         """
         Normalize an NFL team name to mascot (simplified - just lowercase and strip).
         
+        Results are memoized: the same 32 teams recur across every source and sheet row.
+        
         Args:
             team_name: Team name to normalize (should already be mascot)
             
@@ -51,6 +91,10 @@ class NFLGameMatcher:
         if not team_name:
             return team_name
         
+        normalized = NORMALIZED_NAMES.get(team_name)
+        if normalized is not None:
+            return normalized
+        
         name = team_name.strip()
         
         # For NFL, names should already be mascots, but handle common variations
@@ -61,19 +105,14 @@ class NFLGameMatcher:
         if ' ' in name:
             # Common patterns: "New England Patriots" -> "Patriots"
             # But most should already be just "Patriots"
-            parts = name.split()
+            # Only the last word matters; every mascot is a single word, so this is
+            # the whole-word suffix match (no need to split the rest of the name)
+            parts = name.rsplit(None, 1)
             # If last word looks like a mascot (capitalized, common team name)
             if len(parts) > 1:
                 last_word = parts[-1]
                 # Check if last word is a common NFL team name
-                nfl_teams = [
-                    'Raiders', 'Ravens', 'Bills', 'Bengals', 'Browns', 'Broncos', 'Texans',
-                    'Colts', 'Jaguars', 'Chiefs', 'Chargers', 'Dolphins', 'Patriots', 'Jets',
-                    'Steelers', 'Titans', 'Cowboys', 'Giants', 'Eagles', 'Commanders',
-                    'Bears', 'Lions', 'Packers', 'Vikings', 'Falcons', 'Panthers', 'Saints',
-                    'Buccaneers', 'Cardinals', 'Rams', '49ers', 'Seahawks'
-                ]
-                if any(team.lower() == last_word.lower() for team in nfl_teams):
+                if last_word.lower() in MASCOT_KEYS:
                     name = last_word
         
         return name.lower().strip()
@@ -85,155 +124,213 @@ class NFLGameMatcher:
             return {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                if not isinstance(data, dict):
-                    logger.warning(f"Invalid data structure in {file_path}")
-                    return {}
-                return data
-        except json.JSONDecodeError as e:
+            data = json_io.load_json(file_path)
+            if not isinstance(data, dict):
+                logger.warning(f"Invalid data structure in {file_path}")
+                return {}
+            return data
+        except json_io.JSONDecodeError as e:
             logger.error(f"Invalid JSON in file {file_path}: {e}")
             return {}
         except Exception as e:
             logger.error(f"Error loading file {file_path}: {e}")
             return {}
     
-    def find_matching_game(
-        self, 
-        away_team: str, 
-        home_team: str, 
-        games_list: List[Dict]
-    ) -> Optional[Dict]:
+    @staticmethod
+    def reverse_game(game: Dict) -> Dict:
         """
-        Find a matching game using simplified normalization and fuzzy matching.
+        Copy a game with away/home teams, scores and spreads swapped.
         
         Args:
-            away_team: Away team name to match
-            home_team: Home team name to match
-            games_list: List of games to search
+            game: Game whose source listed the teams the other way round
             
         Returns:
-            Matching game dict or None
+            Reversed copy of the game
         """
-        if not games_list or not isinstance(games_list, list):
-            return None
+        reversed_game = game.copy()
+        reversed_game['away_team'], reversed_game['home_team'] = reversed_game['home_team'], reversed_game['away_team']
+        # Swap scores if present
+        if 'predicted_score_away' in reversed_game and 'predicted_score_home' in reversed_game:
+            reversed_game['predicted_score_away'], reversed_game['predicted_score_home'] = reversed_game['predicted_score_home'], reversed_game['predicted_score_away']
+        # Swap spreads if present
+        if 'spread_away' in reversed_game and 'spread_home' in reversed_game:
+            reversed_game['spread_away'], reversed_game['spread_home'] = reversed_game['spread_home'], reversed_game['spread_away']
+        return reversed_game
+    
+    def build_source_index(self, games_list: List[Dict]) -> Tuple[Dict, Dict, List[str], List[str], List[Dict]]:
+        """
+        Normalize every game of a source once for repeated matching.
         
-        normalized_away = self.normalize_team_name(away_team)
-        normalized_home = self.normalize_team_name(home_team)
+        Args:
+            games_list: List of games from one source
+            
+        Returns:
+            Tuple of (forward index mapping (normalized_away, normalized_home) to the
+            position of the first such game, reverse index keyed (home, away), normalized
+            away names, normalized home names, games), the last three aligned by position
+        """
+        forward_index = {}
+        reverse_index = {}
+        away_choices = []
+        home_choices = []
+        games = []
+        if not games_list or not isinstance(games_list, list):
+            return forward_index, reverse_index, away_choices, home_choices, games
         
-        # Try exact match first
+        # Validate up front so matching can assume well-formed string team names
         for game in games_list:
             if not isinstance(game, dict):
                 continue
             if 'away_team' not in game or 'home_team' not in game:
                 logger.debug(f"Game missing team keys: {game}")
                 continue
-            
-            try:
-                game_away = self.normalize_team_name(game['away_team'])
-                game_home = self.normalize_team_name(game['home_team'])
-                
-                # Try both orderings (away/home and home/away)
-                if (normalized_away == game_away and normalized_home == game_home):
-                    return game
-                # Also try reversed (in case source has them flipped)
-                elif (normalized_away == game_home and normalized_home == game_away):
-                    # Swap scores if reversed
-                    reversed_game = game.copy()
-                    reversed_game['away_team'], reversed_game['home_team'] = reversed_game['home_team'], reversed_game['away_team']
-                    # Swap scores if present
-                    if 'predicted_score_away' in reversed_game and 'predicted_score_home' in reversed_game:
-                        reversed_game['predicted_score_away'], reversed_game['predicted_score_home'] = reversed_game['predicted_score_home'], reversed_game['predicted_score_away']
-                    # Swap spreads if present
-                    if 'spread_away' in reversed_game and 'spread_home' in reversed_game:
-                        reversed_game['spread_away'], reversed_game['spread_home'] = reversed_game['spread_home'], reversed_game['spread_away']
-                    return reversed_game
-            except Exception as e:
-                logger.debug(f"Error processing game: {e}")
+            if not isinstance(game['away_team'], str) or not isinstance(game['home_team'], str):
+                logger.debug(f"Game has non-string team names: {game}")
                 continue
+            
+            game_away = self.normalize_team_name(game['away_team'])
+            game_home = self.normalize_team_name(game['home_team'])
+            
+            forward_index.setdefault((game_away, game_home), len(games))
+            reverse_index.setdefault((game_home, game_away), len(games))
+            away_choices.append(game_away)
+            home_choices.append(game_home)
+            games.append(game)
         
-        # Fallback: fuzzy matching
-        best_match = None
-        best_score = 0
+        return forward_index, reverse_index, away_choices, home_choices, games
+    
+    def match_source(
+        self,
+        sheet_pairs: List[Tuple[str, str]],
+        source_index: Tuple[Dict, Dict, List[str], List[str], List[Dict]]
+    ) -> List[Optional[Tuple[Dict, bool]]]:
+        """
+        Match every sheet game against one source in bulk.
         
-        for game in games_list:
-            if not isinstance(game, dict):
-                continue
-            if 'away_team' not in game or 'home_team' not in game:
-                continue
-            
-            try:
-                game_away = self.normalize_team_name(game['away_team'])
-                game_home = self.normalize_team_name(game['home_team'])
-                
-                # Calculate match scores for both orderings
-                score1 = (fuzz.ratio(normalized_away, game_away) + 
-                         fuzz.ratio(normalized_home, game_home)) / 2
-                score2 = (fuzz.ratio(normalized_away, game_home) + 
-                         fuzz.ratio(normalized_home, game_away)) / 2
-                
-                if score1 >= self.fuzzy_threshold and score1 > best_score:
-                    best_match = game
-                    best_score = score1
-                elif score2 >= self.fuzzy_threshold and score2 > best_score:
-                    # Swap if reversed
-                    reversed_game = game.copy()
-                    reversed_game['away_team'], reversed_game['home_team'] = reversed_game['home_team'], reversed_game['away_team']
-                    if 'predicted_score_away' in reversed_game and 'predicted_score_home' in reversed_game:
-                        reversed_game['predicted_score_away'], reversed_game['predicted_score_home'] = reversed_game['predicted_score_home'], reversed_game['predicted_score_away']
-                    if 'spread_away' in reversed_game and 'spread_home' in reversed_game:
-                        reversed_game['spread_away'], reversed_game['spread_home'] = reversed_game['spread_home'], reversed_game['spread_away']
-                    best_match = reversed_game
-                    best_score = score2
-            except Exception as e:
-                logger.debug(f"Error in fuzzy matching: {e}")
-                continue
+        Rows without an exact match (in either team order) are fuzzy-scored against
+        the whole source in a single rapidfuzz cdist call instead of per-pair calls.
         
-        if best_match:
-            return best_match
+        Args:
+            sheet_pairs: List of (normalized_away, normalized_home) sheet games
+            source_index: Index of one source built by build_source_index()
+            
+        Returns:
+            (matching source game, whether the source flipped the teams) or None for
+            each sheet game, in order; callers swap the winner once with reverse_game()
+        """
+        forward_index, reverse_index, away_choices, home_choices, games = source_index
+        matches = [None] * len(sheet_pairs)
+        if not games:
+            return matches
         
-        logger.debug(f"No match found for {away_team} @ {home_team}")
-        return None
-    
-    def load_all_data(self):
-        """Load all JSON files from games_scraped/ and llm_mascot/, preferring LLM-processed versions."""
-        # Load sheets data - try LLM processed version first, fallback to regular
-        self.sheets_data = self.load_json_file(self.config.get_llm_mascot_path('sheets_games_llm.json'))
-        if not self.sheets_data or not self.sheets_data.get('games'):
-            self.sheets_data = self.load_json_file(self.config.get_games_scraped_path('sheets_games.json', league="nfl"))
+        # Try exact match first, in both orderings (in case source has them flipped);
+        # the game listed first wins, the forward ordering on a tie
+        pending = []
+        for row, sheet_pair in enumerate(sheet_pairs):
+            forward = forward_index.get(sheet_pair)
+            reverse = reverse_index.get(sheet_pair)
+            if forward is not None and (reverse is None or forward <= reverse):
+                matches[row] = (games[forward], False)
+            elif reverse is not None:
+                matches[row] = (games[reverse], True)
+            else:
+                pending.append(row)
         
-        # Load all scraper outputs - try LLM processed versions first (from llm_mascot), fallback to scraped versions
-        self.fantasynerds_data = self.load_json_file(self.config.get_llm_mascot_path('fantasynerds_games_llm.json'))
-        if not self.fantasynerds_data or not self.fantasynerds_data.get('games'):
-            self.fantasynerds_data = self.load_json_file(self.config.get_games_scraped_path('fantasynerds_games.json', league="nfl"))
+        if not pending:
+            return matches
         
-        self.sportsline_data = self.load_json_file(self.config.get_llm_mascot_path('sportsline_games_llm.json'))
-        if not self.sportsline_data or not self.sportsline_data.get('games'):
-            self.sportsline_data = self.load_json_file(self.config.get_games_scraped_path('sportsline_games.json', league="nfl"))
+        # Fallback: fuzzy matching, scoring both orderings for all rows at once
+        sheet_aways = [sheet_pairs[row][0] for row in pending]
+        sheet_homes = [sheet_pairs[row][1] for row in pending]
+        # An average can only reach the threshold if each side scores at least
+        # 2 * threshold - 100, so weaker pairs are cut off early (scored 0) inside rapidfuzz
+        # (one point of slack keeps float rounding at the boundary from dropping a pair)
+        scoring = dict(
+            scorer=fuzz.ratio,
+            score_cutoff=max(0, 2 * self.fuzzy_threshold - 101),
+            dtype=np.float64,
+            workers=-1
+        )
+        try:
+            # One matrix of every sheet name against every source name; its four
+            # blocks are the away/home and home/away pairings
+            scores = process.cdist(sheet_aways + sheet_homes, away_choices + home_choices, **scoring)
+            rows, columns = len(pending), len(games)
+            forward_scores = (scores[:rows, :columns] + scores[rows:, columns:]) / 2
+            reverse_scores = (scores[:rows, columns:] + scores[rows:, :columns]) / 2
+        except Exception as e:
+            logger.debug(f"Error in fuzzy matching: {e}")
+            return matches
         
-        self.florio_data = self.load_json_file(self.config.get_llm_mascot_path('florio_games_llm.json'))
-        if not self.florio_data or not self.florio_data.get('games'):
-            self.florio_data = self.load_json_file(self.config.get_games_scraped_path('florio_games.json', league="nfl"))
+        for row, score1, score2 in zip(pending, forward_scores, reverse_scores):
+            # Pick the best-scoring game, checking the forward ordering before the reversed one
+            best_index = None
+            best_reversed = False
+            best_score = 0
+            for index in np.flatnonzero((score1 >= self.fuzzy_threshold) | (score2 >= self.fuzzy_threshold)):
+                if score1[index] >= self.fuzzy_threshold and score1[index] > best_score:
+                    best_index, best_reversed, best_score = index, False, score1[index]
+                elif score2[index] >= self.fuzzy_threshold and score2[index] > best_score:
+                    best_index, best_reversed, best_score = index, True, score2[index]
+            
+            if best_index is not None:
+                matches[row] = (games[best_index], best_reversed)
+            else:
+                logger.debug(f"No match found for {sheet_pairs[row][0]} @ {sheet_pairs[row][1]}")
         
-        self.simms_data = self.load_json_file(self.config.get_llm_mascot_path('simms_games_llm.json'))
-        if not self.simms_data or not self.simms_data.get('games'):
-            self.simms_data = self.load_json_file(self.config.get_games_scraped_path('simms_games.json', league="nfl"))
+        return matches
+    
+    def find_matching_game(
+        self, 
+        away_team: str, 
+        home_team: str, 
+        games_list: List[Dict],
+        source_index: Optional[Tuple[Dict, Dict, List[str], List[str], List[Dict]]] = None
+    ) -> Optional[Dict]:
+        """
+        Find a matching game using simplified normalization and fuzzy matching.
         
-        self.dimers_data = self.load_json_file(self.config.get_llm_mascot_path('dimers_games_llm.json'))
-        if not self.dimers_data or not self.dimers_data.get('games'):
-            self.dimers_data = self.load_json_file(self.config.get_games_scraped_path('dimers_games.json', league="nfl"))
+        Args:
+            away_team: Away team name to match
+            home_team: Home team name to match
+            games_list: List of games to search
+            source_index: build_source_index(games_list), to reuse the normalized games
+                across repeated lookups in the same list (built here if not provided)
+            
+        Returns:
+            Matching game dict or None
+        """
+        if not games_list or not isinstance(games_list, list):
+            return None
         
-        self.oddshark_data = self.load_json_file(self.config.get_llm_mascot_path('oddshark_games_llm.json'))
-        if not self.oddshark_data or not self.oddshark_data.get('games'):
-            self.oddshark_data = self.load_json_file(self.config.get_games_scraped_path('oddshark_games.json', league="nfl"))
+        if source_index is None:
+            source_index = self.build_source_index(games_list)
         
-        self.espn_data = self.load_json_file(self.config.get_llm_mascot_path('espn_games_llm.json'))
-        if not self.espn_data or not self.espn_data.get('games'):
-            self.espn_data = self.load_json_file(self.config.get_games_scraped_path('espn_games.json', league="nfl"))
+        sheet_pair = (self.normalize_team_name(away_team), self.normalize_team_name(home_team))
+        match = self.match_source([sheet_pair], source_index)[0]
+        if match is None:
+            return None
+        game, is_reversed = match
+        return self.reverse_game(game) if is_reversed else game
+    
+    def load_all_data(self):
+        """Load all JSON files from games_scraped/ and llm_mascot/, preferring LLM-processed versions."""
+        # Try LLM processed versions first (from llm_mascot), fallback to scraped versions.
+        # Each round reads its files concurrently; fallbacks are only read where needed.
+        with ThreadPoolExecutor(max_workers=len(self.data_paths)) as executor:
+            loaded = dict(zip(
+                self.data_paths,
+                executor.map(self.load_json_file, [llm_path for llm_path, _ in self.data_paths.values()])
+            ))
+            
+            fallbacks = [attr for attr, data in loaded.items() if not data or not data.get('games')]
+            loaded.update(zip(
+                fallbacks,
+                executor.map(self.load_json_file, [self.data_paths[attr][1] for attr in fallbacks])
+            ))
         
-        self.dratings_data = self.load_json_file(self.config.get_llm_mascot_path('dratings_games_llm.json'))
-        if not self.dratings_data or not self.dratings_data.get('games'):
-            self.dratings_data = self.load_json_file(self.config.get_games_scraped_path('dratings_games.json', league="nfl"))
+        for attr, data in loaded.items():
+            setattr(self, attr, data)
         
         logger.info("All NFL data files loaded")
     
@@ -247,31 +344,18 @@ class NFLGameMatcher:
             logger.error("Invalid sheets data structure")
             return {}
         
-        results = {
-            "sheets_total": len(self.sheets_data['games']),
-            "fantasynerds_matched": 0,
-            "sportsline_matched": 0,
-            "florio_matched": 0,
-            "simms_matched": 0,
-            "dimers_matched": 0,
-            "oddshark_matched": 0,
-            "espn_matched": 0,
-            "dratings_matched": 0,
-            "matched_sheets_rows": {}
-        }
+        results = {"sheets_total": len(self.sheets_data['games'])}
+        results.update((f"{source_name}_matched", 0) for source_name in self.SOURCES)
+        results["matched_sheets_rows"] = {}
         
         # Prepare source data
-        sources = {
-            'fantasynerds': self.fantasynerds_data.get('games', []) if self.fantasynerds_data else [],
-            'sportsline': self.sportsline_data.get('games', []) if self.sportsline_data else [],
-            'florio': self.florio_data.get('games', []) if self.florio_data else [],
-            'simms': self.simms_data.get('games', []) if self.simms_data else [],
-            'dimers': self.dimers_data.get('games', []) if self.dimers_data else [],
-            'oddshark': self.oddshark_data.get('games', []) if self.oddshark_data else [],
-            'espn': self.espn_data.get('games', []) if self.espn_data else [],
-            'dratings': self.dratings_data.get('games', []) if self.dratings_data else []
-        }
+        sources = {}
+        for source_name in self.SOURCES:
+            source_data = getattr(self, f'{source_name}_data')
+            sources[source_name] = source_data.get('games', []) if source_data else []
         
+        # Validate and normalize sheet games
+        sheet_rows = []
         for sheet_game in self.sheets_data['games']:
             if not isinstance(sheet_game, dict):
                 logger.warning(f"Invalid sheet game format: {sheet_game}")
@@ -282,38 +366,42 @@ class NFLGameMatcher:
                 continue
             
             try:
-                away_team = sheet_game['away_team']
-                home_team = sheet_game['home_team']
                 row_number = str(sheet_game['row_number'])
-                
-                normalized_away = self.normalize_team_name(away_team)
-                normalized_home = self.normalize_team_name(home_team)
-                
-                matched_game = {
-                    "sheets": {
-                        "away_team": normalized_away, 
-                        "home_team": normalized_home
-                    }
-                }
-                
-                for source_name, games_list in sources.items():
-                    match = self.find_matching_game(away_team, home_team, games_list)
-                    if match:
-                        try:
-                            normalized_match = match.copy()
-                            normalized_match['away_team'] = self.normalize_team_name(match.get('away_team', ''))
-                            normalized_match['home_team'] = self.normalize_team_name(match.get('home_team', ''))
-                            matched_game[source_name] = normalized_match
-                            results[f"{source_name}_matched"] += 1
-                        except Exception as e:
-                            logger.warning(f"Error normalizing match from {source_name}: {e}")
-                
-                results["matched_sheets_rows"][row_number] = matched_game
-            
+                normalized_away = self.normalize_team_name(sheet_game['away_team'])
+                normalized_home = self.normalize_team_name(sheet_game['home_team'])
+                sheet_rows.append((row_number, (normalized_away, normalized_home)))
             except Exception as e:
                 logger.error(f"Error processing sheet game: {e}")
                 continue
         
+        # Match all sheet games against each source at once
+        sheet_pairs = [pair for _, pair in sheet_rows]
+        source_matches = {
+            source_name: self.match_source(sheet_pairs, self.build_source_index(games_list))
+            for source_name, games_list in sources.items()
+        }
+        
+        for position, (row_number, (normalized_away, normalized_home)) in enumerate(sheet_rows):
+            matched_game = {
+                "sheets": {
+                    "away_team": normalized_away, 
+                    "home_team": normalized_home
+                }
+            }
+            
+            for source_name, matches in source_matches.items():
+                match = matches[position]
+                if match:
+                    # Copy the source game once, swapping it in the same step if flipped
+                    game, is_reversed = match
+                    normalized_match = self.reverse_game(game) if is_reversed else game.copy()
+                    normalized_match['away_team'] = self.normalize_team_name(normalized_match['away_team'])
+                    normalized_match['home_team'] = self.normalize_team_name(normalized_match['home_team'])
+                    matched_game[source_name] = normalized_match
+                    results[f"{source_name}_matched"] += 1
+            
+            results["matched_sheets_rows"][row_number] = matched_game
+        
         logger.info(f"Matching complete: "
                    f"FantasyNerds={results['fantasynerds_matched']}, "
                    f"SportsLine={results['sportsline_matched']}, "
@@ -331,8 +419,7 @@ class NFLGameMatcher:
         try:
             output_path = self.config.get_data_path(output_file, league="nfl")
             
-            with open(output_path, 'w', encoding='utf-8') as file:
-                json.dump(results, file, indent=2, ensure_ascii=False)
+            json_io.dump_json(output_path, results)
             
             logger.info(f"Results saved to {output_path}")
         except Exception as e:
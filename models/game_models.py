@@ -1,14 +1,30 @@
 """Pydantic models for game data structures."""
 
+import itertools
 from datetime import datetime
 from typing import Optional, Dict
 from uuid import uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class Game(BaseModel):
+# Game ids: one random prefix per process plus a counter, instead of a uuid4 per game
+_GAME_ID_PREFIX = uuid4().hex[:12]
+_GAME_ID_COUNTER = itertools.count()
+
+
+def new_game_id() -> str:
+    """Return an id unique across processes (random prefix) and within one (counter)."""
+    return f"{_GAME_ID_PREFIX}-{next(_GAME_ID_COUNTER)}"
+
+
+class GameDataModel(BaseModel):
+    """Base for game data models: immutable, unknown fields ignored, validators built on first use."""
+    model_config = ConfigDict(frozen=True, extra='ignore', defer_build=True)
+
+
+class Game(GameDataModel):
     """Base game model with team names."""
-    game_id: str = Field(default_factory=lambda: str(uuid4()))
+    game_id: str = Field(default_factory=new_game_id)
     away_team: str = Field(description="Away team name")
     home_team: str = Field(description="Home team name")
     scraped_at: Optional[datetime] = Field(default_factory=datetime.now)
@@ -26,27 +42,27 @@ class SpreadGame(Game):
     spread_home: float = Field(description="Win probability percentage for home team")
 
 
-class SheetsGame(BaseModel):
+class SheetsGame(GameDataModel):
     """Game from Google Sheets with row number."""
     away_team: str = Field(description="Away team name")
     home_team: str = Field(description="Home team name")
     row_number: int = Field(description="Row number in the sheet")
 
 
-class ScraperOutput(BaseModel):
+class ScraperOutput(GameDataModel):
     """Output from web scrapers."""
     website: str = Field(description="Source website name")
     total: int = Field(description="Total number of games scraped")
     games: list = Field(description="List of games")
 
 
-class SheetsOutput(BaseModel):
+class SheetsOutput(GameDataModel):
     """Output from sheets reader."""
     total_games: int = Field(description="Total number of games")
     games: list[SheetsGame] = Field(description="List of games from sheets")
 
 
-class MatchedGame(BaseModel):
+class MatchedGame(GameDataModel):
     """Matched game across multiple sources."""
     sheets: Dict = Field(description="Data from sheets")
     dimers: Optional[Dict] = None
@@ -55,7 +71,7 @@ class MatchedGame(BaseModel):
     dratings: Optional[Dict] = None
 
 
-class MatchedGamesOutput(BaseModel):
+class MatchedGamesOutput(GameDataModel):
     """Output from game matcher."""
     sheets_total: int
     dimers_matched: int
@@ -65,13 +81,13 @@ class MatchedGamesOutput(BaseModel):
     matched_sheets_rows: Dict[str, MatchedGame]
 
 
-class LLMPredictedScore(BaseModel):
+class LLMPredictedScore(GameDataModel):
     """LLM predicted scores."""
     predicted_score_away: float = Field(description="Predicted score for away team")
     predicted_score_home: float = Field(description="Predicted score for home team")
 
 
-class PredictedGame(BaseModel):
+class PredictedGame(GameDataModel):
     """Game with LLM predictions and all source data."""
     llm_predicted_score: LLMPredictedScore
     sheets: Dict
@@ -81,7 +97,7 @@ class PredictedGame(BaseModel):
     dratings: Optional[Dict] = None
 
 
-class PredictedGamesOutput(BaseModel):
+class PredictedGamesOutput(GameDataModel):
     """Output from predictor."""
     predicted_sheets_rows: Dict[str, PredictedGame]
 
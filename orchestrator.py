@@ -1,17 +1,30 @@
 """LangGraph orchestrator for American Football Forecast Automation workflow."""
 
 import asyncio
+import atexit
+import importlib
+import inspect
 import os
 import sys
-from typing import Dict, List, TypedDict, Annotated
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, TypedDict, Annotated
 import operator
 
-from langgraph.graph import StateGraph, END
+import aiohttp
+from langgraph.graph import StateGraph, START, END
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Not available on Windows; the default asyncio loop is used instead
 
 # Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
 
 from utils import Config, get_logger
+from utils.base_scraper import create_connector
 
 # Import all modules needed for the workflow
 from sheets.sheets_reader_ncaaf import SheetsReader
@@ -27,91 +40,165 @@ from llm_processors.chatgpt_nfl import run_chatgpt_nfl
 
 logger = get_logger(__name__)
 
+# Run the scraper fan-out on libuv's event loop when it is installed
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Every scraper shares one HTTP connection pool and one cap on in-flight requests
+SCRAPER_CONNECTION_LIMIT = 200
+SCRAPER_MAX_CONCURRENT_REQUESTS = 32
+
+# Python 3.12+ can start tasks eagerly, so scrapers that finish (or fail) without
+# awaiting skip a trip through the scheduler
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop for the scraper fan-out, with eager tasks when supported."""
+    loop = asyncio.new_event_loop()
+    if _EAGER_TASK_FACTORY is not None:
+        loop.set_task_factory(_EAGER_TASK_FACTORY)
+    return loop
+
+
+# One event loop for every async step in the process, created on first use and closed
+# at exit; the lock keeps graph nodes on different threads from sharing it at once
+_RUNNER = asyncio.Runner(loop_factory=new_event_loop)
+_RUNNER_LOCK = threading.Lock()
+atexit.register(_RUNNER.close)
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the orchestrator's shared event loop and return its result."""
+    with _RUNNER_LOCK:
+        return _RUNNER.run(coro)
 
-# Define the state structure
+
+def latest(current: str, update: str) -> str:
+    """Reducer that keeps the most recent value, so parallel branches can both report it."""
+    return update
+
+
+# Define the state structure. Nodes return only the fields they change and LangGraph
+# merges them in; the NCAAF and NFL branches run in parallel, so every field a node
+# writes needs a reducer.
 class WorkflowState(TypedDict):
     """State structure for the workflow."""
-    step: str
-    status: str
+    step: Annotated[str, latest]
+    status: Annotated[str, latest]
     errors: Annotated[List[str], operator.add]
-    completed_steps: List[str]
+    completed_steps: Annotated[List[str], operator.add]
     config: Config
 
 
-# Import scraper modules
-import importlib.util
+STEP_BANNER_RULE = "=" * 60
 
-def load_scraper_module(module_path: str, module_name: str):
-    """Dynamically load a scraper module."""
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+
+def log_step_banner(title: str):
+    """Log a step banner as one record, so parallel branches can't interleave its lines."""
+    logger.info(f"{STEP_BANNER_RULE}\n{title}\n{STEP_BANNER_RULE}")
 
 
 # Node functions
-def read_sheets_ncaaf(state: WorkflowState) -> WorkflowState:
+def read_sheets_ncaaf(state: WorkflowState) -> Dict:
     """Read NCAAF sheets."""
-    logger.info("=" * 60)
-    logger.info("STEP 1: Reading NCAAF Sheets")
-    logger.info("=" * 60)
+    log_step_banner("STEP 1: Reading NCAAF Sheets")
     
     try:
         reader = SheetsReader(state.get("config"))
         reader.save_games_to_file()
         
-        new_state = dict(state)
-        new_state["step"] = "read_sheets_ncaaf"
-        new_state["status"] = "completed"
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["read_sheets_ncaaf"]
         logger.info("✓ NCAAF sheets read successfully")
-        return new_state
+        return {
+            "step": "read_sheets_ncaaf",
+            "status": "completed",
+            "completed_steps": ["read_sheets_ncaaf"]
+        }
     except Exception as e:
         error_msg = f"Error reading NCAAF sheets: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "read_sheets_ncaaf"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "read_sheets_ncaaf",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def read_sheets_nfl(state: WorkflowState) -> WorkflowState:
+def read_sheets_nfl(state: WorkflowState) -> Dict:
     """Read NFL sheets."""
-    logger.info("=" * 60)
-    logger.info("STEP 2: Reading NFL Sheets")
-    logger.info("=" * 60)
+    log_step_banner("STEP 2: Reading NFL Sheets")
     
     try:
         reader = NFLSheetsReader(state.get("config"))
         reader.save_games_to_file()
         
-        new_state = dict(state)
-        new_state["step"] = "read_sheets_nfl"
-        new_state["status"] = "completed"
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["read_sheets_nfl"]
         logger.info("✓ NFL sheets read successfully")
-        return new_state
+        return {
+            "step": "read_sheets_nfl",
+            "status": "completed",
+            "completed_steps": ["read_sheets_nfl"]
+        }
     except Exception as e:
         error_msg = f"Error reading NFL sheets: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "read_sheets_nfl"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "read_sheets_nfl",
+            "status": "error",
+            "errors": [error_msg]
+        }
+
 
+# Every scraper run by scrape_all_concurrent: (league, name, module). Scrapers are
+# imported as regular modules, so sys.modules caches them after the first run.
+NCAAF_SCRAPERS = ("dimers", "dratings", "espn", "oddshark")
+NFL_SCRAPERS = ("dimers", "dratings", "espn", "fantasynerds", "florio_simms", "oddshark", "sportsline")
+SCRAPERS = tuple(
+    (league.upper(), name, f"scrapers.{league}.{name}_scraper")
+    for league, names in (("ncaaf", NCAAF_SCRAPERS), ("nfl", NFL_SCRAPERS))
+    for name in names
+)
 
-async def run_scraper_async(scraper_path: str, scraper_name: str):
-    """Run a scraper's main function asynchronously."""
+# Worker processes for scrapers with a synchronous main(), shared by both leagues
+_SCRAPER_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_SCRAPER_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def get_scraper_process_pool() -> ProcessPoolExecutor:
+    """Return the shared scraper process pool, starting it on first use."""
+    global _SCRAPER_PROCESS_POOL
+    with _SCRAPER_PROCESS_POOL_LOCK:
+        if _SCRAPER_PROCESS_POOL is None:
+            _SCRAPER_PROCESS_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _SCRAPER_PROCESS_POOL
+
+
+def run_sync_scraper_main(module_name: str):
+    """Import a scraper in a worker process and run its synchronous main function."""
+    importlib.import_module(module_name).main()
+
+
+async def run_scraper_async(
+    module_name: str,
+    scraper_name: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """Run a scraper's main function asynchronously, sharing the session/semaphore if it accepts them."""
     try:
-        module = load_scraper_module(scraper_path, scraper_name)
+        module = importlib.import_module(module_name)
         if hasattr(module, 'main'):
             main_func = module.main
             if asyncio.iscoroutinefunction(main_func):
-                await main_func()
+                params = inspect.signature(main_func).parameters
+                shared = {"session": session, "semaphore": semaphore}
+                await main_func(**{k: v for k, v in shared.items() if k in params and v is not None})
             else:
-                main_func()
+                # Synchronous scrapers parse HTML on the CPU; run them in another
+                # process so they don't hold the GIL while the async scrapers wait on I/O
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    get_scraper_process_pool(), run_sync_scraper_main, module_name
+                )
             return {"scraper": scraper_name, "status": "success"}
         else:
             return {"scraper": scraper_name, "status": "error", "message": "No main function found"}
@@ -122,373 +209,325 @@ async def run_scraper_async(scraper_path: str, scraper_name: str):
         return {"scraper": scraper_name, "status": "error", "message": str(e)}
 
 
-def scrape_ncaaf_concurrent(state: WorkflowState) -> WorkflowState:
-    """Run all NCAAF scrapers concurrently."""
-    logger.info("=" * 60)
-    logger.info("STEP 3: Scraping NCAAF (Concurrent)")
-    logger.info("=" * 60)
-    
-    config = state.get("config")
-    base_path = os.path.abspath(os.path.dirname(__file__))
-    
-    scrapers = [
-        ("dimers", os.path.join(base_path, "scrapers", "ncaaf", "dimers_scraper.py")),
-        ("dratings", os.path.join(base_path, "scrapers", "ncaaf", "dratings_scraper.py")),
-        ("espn", os.path.join(base_path, "scrapers", "ncaaf", "espn_scraper.py")),
-        ("oddshark", os.path.join(base_path, "scrapers", "ncaaf", "oddshark_scraper.py")),
-    ]
+def scrape_all_concurrent(state: WorkflowState) -> Dict:
+    """Run all NCAAF and NFL scrapers concurrently in a single event loop."""
+    log_step_banner("STEP 3-4: Scraping NCAAF and NFL (Concurrent)")
     
     errors = []
-    results = []
-    
-    async def run_all_scrapers():
-        tasks = [run_scraper_async(path, name) for name, path in scrapers]
-        return await asyncio.gather(*tasks, return_exceptions=True)
-    
-    try:
-        results = asyncio.run(run_all_scrapers())
-        
-        for result in results:
-            if isinstance(result, Exception):
-                errors.append(f"Scraper error: {result}")
-                logger.error(f"Scraper exception: {result}")
-            elif result.get("status") == "error":
-                errors.append(f"{result['scraper']}: {result.get('message', 'Unknown error')}")
-                logger.error(f"Scraper {result['scraper']} failed")
-            else:
-                logger.info(f"✓ {result['scraper']} scraper completed")
-        
-        status = "completed" if len(errors) == 0 else "completed_with_errors"
-        new_state = dict(state)
-        new_state["step"] = "scrape_ncaaf_concurrent"
-        new_state["status"] = status
-        new_state["errors"] = state.get("errors", []) + errors
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["scrape_ncaaf_concurrent"]
-        logger.info("✓ NCAAF scraping completed")
-        return new_state
-        
-    except Exception as e:
-        error_msg = f"Error in NCAAF scraping: {e}"
-        logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "scrape_ncaaf_concurrent"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
-
-
-def scrape_nfl_concurrent(state: WorkflowState) -> WorkflowState:
-    """Run all NFL scrapers concurrently with special handling for sportsline."""
-    logger.info("=" * 60)
-    logger.info("STEP 4: Scraping NFL (Concurrent)")
-    logger.info("=" * 60)
-    
-    config = state.get("config")
-    base_path = os.path.abspath(os.path.dirname(__file__))
-    
-    scrapers = [
-        ("dimers", os.path.join(base_path, "scrapers", "nfl", "dimers_scraper.py")),
-        ("dratings", os.path.join(base_path, "scrapers", "nfl", "dratings_scraper.py")),
-        ("espn", os.path.join(base_path, "scrapers", "nfl", "espn_scraper.py")),
-        ("fantasynerds", os.path.join(base_path, "scrapers", "nfl", "fantasynerds_scraper.py")),
-        ("florio_simms", os.path.join(base_path, "scrapers", "nfl", "florio_simms_scraper.py")),
-        ("oddshark", os.path.join(base_path, "scrapers", "nfl", "oddshark_scraper.py")),
-        ("sportsline", os.path.join(base_path, "scrapers", "nfl", "sportsline_scraper.py")),
-    ]
     
-    errors = []
-    results = []
+    def report(league: str, result: Dict):
+        """Log one scraper's outcome and record its error, if any."""
+        if result.get("status") == "error":
+            errors.append(f"{league} {result['scraper']}: {result.get('message', 'Unknown error')}")
+            logger.error(f"{league} scraper {result['scraper']} failed")
+        else:
+            logger.info(f"✓ {league} {result['scraper']} scraper completed")
     
     async def run_all_scrapers():
-        tasks = []
-        for name, path in scrapers:
-            if name == "sportsline":
-                # Give sportsline more time due to login
-                logger.info(f"Starting {name} scraper (may take longer due to login)...")
-                task = asyncio.create_task(run_scraper_async(path, name))
-                tasks.append(task)
-            else:
-                tasks.append(run_scraper_async(path, name))
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        connector = create_connector(SCRAPER_CONNECTION_LIMIT)
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            semaphore = asyncio.Semaphore(SCRAPER_MAX_CONCURRENT_REQUESTS)
+            completed = asyncio.Queue()
+            pending = {league: 0 for league, _, _ in SCRAPERS}
+            
+            async def run_and_queue(league: str, name: str, module_name: str):
+                result = await run_scraper_async(module_name, name, session, semaphore)
+                await completed.put((league, result))
+            
+            # run_scraper_async reports its own failures, so one scraper failing
+            # never cancels the rest of the group
+            async with asyncio.TaskGroup() as group:
+                for league, name, module_name in SCRAPERS:
+                    if name == "sportsline":
+                        # Sportsline takes longer due to login; the other scrapers run alongside it
+                        logger.info(f"Starting {league} {name} scraper (may take longer due to login)...")
+                    pending[league] += 1
+                    group.create_task(run_and_queue(league, name, module_name))
+                
+                # Report each scraper as it lands rather than after the slowest one
+                for _ in SCRAPERS:
+                    league, result = await completed.get()
+                    report(league, result)
+                    pending[league] -= 1
+                    if pending[league] == 0:
+                        logger.info(f"✓ All {league} scrapers finished")
     
     try:
-        results = asyncio.run(run_all_scrapers())
-        
-        for result in results:
-            if isinstance(result, Exception):
-                errors.append(f"Scraper error: {result}")
-                logger.error(f"Scraper exception: {result}")
-            elif result.get("status") == "error":
-                errors.append(f"{result['scraper']}: {result.get('message', 'Unknown error')}")
-                logger.error(f"Scraper {result['scraper']} failed")
-            else:
-                logger.info(f"✓ {result['scraper']} scraper completed")
+        run_async(run_all_scrapers())
         
         status = "completed" if len(errors) == 0 else "completed_with_errors"
-        new_state = dict(state)
-        new_state["step"] = "scrape_nfl_concurrent"
-        new_state["status"] = status
-        new_state["errors"] = state.get("errors", []) + errors
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["scrape_nfl_concurrent"]
-        logger.info("✓ NFL scraping completed")
-        return new_state
+        logger.info("✓ NCAAF and NFL scraping completed")
+        return {
+            "step": "scrape_all_concurrent",
+            "status": status,
+            "errors": errors,
+            "completed_steps": ["scrape_all_concurrent"]
+        }
         
     except Exception as e:
-        error_msg = f"Error in NFL scraping: {e}"
+        error_msg = f"Error in NCAAF/NFL scraping: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "scrape_nfl_concurrent"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "scrape_all_concurrent",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def process_teams_to_university(state: WorkflowState) -> WorkflowState:
+def process_teams_to_university(state: WorkflowState) -> Dict:
     """Process team names to university names for NCAAF."""
-    logger.info("=" * 60)
-    logger.info("STEP 5: Processing Teams to University (NCAAF)")
-    logger.info("=" * 60)
+    log_step_banner("STEP 5: Processing Teams to University (NCAAF)")
     
     try:
         config = state.get("config")
         process_team_names(config)
         
-        new_state = dict(state)
-        new_state["step"] = "process_teams_to_university"
-        new_state["status"] = "completed"
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["process_teams_to_university"]
         logger.info("✓ Teams to university processing completed")
-        return new_state
+        return {
+            "step": "process_teams_to_university",
+            "status": "completed",
+            "completed_steps": ["process_teams_to_university"]
+        }
     except Exception as e:
         error_msg = f"Error processing teams to university: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "process_teams_to_university"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "process_teams_to_university",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def process_teams_to_mascot(state: WorkflowState) -> WorkflowState:
+def process_teams_to_mascot(state: WorkflowState) -> Dict:
     """Process team names to mascot names for NFL."""
-    logger.info("=" * 60)
-    logger.info("STEP 6: Processing Teams to Mascot (NFL)")
-    logger.info("=" * 60)
+    log_step_banner("STEP 6: Processing Teams to Mascot (NFL)")
     
     try:
         config = state.get("config")
         process_team_names_nfl(config)
         
-        new_state = dict(state)
-        new_state["step"] = "process_teams_to_mascot"
-        new_state["status"] = "completed"
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["process_teams_to_mascot"]
         logger.info("✓ Teams to mascot processing completed")
-        return new_state
+        return {
+            "step": "process_teams_to_mascot",
+            "status": "completed",
+            "completed_steps": ["process_teams_to_mascot"]
+        }
     except Exception as e:
         error_msg = f"Error processing teams to mascot: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "process_teams_to_mascot"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "process_teams_to_mascot",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def match_ncaaf(state: WorkflowState) -> WorkflowState:
+def match_ncaaf(state: WorkflowState) -> Dict:
     """Match NCAAF games."""
-    logger.info("=" * 60)
-    logger.info("STEP 7: Matching NCAAF Games")
-    logger.info("=" * 60)
+    log_step_banner("STEP 7: Matching NCAAF Games")
     
     try:
         config = state.get("config")
         matcher = GameMatcher(config)
         matcher.run()
         
-        new_state = dict(state)
-        new_state["step"] = "match_ncaaf"
-        new_state["status"] = "completed"
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["match_ncaaf"]
         logger.info("✓ NCAAF matching completed")
-        return new_state
+        return {
+            "step": "match_ncaaf",
+            "status": "completed",
+            "completed_steps": ["match_ncaaf"]
+        }
     except Exception as e:
         error_msg = f"Error matching NCAAF games: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "match_ncaaf"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "match_ncaaf",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def match_nfl(state: WorkflowState) -> WorkflowState:
+def match_nfl(state: WorkflowState) -> Dict:
     """Match NFL games."""
-    logger.info("=" * 60)
-    logger.info("STEP 8: Matching NFL Games")
-    logger.info("=" * 60)
+    log_step_banner("STEP 8: Matching NFL Games")
     
     try:
         config = state.get("config")
         matcher = NFLGameMatcher(config)
         matcher.run()
         
-        new_state = dict(state)
-        new_state["step"] = "match_nfl"
-        new_state["status"] = "completed"
-        new_state["completed_steps"] = state.get("completed_steps", []) + ["match_nfl"]
         logger.info("✓ NFL matching completed")
-        return new_state
+        return {
+            "step": "match_nfl",
+            "status": "completed",
+            "completed_steps": ["match_nfl"]
+        }
     except Exception as e:
         error_msg = f"Error matching NFL games: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "match_nfl"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "match_nfl",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def chatgpt_ncaaf(state: WorkflowState) -> WorkflowState:
+def chatgpt_ncaaf(state: WorkflowState) -> Dict:
     """Run ChatGPT processor for NCAAF."""
-    logger.info("=" * 60)
-    logger.info("STEP 9: Running ChatGPT Processor (NCAAF)")
-    logger.info("=" * 60)
+    log_step_banner("STEP 9: Running ChatGPT Processor (NCAAF)")
     
     try:
         config = state.get("config")
         success = run_chatgpt_ncaaf(config)
         
         if success:
-            new_state = dict(state)
-            new_state["step"] = "chatgpt_ncaaf"
-            new_state["status"] = "completed"
-            new_state["completed_steps"] = state.get("completed_steps", []) + ["chatgpt_ncaaf"]
             logger.info("✓ NCAAF ChatGPT processing completed")
-            return new_state
+            return {
+                "step": "chatgpt_ncaaf",
+                "status": "completed",
+                "completed_steps": ["chatgpt_ncaaf"]
+            }
         else:
             error_msg = "ChatGPT processing for NCAAF failed"
             logger.error(error_msg)
-            new_state = dict(state)
-            new_state["step"] = "chatgpt_ncaaf"
-            new_state["status"] = "error"
-            new_state["errors"] = state.get("errors", []) + [error_msg]
-            return new_state
+            return {
+                "step": "chatgpt_ncaaf",
+                "status": "error",
+                "errors": [error_msg]
+            }
     except Exception as e:
         error_msg = f"Error in NCAAF ChatGPT processing: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "chatgpt_ncaaf"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "chatgpt_ncaaf",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def chatgpt_nfl(state: WorkflowState) -> WorkflowState:
+def chatgpt_nfl(state: WorkflowState) -> Dict:
     """Run ChatGPT processor for NFL."""
-    logger.info("=" * 60)
-    logger.info("STEP 10: Running ChatGPT Processor (NFL)")
-    logger.info("=" * 60)
+    log_step_banner("STEP 10: Running ChatGPT Processor (NFL)")
     
     try:
         config = state.get("config")
         success = run_chatgpt_nfl(config)
         
         if success:
-            new_state = dict(state)
-            new_state["step"] = "chatgpt_nfl"
-            new_state["status"] = "completed"
-            new_state["completed_steps"] = state.get("completed_steps", []) + ["chatgpt_nfl"]
             logger.info("✓ NFL ChatGPT processing completed")
-            return new_state
+            return {
+                "step": "chatgpt_nfl",
+                "status": "completed",
+                "completed_steps": ["chatgpt_nfl"]
+            }
         else:
             error_msg = "ChatGPT processing for NFL failed"
             logger.error(error_msg)
-            new_state = dict(state)
-            new_state["step"] = "chatgpt_nfl"
-            new_state["status"] = "error"
-            new_state["errors"] = state.get("errors", []) + [error_msg]
-            return new_state
+            return {
+                "step": "chatgpt_nfl",
+                "status": "error",
+                "errors": [error_msg]
+            }
     except Exception as e:
         error_msg = f"Error in NFL ChatGPT processing: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "chatgpt_nfl"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "chatgpt_nfl",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def update_sheets_ncaaf(state: WorkflowState) -> WorkflowState:
+def update_sheets_ncaaf(state: WorkflowState) -> Dict:
     """Update NCAAF sheets."""
-    logger.info("=" * 60)
-    logger.info("STEP 11: Updating NCAAF Sheets")
-    logger.info("=" * 60)
+    log_step_banner("STEP 11: Updating NCAAF Sheets")
     
     try:
         config = state.get("config")
         success, message = update_sheets(config)
         
         if success:
-            new_state = dict(state)
-            new_state["step"] = "update_sheets_ncaaf"
-            new_state["status"] = "completed"
-            new_state["completed_steps"] = state.get("completed_steps", []) + ["update_sheets_ncaaf"]
             logger.info(f"✓ NCAAF sheets updated: {message}")
-            return new_state
+            return {
+                "step": "update_sheets_ncaaf",
+                "status": "completed",
+                "completed_steps": ["update_sheets_ncaaf"]
+            }
         else:
             error_msg = f"Failed to update NCAAF sheets: {message}"
             logger.error(error_msg)
-            new_state = dict(state)
-            new_state["step"] = "update_sheets_ncaaf"
-            new_state["status"] = "error"
-            new_state["errors"] = state.get("errors", []) + [error_msg]
-            return new_state
+            return {
+                "step": "update_sheets_ncaaf",
+                "status": "error",
+                "errors": [error_msg]
+            }
     except Exception as e:
         error_msg = f"Error updating NCAAF sheets: {e}"
         logger.error(error_msg)
-        new_state = dict(state)
-        new_state["step"] = "update_sheets_ncaaf"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "update_sheets_ncaaf",
+            "status": "error",
+            "errors": [error_msg]
+        }
 
 
-def update_sheets_nfl(state: WorkflowState) -> WorkflowState:
+def update_sheets_nfl(state: WorkflowState) -> Dict:
     """Update NFL sheets."""
-    logger.info("=" * 60)
-    logger.info("STEP 12: Updating NFL Sheets")
-    logger.info("=" * 60)
+    log_step_banner("STEP 12: Updating NFL Sheets")
     
     try:
-        config = state["config"] if isinstance(state, dict) else state.get("config")
+        config = state.get("config")
         success, message = update_sheets_nfl_func(config)
         
         if success:
-            new_state = dict(state)
-            new_state["step"] = "update_sheets_nfl"
-            new_state["status"] = "completed"
-            new_state["completed_steps"] = state.get("completed_steps", []) + ["update_sheets_nfl"]
             logger.info(f"✓ NFL sheets updated: {message}")
-            return new_state
+            return {
+                "step": "update_sheets_nfl",
+                "status": "completed",
+                "completed_steps": ["update_sheets_nfl"]
+            }
         else:
             error_msg = f"Failed to update NFL sheets: {message}"
             logger.error(error_msg)
-            new_state = dict(state)
-            new_state["step"] = "update_sheets_nfl"
-            new_state["status"] = "error"
-            new_state["errors"] = state.get("errors", []) + [error_msg]
-            return new_state
+            return {
+                "step": "update_sheets_nfl",
+                "status": "error",
+                "errors": [error_msg]
+            }
     except Exception as e:
         error_msg = f"Error updating NFL sheets: {e}"
         logger.error(error_msg)
         import traceback
         logger.error(traceback.format_exc())
-        new_state = dict(state)
-        new_state["step"] = "update_sheets_nfl"
-        new_state["status"] = "error"
-        new_state["errors"] = state.get("errors", []) + [error_msg]
-        return new_state
+        return {
+            "step": "update_sheets_nfl",
+            "status": "error",
+            "errors": [error_msg]
+        }
+
+
+def continue_if_completed(step: str, next_node: str):
+    """
+    Build a router that only continues a branch when the given step succeeded.
+    
+    Routes on completed_steps rather than status, since status is shared with
+    the other league's branch.
+    
+    Args:
+        step: Node whose success is required
+        next_node: Node to run next on success
+        
+    Returns:
+        Routing function for add_conditional_edges (next_node or END)
+    """
+    def route(state: WorkflowState) -> str:
+        if step in state.get("completed_steps", []):
+            return next_node
+        logger.warning(f"{step} did not complete, skipping {next_node} and the rest of its branch")
+        return END
+    
+    return route
 
 
 # Build the workflow graph
@@ -499,8 +538,7 @@ def create_workflow():
     # Add all nodes
     workflow.add_node("read_sheets_ncaaf", read_sheets_ncaaf)
     workflow.add_node("read_sheets_nfl", read_sheets_nfl)
-    workflow.add_node("scrape_ncaaf_concurrent", scrape_ncaaf_concurrent)
-    workflow.add_node("scrape_nfl_concurrent", scrape_nfl_concurrent)
+    workflow.add_node("scrape_all_concurrent", scrape_all_concurrent)
     workflow.add_node("process_teams_to_university", process_teams_to_university)
     workflow.add_node("process_teams_to_mascot", process_teams_to_mascot)
     workflow.add_node("match_ncaaf", match_ncaaf)
@@ -510,26 +548,56 @@ def create_workflow():
     workflow.add_node("update_sheets_ncaaf", update_sheets_ncaaf)
     workflow.add_node("update_sheets_nfl", update_sheets_nfl)
     
-    # Set entry point
-    workflow.set_entry_point("read_sheets_ncaaf")
+    # The two leagues share no data, so each runs as its own branch; the only
+    # join is scraping, where all scrapers share one event loop
+    workflow.add_edge(START, "read_sheets_ncaaf")
+    workflow.add_edge(START, "read_sheets_nfl")
+    workflow.add_edge(["read_sheets_ncaaf", "read_sheets_nfl"], "scrape_all_concurrent")
+    
+    # A failed match or ChatGPT step ends its branch early, saving the LLM calls and
+    # Sheets writes that would fail without its output
+    
+    # Nodes at the same depth of the two branches run in the same graph step, on
+    # separate threads, so e.g. both team-name normalizations (LLM calls) and both
+    # Sheets updates overlap
+    
+    # NCAAF branch
+    workflow.add_edge("scrape_all_concurrent", "process_teams_to_university")
+    workflow.add_edge("process_teams_to_university", "match_ncaaf")
+    workflow.add_conditional_edges(
+        "match_ncaaf", continue_if_completed("match_ncaaf", "chatgpt_ncaaf"), ["chatgpt_ncaaf", END]
+    )
+    workflow.add_conditional_edges(
+        "chatgpt_ncaaf", continue_if_completed("chatgpt_ncaaf", "update_sheets_ncaaf"), ["update_sheets_ncaaf", END]
+    )
+    workflow.add_edge("update_sheets_ncaaf", END)
     
-    # Define the workflow edges (sequential)
-    workflow.add_edge("read_sheets_ncaaf", "read_sheets_nfl")
-    workflow.add_edge("read_sheets_nfl", "scrape_ncaaf_concurrent")
-    workflow.add_edge("scrape_ncaaf_concurrent", "scrape_nfl_concurrent")
-    workflow.add_edge("scrape_nfl_concurrent", "process_teams_to_university")
-    workflow.add_edge("process_teams_to_university", "process_teams_to_mascot")
-    workflow.add_edge("process_teams_to_mascot", "match_ncaaf")
-    workflow.add_edge("match_ncaaf", "match_nfl")
-    workflow.add_edge("match_nfl", "chatgpt_ncaaf")
-    workflow.add_edge("chatgpt_ncaaf", "chatgpt_nfl")
-    workflow.add_edge("chatgpt_nfl", "update_sheets_ncaaf")
-    workflow.add_edge("update_sheets_ncaaf", "update_sheets_nfl")
+    # NFL branch
+    workflow.add_edge("scrape_all_concurrent", "process_teams_to_mascot")
+    workflow.add_edge("process_teams_to_mascot", "match_nfl")
+    workflow.add_conditional_edges(
+        "match_nfl", continue_if_completed("match_nfl", "chatgpt_nfl"), ["chatgpt_nfl", END]
+    )
+    workflow.add_conditional_edges(
+        "chatgpt_nfl", continue_if_completed("chatgpt_nfl", "update_sheets_nfl"), ["update_sheets_nfl", END]
+    )
     workflow.add_edge("update_sheets_nfl", END)
     
     return workflow.compile()
 
 
+# Compiled workflow, built on first use and reused by later runs in the same process
+_APP = None
+
+
+def get_app():
+    """Return the compiled LangGraph workflow, compiling it on first call."""
+    global _APP
+    if _APP is None:
+        _APP = create_workflow()
+    return _APP
+
+
 def main():
     """Main entry point for the orchestrator."""
     print("\n" + "=" * 80)
@@ -549,9 +617,8 @@ def main():
             "config": config
         }
         
-        # Create and run workflow
-        app = create_workflow()
-        final_state = app.invoke(initial_state)
+        # Run the (cached) compiled workflow
+        final_state = get_app().invoke(initial_state)
         
         # Print summary
         print("\n" + "=" * 80)
@@ -1,27 +1,62 @@
 """Scraper for DRatings.com NCAAF predictions."""
 
 import asyncio
-import json
 import os
-import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime, timezone
-from uuid import uuid4
-from bs4 import BeautifulSoup
+import aiohttp
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from utils.base_scraper import BaseScraper
+from models.game_models import new_game_id
+from utils import json_io
+from utils.base_scraper import BaseScraper, run_scraper
+
+# Characters kept when cleaning a spread; the sign matters, so '-' stays
+SPREAD_CHARS = '0123456789.-'
+
+
+class SpreadCharTable(dict):
+    """str.translate table that keeps SPREAD_CHARS and drops everything else."""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        """Decide (and remember) whether a character is kept."""
+        kept = codepoint if chr(codepoint) in SPREAD_CHARS else None
+        self[codepoint] = kept
+        return kept
+
+
+# The Unicode minus sign is read as '-'
+SPREAD_TRANSLATION = SpreadCharTable({ord('\u2212'): ord('-')})
+
+# Game links on the index pages
+GAME_LINK_SELECTOR = CSSSelector('a.d--b')
+
+# CSS selectors for the values read from each game page, compiled to XPath once
+GAME_PAGE_SELECTORS = {
+    'away_team': CSSSelector('#away-form > thead > tr > th:nth-child(1) > div'),
+    'home_team': CSSSelector('#home-form > thead > tr > th:nth-child(1) > div'),
+    'away_spread': CSSSelector('#away-breakdown-projection > span:nth-child(1)'),
+    'home_spread': CSSSelector('#home-breakdown-projection > span:nth-child(1)'),
+}
 
 
 class DRatingsScraper(BaseScraper):
     """Scraper for DRatings.com college football predictions."""
     
-    def __init__(self, max_concurrent_requests: int = 10):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 10,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize DRatings scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.dratings.com"
         self.main_urls = [
             "https://www.dratings.com/predictor/ncaa-football-predictions/#scroll-upcoming",
@@ -35,19 +70,20 @@ class DRatingsScraper(BaseScraper):
         """Extract game URLs from all main pages."""
         self.logger.info("Fetching game URLs from main pages...")
         all_game_urls = []
+        seen_urls = set()
         
-        for main_url in self.main_urls:
-            self.logger.info(f"Fetching games from: {main_url}")
-            html_content = await self.fetch_with_retry(main_url)
-            
+        # The main pages are independent, so fetch them all at once
+        pages = await asyncio.gather(*(self.fetch_with_retry(main_url) for main_url in self.main_urls))
+        
+        for main_url, html_content in zip(self.main_urls, pages):
             if not html_content:
                 self.logger.error(f"Failed to fetch main page: {main_url}")
                 continue
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            tree = lxml_html.fromstring(html_content)
             
             # Look for game links with class "d--b"
-            game_links = soup.find_all('a', class_='d--b')
+            game_links = GAME_LINK_SELECTOR(tree)
             self.logger.info(f"Found {len(game_links)} game links on {main_url}")
             
             for link in game_links:
@@ -56,12 +92,31 @@ class DRatingsScraper(BaseScraper):
                     # Convert relative URL to absolute URL
                     full_url = self.base_url + href if href.startswith('/') else href
                     
-                    if full_url not in all_game_urls:
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         all_game_urls.append(full_url)
         
         self.logger.info(f"Total unique game URLs found: {len(all_game_urls)}")
         return all_game_urls
     
+    @staticmethod
+    def extract_game_fields(html_content: str) -> dict:
+        """
+        Read the team names and spread texts from a game page.
+        
+        Args:
+            html_content: Raw HTML of the game page
+            
+        Returns:
+            Dict mapping each GAME_PAGE_SELECTORS key to its whitespace-normalized text (None if missing)
+        """
+        tree = lxml_html.fromstring(html_content)
+        fields = {}
+        for key, selector in GAME_PAGE_SELECTORS.items():
+            nodes = selector(tree)
+            fields[key] = ' '.join(nodes[0].text_content().split()) if nodes else None
+        return fields
+    
     async def scrape_game_page(self, game_url: str) -> dict:
         """Scrape individual game page for team names and spreads."""
         try:
@@ -70,37 +125,29 @@ class DRatingsScraper(BaseScraper):
             if not html_content:
                 return None
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract away team name
-            away_team_element = soup.select_one('#away-form > thead > tr > th:nth-child(1) > div')
-            away_team = away_team_element.get_text(strip=True) if away_team_element else None
-            
-            # Extract home team name
-            home_team_element = soup.select_one('#home-form > thead > tr > th:nth-child(1) > div')
-            home_team = home_team_element.get_text(strip=True) if home_team_element else None
+            fields = await self.run_parser(self.extract_game_fields, html_content)
+            away_team = fields['away_team']
+            home_team = fields['home_team']
             
             # Extract away spread
-            away_spread_element = soup.select_one('#away-breakdown-projection > span:nth-child(1)')
             away_spread = None
-            if away_spread_element:
+            if fields['away_spread'] is not None:
                 try:
-                    text = away_spread_element.get_text(strip=True)
-                    # Remove any non-numeric characters except decimal point
-                    text = re.sub(r'[^\d.]', '', text)
+                    text = fields['away_spread']
+                    # Remove any characters other than digits, decimal point and sign
+                    text = text.translate(SPREAD_TRANSLATION)
                     if text:
                         away_spread = float(text)
                 except (ValueError, AttributeError) as e:
                     self.logger.debug(f"Could not parse away spread from {game_url}: {e}")
             
             # Extract home spread
-            home_spread_element = soup.select_one('#home-breakdown-projection > span:nth-child(1)')
             home_spread = None
-            if home_spread_element:
+            if fields['home_spread'] is not None:
                 try:
-                    text = home_spread_element.get_text(strip=True)
-                    # Remove any non-numeric characters except decimal point
-                    text = re.sub(r'[^\d.]', '', text)
+                    text = fields['home_spread']
+                    # Remove any characters other than digits, decimal point and sign
+                    text = text.translate(SPREAD_TRANSLATION)
                     if text:
                         home_spread = float(text)
                 except (ValueError, AttributeError) as e:
@@ -112,7 +159,7 @@ class DRatingsScraper(BaseScraper):
                 return None
             
             game_data = {
-                'game_id': str(uuid4()),
+                'game_id': new_game_id(),
                 'away_team': away_team,
                 'home_team': home_team,
                 'spread_away': away_spread,
@@ -159,10 +206,10 @@ class DRatingsScraper(BaseScraper):
         seen_games = set()
         
         for game in all_games:
-            game_key = (game['away_team'], game['home_team'])
-            reverse_key = (game['home_team'], game['away_team'])
+            # Order-free key, so a home/away swap of the same matchup counts as a duplicate
+            game_key = frozenset((game['away_team'], game['home_team']))
             
-            if game_key not in seen_games and reverse_key not in seen_games:
+            if game_key not in seen_games:
                 unique_games.append(game)
                 seen_games.add(game_key)
         
@@ -177,13 +224,22 @@ class DRatingsScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     
     config = Config.from_env()
     
-    async with DRatingsScraper(max_concurrent_requests=10) as scraper:
+    async with DRatingsScraper(max_concurrent_requests=10, session=session, semaphore=semaphore) as scraper:
         # Scrape all games
         data = await scraper.scrape_all_games()
         
@@ -191,8 +247,7 @@ async def main():
     output_file = config.get_games_scraped_path("dratings_games.json", league="ncaaf")
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    json_io.dump_json(output_file, data)
     
     print("\n=== SCRAPING SUMMARY ===")
     print(f"Website: {data['website']}")
@@ -201,9 +256,9 @@ async def main():
     
     if data['games']:
         print(f"\nSample game:")
-        print(json.dumps(data['games'][0], indent=2))
+        print(json_io.dumps(data['games'][0], indent=True))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
 
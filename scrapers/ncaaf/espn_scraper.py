@@ -1,28 +1,50 @@
 """Scraper for ESPN.com NCAAF predictions."""
 
 import asyncio
-import json
 import os
 import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime
-from uuid import uuid4
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 from urllib.parse import urljoin
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from utils.base_scraper import BaseScraper
+from models.game_models import new_game_id
+from utils import json_io
+from utils.base_scraper import BaseScraper, run_scraper
+
+# Class list of the team-name spans on ESPN game pages
+TEAM_SPAN_CLASSES = ['tWudT', 'cktOY', 'mXfK', 'GsdWP', 'FMvI']
+
+# String types that soup.get_text() includes (no scripts, styles or comments)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Patterns used on every game page, compiled once
+TEAM_CLASS_RE = re.compile(r'team|Team')
+LETTER_RE = re.compile(r'[A-Za-z]')
+MATCHUP_PREDICTOR_RE = re.compile(r'matchupPredictor')
+DECIMAL_RE = re.compile(r'\d+\.\d+')
+PERCENT_RE = re.compile(r'(\d+\.\d+)%')
+PREDICTOR_PERCENT_RE = re.compile(r'(\d+\.\d+)\s*%')
+PERCENT_TEXT_RE = re.compile(r'\d+\.\d+\s*%')
 
 
 class ESPNScraper(BaseScraper):
     """Scraper for ESPN.com college football predictions."""
     
-    def __init__(self, max_concurrent_requests: int = 50):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 50,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize ESPN scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.espn.com"
         self.odds_url = "https://www.espn.com/college-football/odds"
     
@@ -35,8 +57,9 @@ class ESPNScraper(BaseScraper):
             self.logger.error("Failed to fetch main odds page")
             return []
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         game_urls = []
+        seen_urls = set()
         
         # Look for game links with data-game-link="true" attribute
         game_links = soup.find_all('a', {'data-game-link': 'true'})
@@ -56,12 +79,155 @@ class ESPNScraper(BaseScraper):
                 href = link.get('href')
                 if href and '/game/' in href:
                     full_url = href if href.startswith('http') else urljoin(self.base_url, href)
-                    if full_url not in game_urls:
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         game_urls.append(full_url)
         
         self.logger.info(f"Found {len(game_urls)} total game URLs")
         return game_urls
     
+    def parse_game_html(self, html_content: str, url: str) -> Optional[dict]:
+        """
+        Extract team names and spread percentages from a fetched game page.
+        
+        Runs in the shared parse thread pool, off the event loop.
+        
+        Args:
+            html_content: Raw HTML of the game page
+            url: Page URL, used in log messages
+            
+        Returns:
+            Game data dict, or None if the page is missing data
+        """
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # Collect every candidate node in one walk over the tree instead of a
+        # separate find_all() pass per kind of element
+        team_spans = []
+        team_elements = []
+        predictor_divs = []
+        percent_strings = []
+        text_strings = []
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                classes = node.get('class')
+                if not classes:
+                    continue
+                class_text = ' '.join(classes)
+                if node.name == 'span' and classes == TEAM_SPAN_CLASSES:
+                    team_spans.append(node)
+                if node.name in ('span', 'div') and TEAM_CLASS_RE.search(class_text):
+                    team_elements.append(node)
+                if node.name == 'div' and MATCHUP_PREDICTOR_RE.search(class_text):
+                    predictor_divs.append(node)
+            else:
+                if '%' in node:
+                    percent_strings.append(node)
+                if type(node) in TEXT_STRING_TYPES:
+                    text_strings.append(node)
+        
+        # Extract team names
+        teams = []
+        
+        for span in team_spans:
+            text = span.get_text(strip=True)
+            if text and len(text) > 1:
+                teams.append(text)
+                if len(teams) >= 2:
+                    break
+        
+        # Alternative: Look for team name patterns if specific classes not found
+        if len(teams) < 2:
+            for element in team_elements:
+                text = element.get_text(strip=True)
+                if (text and len(text) > 2 and 
+                    LETTER_RE.search(text) and 
+                    text.lower() not in ['team', 'teams', 'vs', 'at', 'odds', 'spread', 'total']):
+                    if text not in teams:
+                        teams.append(text)
+                        if len(teams) >= 2:
+                            break
+        
+        # Only the first two teams and spreads are used, so every search below stops
+        # as soon as it has enough
+        if len(teams) < 2:
+            self.logger.warning(f"Could not find 2 teams for {url}")
+            return None
+        
+        # Extract spread percentages
+        spreads = []
+        
+        # Method 1: Look for matchupPredictor divs
+        for predictor_div in predictor_divs:
+            # One scan of the predictor's flattened text finds every "NN.N%" value,
+            # including numbers whose "%" sits in a sibling suffix element
+            predictor_text = predictor_div.get_text(' ', strip=True)
+            for match in PREDICTOR_PERCENT_RE.findall(predictor_text):
+                spread_value = float(match)
+                if 0 <= spread_value <= 100:
+                    spreads.append(spread_value)
+                    if len(spreads) >= 2:
+                        break
+            
+            if len(spreads) >= 2:
+                break
+        
+        # Method 2: Look for percentage patterns in text nodes
+        if len(spreads) < 2:
+            percentage_elements = [element for element in percent_strings if PERCENT_TEXT_RE.search(element)]
+            for element in percentage_elements:
+                parent = element.parent
+                if parent:
+                    text = element.strip()
+                    match = DECIMAL_RE.search(text)
+                    if match:
+                        try:
+                            spread_value = float(match.group())
+                            if 0 <= spread_value <= 100:
+                                spreads.append(spread_value)
+                        except ValueError:
+                            continue
+            # Remove duplicates and limit to 2
+            spreads = list(dict.fromkeys(spreads))[:2]
+        
+        # Method 3: Look for any numeric percentages in the page text. The text strings
+        # were gathered by the walk above, so this needs no second pass over the tree
+        if len(spreads) < 2:
+            all_text = ''.join(text_strings)
+            for match in PERCENT_RE.finditer(all_text):
+                try:
+                    spread_value = float(match.group(1))
+                    if 0 <= spread_value <= 100 and spread_value not in spreads:
+                        spreads.append(spread_value)
+                        if len(spreads) >= 2:
+                            break
+                except ValueError:
+                    continue
+        
+        # Validate data
+        if len(teams) >= 2 and len(spreads) >= 2:
+            game_data = {
+                'game_id': new_game_id(),
+                'away_team': teams[0],
+                'home_team': teams[1],
+                'spread_away': spreads[0],
+                'spread_home': spreads[1],
+                'scraped_at': datetime.now().isoformat()
+            }
+            
+            # Validate
+            if (self.validate_team_name(game_data['away_team']) and
+                self.validate_team_name(game_data['home_team']) and
+                self.validate_score(game_data['spread_away']) and
+                self.validate_score(game_data['spread_home'])):
+                return game_data
+            else:
+                self.logger.warning(f"Invalid game data for {url}")
+        else:
+            self.logger.warning(f"Incomplete data for {url}: teams={len(teams)}, spreads={len(spreads)}")
+        
+        return None
+    
     async def parse_game_data(self, url: str) -> dict:
         """Parse individual game page to extract team names and spread percentages."""
         try:
@@ -70,122 +236,8 @@ class ESPNScraper(BaseScraper):
             if not html_content:
                 return None
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract team names
-            teams = []
-            team_spans = soup.find_all('span', class_='tWudT cktOY mXfK GsdWP FMvI')
-            
-            for span in team_spans:
-                text = span.get_text(strip=True)
-                if text and len(text) > 1:
-                    teams.append(text)
-            
-            # Alternative: Look for team name patterns if specific classes not found
-            if len(teams) < 2:
-                team_elements = soup.find_all(['span', 'div'], class_=re.compile(r'team|Team'))
-                for element in team_elements:
-                    text = element.get_text(strip=True)
-                    if (text and len(text) > 2 and 
-                        re.search(r'[A-Za-z]', text) and 
-                        text.lower() not in ['team', 'teams', 'vs', 'at', 'odds', 'spread', 'total']):
-                        if text not in teams:
-                            teams.append(text)
-            
-            # Extract spread percentages
-            spreads = []
+            return await self.run_parser(self.parse_game_html, html_content, url)
             
-            # Method 1: Look for matchupPredictor divs
-            predictor_divs = soup.find_all('div', class_=re.compile(r'matchupPredictor'))
-            
-            for predictor_div in predictor_divs:
-                # Look for direct text matches
-                percentage_divs = predictor_div.find_all('div', string=re.compile(r'\d+\.\d+'))
-                
-                for div in percentage_divs:
-                    text = div.get_text(strip=True)
-                    if re.match(r'^\d+\.\d+$', text):
-                        # Check if this div or its parent contains percentage indicator
-                        parent_text = div.parent.get_text(strip=True) if div.parent else ''
-                        suffix_div = div.find('div', class_=re.compile(r'suffix|percentage'))
-                        if ('%' in parent_text or (suffix_div and '%' in suffix_div.get_text())):
-                            try:
-                                spread_value = float(text)
-                                if 0 <= spread_value <= 100:
-                                    spreads.append(spread_value)
-                            except ValueError:
-                                continue
-                
-                # Also look for spans or other elements within predictor div
-                if not spreads:
-                    for elem in predictor_div.find_all(['div', 'span', 'p']):
-                        text = elem.get_text(strip=True)
-                        match = re.search(r'(\d+\.\d+)%', text)
-                        if match:
-                            try:
-                                spread_value = float(match.group(1))
-                                if 0 <= spread_value <= 100:
-                                    spreads.append(spread_value)
-                            except ValueError:
-                                continue
-            
-            # Method 2: Look for percentage patterns in text nodes
-            if len(spreads) < 2:
-                percentage_elements = soup.find_all(string=re.compile(r'\d+\.\d+\s*%'))
-                for element in percentage_elements:
-                    parent = element.parent
-                    if parent:
-                        text = element.strip()
-                        match = re.search(r'(\d+\.\d+)', text)
-                        if match:
-                            try:
-                                spread_value = float(match.group(1))
-                                if 0 <= spread_value <= 100:
-                                    spreads.append(spread_value)
-                            except ValueError:
-                                continue
-                # Remove duplicates and limit to 2
-                spreads = list(dict.fromkeys(spreads))[:2]
-            
-            # Method 3: Look for any numeric percentages in the document structure
-            if len(spreads) < 2:
-                all_text = soup.get_text()
-                # Find all percentage patterns
-                percentage_matches = re.findall(r'(\d+\.\d+)%', all_text)
-                for match in percentage_matches:
-                    try:
-                        spread_value = float(match)
-                        if 0 <= spread_value <= 100 and spread_value not in spreads:
-                            spreads.append(spread_value)
-                            if len(spreads) >= 2:
-                                break
-                    except ValueError:
-                        continue
-            
-            # Validate data
-            if len(teams) >= 2 and len(spreads) >= 2:
-                game_data = {
-                    'game_id': str(uuid4()),
-                    'away_team': teams[0],
-                    'home_team': teams[1],
-                    'spread_away': spreads[0],
-                    'spread_home': spreads[1],
-                    'scraped_at': datetime.now().isoformat()
-                }
-                
-                # Validate
-                if (self.validate_team_name(game_data['away_team']) and
-                    self.validate_team_name(game_data['home_team']) and
-                    self.validate_score(game_data['spread_away']) and
-                    self.validate_score(game_data['spread_home'])):
-                    return game_data
-                else:
-                    self.logger.warning(f"Invalid game data for {url}")
-            else:
-                self.logger.warning(f"Incomplete data for {url}: teams={len(teams)}, spreads={len(spreads)}")
-            
-            return None
-                
         except Exception as e:
             self.logger.error(f"Error parsing game data from {url}: {e}")
             return None
@@ -223,13 +275,22 @@ class ESPNScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     
     config = Config.from_env()
     
-    async with ESPNScraper(max_concurrent_requests=50) as scraper:
+    async with ESPNScraper(max_concurrent_requests=50, session=session, semaphore=semaphore) as scraper:
         # Scrape all games
         data = await scraper.scrape_all_games()
         
@@ -237,8 +298,7 @@ async def main():
     output_file = config.get_games_scraped_path("espn_games.json", league="ncaaf")
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    json_io.dump_json(output_file, data)
     
     print("\n=== SCRAPING SUMMARY ===")
     print(f"Website: {data['website']}")
@@ -247,9 +307,9 @@ async def main():
     
     if data['games']:
         print(f"\nSample game:")
-        print(json.dumps(data['games'][0], indent=2))
+        print(json_io.dumps(data['games'][0], indent=True))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
 
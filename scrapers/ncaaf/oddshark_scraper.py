@@ -6,8 +6,10 @@ import os
 import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime
 from uuid import uuid4
+import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
@@ -20,9 +22,14 @@ from utils.base_scraper import BaseScraper
 class OddsSharkScraper(BaseScraper):
     """Scraper for OddsShark.com college football predictions."""
     
-    def __init__(self, max_concurrent_requests: int = 100):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 100,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize OddsShark scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.oddsshark.com"
         self.main_url = "https://www.oddsshark.com/ncaaf/odds"
     
@@ -281,13 +288,22 @@ class OddsSharkScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     
     config = Config.from_env()
     
-    async with OddsSharkScraper(max_concurrent_requests=100) as scraper:
+    async with OddsSharkScraper(max_concurrent_requests=100, session=session, semaphore=semaphore) as scraper:
         data = await scraper.scrape_all_games()
         
     # Save to JSON file in data/ncaaf/games_scraped/
@@ -1,12 +1,18 @@
 """Web scrapers for NFL prediction data."""
 
-from .dimers_scraper import DimersScraper
-from .oddshark_scraper import OddsSharkScraper
-from .espn_scraper import ESPNScraper
-from .dratings_scraper import DRatingsScraper
-from .fantasynerds_scraper import FantasyNerdsScraper
-from .sportsline_scraper import SportsLineScraper
-from .florio_simms_scraper import FlorioSimmsScraper
+import importlib
+
+# Scraper classes are imported on first access (PEP 562), so importing one scraper
+# module doesn't pull in every other scraper's dependencies
+_SCRAPER_MODULES = {
+    "DimersScraper": ".dimers_scraper",
+    "OddsSharkScraper": ".oddshark_scraper",
+    "ESPNScraper": ".espn_scraper",
+    "DRatingsScraper": ".dratings_scraper",
+    "FantasyNerdsScraper": ".fantasynerds_scraper",
+    "SportsLineScraper": ".sportsline_scraper",
+    "FlorioSimmsScraper": ".florio_simms_scraper",
+}
 
 __all__ = [
     "DimersScraper",
@@ -18,3 +24,17 @@ __all__ = [
     "FlorioSimmsScraper",
 ]
 
+
+def __getattr__(name):
+    """Import a scraper class from its module the first time it is accessed."""
+    module_name = _SCRAPER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily imported scraper classes alongside the module globals."""
+    return sorted(list(globals()) + __all__)
@@ -6,8 +6,10 @@ import os
 import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime
 from uuid import uuid4
+import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
@@ -20,9 +22,14 @@ from utils.base_scraper import BaseScraper
 class DimersScraper(BaseScraper):
     """Scraper for Dimers.com NFL predictions."""
     
-    def __init__(self, max_concurrent_requests: int = 100):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 100,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize Dimers scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.dimers.com"
         self.schedule_url = "https://www.dimers.com/bet-hub/nfl/schedule"
     
@@ -173,12 +180,21 @@ class DimersScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     config = Config.from_env()
     
-    async with DimersScraper(max_concurrent_requests=100) as scraper:
+    async with DimersScraper(max_concurrent_requests=100, session=session, semaphore=semaphore) as scraper:
         # Scrape all games
         data = await scraper.scrape_all_games()
         
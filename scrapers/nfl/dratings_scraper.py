@@ -1,27 +1,45 @@
 """Scraper for DRatings.com NFL predictions (spreads)."""
 
 import asyncio
-import json
 import os
-import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime
-from uuid import uuid4
-from bs4 import BeautifulSoup
+import aiohttp
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from utils.base_scraper import BaseScraper
+from models.game_models import new_game_id
+from utils import json_io
+from utils.base_scraper import BaseScraper, run_scraper
+
+# Game links on the index pages
+GAME_LINK_SELECTOR = CSSSelector('a.d--b[href*="/predictor/nfl-football-predictions/"]')
+
+# CSS selectors for the values read from each game page, compiled to XPath once
+GAME_PAGE_SELECTORS = {
+    'away_team': CSSSelector('#away-form > thead > tr > th:nth-child(1) > div'),
+    'home_team': CSSSelector('#home-form > thead > tr > th:nth-child(1) > div'),
+    'away_spread': CSSSelector('#away-breakdown-projection > span:nth-child(1)'),
+    'home_spread': CSSSelector('#home-breakdown-projection > span:nth-child(1)'),
+}
 
 
 class DRatingsScraper(BaseScraper):
     """Scraper for DRatings.com NFL predictions (spreads)."""
     
-    def __init__(self, max_concurrent_requests: int = 10):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 10,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize DRatings scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.dratings.com"
         self.main_urls = [
             "https://www.dratings.com/predictor/nfl-football-predictions/",
@@ -35,19 +53,20 @@ class DRatingsScraper(BaseScraper):
         """Extract game URLs from all main pages."""
         self.logger.info("Fetching game URLs from main pages...")
         all_game_urls = []
+        seen_urls = set()
         
-        for main_url in self.main_urls:
-            self.logger.info(f"Fetching games from: {main_url}")
-            html_content = await self.fetch_with_retry(main_url)
-            
+        # The main pages are independent, so fetch them all at once
+        pages = await asyncio.gather(*(self.fetch_with_retry(main_url) for main_url in self.main_urls))
+        
+        for main_url, html_content in zip(self.main_urls, pages):
             if not html_content:
                 self.logger.error(f"Failed to fetch main page: {main_url}")
                 continue
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            tree = lxml_html.fromstring(html_content)
             
             # Look for game links with class "d--b"
-            game_links = soup.find_all('a', class_='d--b', href=re.compile(r'/predictor/nfl-football-predictions/'))
+            game_links = GAME_LINK_SELECTOR(tree)
             self.logger.info(f"Found {len(game_links)} game links on {main_url}")
             
             for link in game_links:
@@ -56,12 +75,31 @@ class DRatingsScraper(BaseScraper):
                     # Convert relative URL to absolute URL
                     full_url = self.base_url + href if href.startswith('/') else href
                     
-                    if full_url not in all_game_urls:
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         all_game_urls.append(full_url)
         
         self.logger.info(f"Total unique game URLs found: {len(all_game_urls)}")
         return all_game_urls
     
+    @staticmethod
+    def extract_game_fields(html_content: str) -> dict:
+        """
+        Read the team names and spread texts from a game page.
+        
+        Args:
+            html_content: Raw HTML of the game page
+            
+        Returns:
+            Dict mapping each GAME_PAGE_SELECTORS key to its whitespace-normalized text (None if missing)
+        """
+        tree = lxml_html.fromstring(html_content)
+        fields = {}
+        for key, selector in GAME_PAGE_SELECTORS.items():
+            nodes = selector(tree)
+            fields[key] = ' '.join(nodes[0].text_content().split()) if nodes else None
+        return fields
+    
     async def parse_game_data(self, url: str) -> dict:
         """Parse individual game page to extract team names and spreads."""
         try:
@@ -70,37 +108,33 @@ class DRatingsScraper(BaseScraper):
             if not html_content:
                 return None
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            fields = await self.run_parser(self.extract_game_fields, html_content)
             
-            # Extract away team name - selector: #away-form > thead > tr > th:nth-child(1) > div
-            away_team_elem = soup.select_one('#away-form > thead > tr > th:nth-child(1) > div')
-            away_team_full = away_team_elem.get_text(strip=True) if away_team_elem else None
+            # Extract away team name
+            away_team_full = fields['away_team']
             
             # Extract only mascot name (last word)
             away_team = away_team_full.split()[-1] if away_team_full and ' ' in away_team_full else away_team_full
             
-            # Extract home team name - selector: #home-form > thead > tr > th:nth-child(1) > div
-            home_team_elem = soup.select_one('#home-form > thead > tr > th:nth-child(1) > div')
-            home_team_full = home_team_elem.get_text(strip=True) if home_team_elem else None
+            # Extract home team name
+            home_team_full = fields['home_team']
             
             # Extract only mascot name (last word)
             home_team = home_team_full.split()[-1] if home_team_full and ' ' in home_team_full else home_team_full
             
-            # Extract away spread - selector: #away-breakdown-projection > span:nth-child(1)
-            away_spread_elem = soup.select_one('#away-breakdown-projection > span:nth-child(1)')
+            # Extract away spread
             away_spread = None
-            if away_spread_elem:
-                spread_text = away_spread_elem.get_text(strip=True)
+            spread_text = fields['away_spread']
+            if spread_text is not None:
                 try:
                     away_spread = float(spread_text)
                 except ValueError:
                     pass
             
-            # Extract home spread - selector: #home-breakdown-projection > span:nth-child(1)
-            home_spread_elem = soup.select_one('#home-breakdown-projection > span:nth-child(1)')
+            # Extract home spread
             home_spread = None
-            if home_spread_elem:
-                spread_text = home_spread_elem.get_text(strip=True)
+            spread_text = fields['home_spread']
+            if spread_text is not None:
                 try:
                     home_spread = float(spread_text)
                 except ValueError:
@@ -109,7 +143,7 @@ class DRatingsScraper(BaseScraper):
             # Validate data
             if away_team and home_team and away_spread is not None and home_spread is not None:
                 game_data = {
-                    'game_id': str(uuid4()),
+                    'game_id': new_game_id(),
                     'away_team': away_team,
                     'home_team': home_team,
                     'spread_away': away_spread,
@@ -167,12 +201,21 @@ class DRatingsScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     config = Config.from_env()
     
-    async with DRatingsScraper(max_concurrent_requests=10) as scraper:
+    async with DRatingsScraper(max_concurrent_requests=10, session=session, semaphore=semaphore) as scraper:
         # Scrape all games
         data = await scraper.scrape_all_games()
         
@@ -180,8 +223,7 @@ async def main():
         output_file = config.get_games_scraped_path("dratings_games.json", league="nfl")
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_io.dump_json(output_file, data)
         
         scraper.logger.info(f"Total games scraped: {data['total']}")
         scraper.logger.info(f"Data saved to {output_file}")
@@ -194,9 +236,9 @@ async def main():
         
         if data['games']:
             print(f"\nSample game:")
-            print(json.dumps(data['games'][0], indent=2))
+            print(json_io.dumps(data['games'][0], indent=True))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
 
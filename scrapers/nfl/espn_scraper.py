@@ -1,28 +1,35 @@
 """Scraper for ESPN.com NFL predictions (spreads)."""
 
 import asyncio
-import json
 import os
 import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime
-from uuid import uuid4
+import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from utils.base_scraper import BaseScraper
+from models.game_models import new_game_id
+from utils import json_io
+from utils.base_scraper import BaseScraper, run_scraper
 
 
 class ESPNScraper(BaseScraper):
     """Scraper for ESPN.com NFL predictions (spreads)."""
     
-    def __init__(self, max_concurrent_requests: int = 50):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 50,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize ESPN scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.espn.com"
         self.odds_url = "https://www.espn.com/nfl/odds"
     
@@ -35,8 +42,9 @@ class ESPNScraper(BaseScraper):
             self.logger.error("Failed to fetch main odds page")
             return []
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         game_urls = []
+        seen_urls = set()
         
         # Look for game links with data-game-link="true" attribute
         game_links = soup.find_all('a', {'data-game-link': 'true'})
@@ -46,7 +54,8 @@ class ESPNScraper(BaseScraper):
             href = link.get('href')
             if href:
                 full_url = href if href.startswith('http') else urljoin(self.base_url, href)
-                if full_url not in game_urls:
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
                     game_urls.append(full_url)
         
         # Try alternative patterns if no data-game-link found
@@ -57,12 +66,98 @@ class ESPNScraper(BaseScraper):
                 href = link.get('href')
                 if href and '/nfl/game/' in href:
                     full_url = href if href.startswith('http') else urljoin(self.base_url, href)
-                    if full_url not in game_urls:
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         game_urls.append(full_url)
         
         self.logger.info(f"Found {len(game_urls)} total game URLs")
         return game_urls
     
+    def parse_game_html(self, html_content: str, url: str) -> Optional[dict]:
+        """
+        Extract team names and spread percentages from a fetched game page.
+        
+        Runs in the shared parse thread pool, off the event loop.
+        
+        Args:
+            html_content: Raw HTML of the game page
+            url: Page URL, used in log messages
+            
+        Returns:
+            Game data dict, or None if the page is missing data
+        """
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # Extract team names - selector: span.NzyJW.NMnSM
+        team_spans = soup.find_all('span', class_=lambda x: x and 'NzyJW' in str(x) and 'NMnSM' in str(x))
+        teams = []
+        
+        for span in team_spans:
+            text = span.get_text(strip=True)
+            if text and len(text) > 1:
+                # Extract mascot name (last word)
+                mascot = text.split()[-1] if ' ' in text else text
+                teams.append(mascot)
+        
+        if len(teams) < 2:
+            self.logger.warning(f"Could not find 2 teams for {url}")
+            return None
+        
+        away_team = teams[0]
+        home_team = teams[1]
+        
+        # Extract spreads - selector: div.matchupPredictor__teamValue
+        # Away spread: div.matchupPredictor__teamValue--b
+        # Home spread: div.matchupPredictor__teamValue--a
+        away_spread = None
+        home_spread = None
+        
+        # Find away spread
+        away_spread_elem = soup.select_one('div.matchupPredictor__teamValue--b div')
+        if away_spread_elem:
+            spread_text = away_spread_elem.get_text(strip=True)
+            # Remove % symbol if present
+            spread_text = spread_text.replace('%', '').strip()
+            try:
+                away_spread = float(spread_text)
+            except ValueError:
+                pass
+        
+        # Find home spread
+        home_spread_elem = soup.select_one('div.matchupPredictor__teamValue--a div')
+        if home_spread_elem:
+            spread_text = home_spread_elem.get_text(strip=True)
+            # Remove % symbol if present
+            spread_text = spread_text.replace('%', '').strip()
+            try:
+                home_spread = float(spread_text)
+            except ValueError:
+                pass
+        
+        # Validate data
+        if away_team and home_team and away_spread is not None and home_spread is not None:
+            game_data = {
+                'game_id': new_game_id(),
+                'away_team': away_team,
+                'home_team': home_team,
+                'spread_away': away_spread,
+                'spread_home': home_spread,
+                'scraped_at': datetime.now().isoformat()
+            }
+            
+            # Validate using base class methods
+            if (self.validate_team_name(game_data['away_team']) and
+                self.validate_team_name(game_data['home_team']) and
+                self.validate_score(game_data['spread_away']) and
+                self.validate_score(game_data['spread_home'])):
+                return game_data
+            else:
+                self.logger.warning(f"Invalid game data for {url}")
+        else:
+            self.logger.warning(f"Incomplete data for {url}: away={away_team}, home={home_team}, away_spread={away_spread}, home_spread={home_spread}")
+        
+        return None
+    
     async def parse_game_data(self, url: str) -> dict:
         """Parse individual game page to extract team names and spread percentages."""
         try:
@@ -71,78 +166,8 @@ class ESPNScraper(BaseScraper):
             if not html_content:
                 return None
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract team names - selector: span.NzyJW.NMnSM
-            team_spans = soup.find_all('span', class_=lambda x: x and 'NzyJW' in str(x) and 'NMnSM' in str(x))
-            teams = []
-            
-            for span in team_spans:
-                text = span.get_text(strip=True)
-                if text and len(text) > 1:
-                    # Extract mascot name (last word)
-                    mascot = text.split()[-1] if ' ' in text else text
-                    teams.append(mascot)
+            return await self.run_parser(self.parse_game_html, html_content, url)
             
-            if len(teams) < 2:
-                self.logger.warning(f"Could not find 2 teams for {url}")
-                return None
-            
-            away_team = teams[0]
-            home_team = teams[1]
-            
-            # Extract spreads - selector: div.matchupPredictor__teamValue
-            # Away spread: div.matchupPredictor__teamValue--b
-            # Home spread: div.matchupPredictor__teamValue--a
-            away_spread = None
-            home_spread = None
-            
-            # Find away spread
-            away_spread_elem = soup.select_one('div.matchupPredictor__teamValue--b div')
-            if away_spread_elem:
-                spread_text = away_spread_elem.get_text(strip=True)
-                # Remove % symbol if present
-                spread_text = spread_text.replace('%', '').strip()
-                try:
-                    away_spread = float(spread_text)
-                except ValueError:
-                    pass
-            
-            # Find home spread
-            home_spread_elem = soup.select_one('div.matchupPredictor__teamValue--a div')
-            if home_spread_elem:
-                spread_text = home_spread_elem.get_text(strip=True)
-                # Remove % symbol if present
-                spread_text = spread_text.replace('%', '').strip()
-                try:
-                    home_spread = float(spread_text)
-                except ValueError:
-                    pass
-            
-            # Validate data
-            if away_team and home_team and away_spread is not None and home_spread is not None:
-                game_data = {
-                    'game_id': str(uuid4()),
-                    'away_team': away_team,
-                    'home_team': home_team,
-                    'spread_away': away_spread,
-                    'spread_home': home_spread,
-                    'scraped_at': datetime.now().isoformat()
-                }
-                
-                # Validate using base class methods
-                if (self.validate_team_name(game_data['away_team']) and
-                    self.validate_team_name(game_data['home_team']) and
-                    self.validate_score(game_data['spread_away']) and
-                    self.validate_score(game_data['spread_home'])):
-                    return game_data
-                else:
-                    self.logger.warning(f"Invalid game data for {url}")
-            else:
-                self.logger.warning(f"Incomplete data for {url}: away={away_team}, home={home_team}, away_spread={away_spread}, home_spread={home_spread}")
-            
-            return None
-                
         except Exception as e:
             self.logger.error(f"Error parsing game data from {url}: {e}")
             return None
@@ -180,12 +205,21 @@ class ESPNScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     config = Config.from_env()
     
-    async with ESPNScraper(max_concurrent_requests=50) as scraper:
+    async with ESPNScraper(max_concurrent_requests=50, session=session, semaphore=semaphore) as scraper:
         # Scrape all games
         data = await scraper.scrape_all_games()
         
@@ -193,8 +227,7 @@ async def main():
         output_file = config.get_games_scraped_path("espn_games.json", league="nfl")
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_io.dump_json(output_file, data)
         
         scraper.logger.info(f"Total games scraped: {data['total']}")
         scraper.logger.info(f"Data saved to {output_file}")
@@ -207,9 +240,9 @@ async def main():
         
         if data['games']:
             print(f"\nSample game:")
-            print(json.dumps(data['games'][0], indent=2))
+            print(json_io.dumps(data['games'][0], indent=True))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
 
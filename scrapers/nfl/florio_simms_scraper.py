@@ -6,8 +6,10 @@ import os
 import re
 import sys
 import time
+from typing import Optional
 from datetime import datetime
 from uuid import uuid4
+import aiohttp
 from bs4 import BeautifulSoup
 
 # Add project root to Python path
@@ -20,9 +22,14 @@ from utils.nfl_week import get_current_nfl_week
 class FlorioSimmsScraper(BaseScraper):
     """Scraper for NBC Sports Florio/Simms NFL predictions."""
     
-    def __init__(self, max_concurrent_requests: int = 10):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 10,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize Florio/Simms scraper."""
-        super().__init__(max_concurrent_requests)
+        super().__init__(max_concurrent_requests, session, semaphore)
         self.base_url = "https://www.nbcsports.com"
     
     def get_url_for_week(self, week: int, year: int = None) -> str:
@@ -255,12 +262,21 @@ class FlorioSimmsScraper(BaseScraper):
         }
 
 
-async def main():
-    """Main function to run the scraper."""
+async def main(
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+):
+    """
+    Main function to run the scraper.
+    
+    Args:
+        session: Shared HTTP session from the orchestrator (one is opened if omitted)
+        semaphore: Shared limit on in-flight HTTP requests across scrapers
+    """
     from utils import Config
     config = Config.from_env()
     
-    async with FlorioSimmsScraper(max_concurrent_requests=10) as scraper:
+    async with FlorioSimmsScraper(max_concurrent_requests=10, session=session, semaphore=semaphore) as scraper:
         # Scrape all games
         data = await scraper.scrape_all_games()
         
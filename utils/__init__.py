@@ -1,10 +1,18 @@
 """Utilities package for football automation."""
 
+import importlib
+
 from utils.config import Config
 from utils.logger import get_logger
-from utils.google_sheets import GoogleSheetsClient
-from utils.base_scraper import BaseScraper
 from utils.nfl_week import get_current_nfl_week, get_nfl_week_for_date
+from utils.nfl_teams import NFL_MASCOTS, lookup_nfl_mascot
+
+# The Google API client and aiohttp are imported on first access (PEP 562), so
+# `from utils import Config, get_logger` stays cheap
+_LAZY_MODULES = {
+    'GoogleSheetsClient': '.google_sheets',
+    'BaseScraper': '.base_scraper',
+}
 
 __all__ = [
     'Config',
@@ -13,5 +21,21 @@ __all__ = [
     'BaseScraper',
     'get_current_nfl_week',
     'get_nfl_week_for_date',
+    'NFL_MASCOTS',
+    'lookup_nfl_mascot',
 ]
 
+
+def __getattr__(name):
+    """Import a lazily loaded utility from its module the first time it is accessed."""
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily imported utilities alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
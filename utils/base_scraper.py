@@ -1,26 +1,107 @@
 """Base scraper class with common functionality."""
 
 import asyncio
+import contextlib
+import os
 import random
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional
 import aiohttp
 from utils.logger import get_logger
 
+try:
+    import aiodns  # noqa: F401 - enables aiohttp's non-blocking AsyncResolver
+except ImportError:
+    aiodns = None  # aiohttp falls back to resolving hosts in a thread
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Not available on Windows; the default asyncio loop is used instead
+
+# Keep resolved hosts and idle connections around for the length of a scraping run
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 75
+
+# One pool for HTML parsing, shared by every scraper in the process
+_PARSE_POOL: Optional[ThreadPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def create_connector(limit: int, limit_per_host: int = 0) -> aiohttp.TCPConnector:
+    """
+    Create a pooled keep-alive connector for scraper sessions.
+    
+    Args:
+        limit: Maximum number of open connections in total
+        limit_per_host: Maximum open connections to a single host (0 for no per-host cap)
+        
+    Returns:
+        TCPConnector that caches DNS lookups and reuses idle connections
+    """
+    resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        resolver=resolver
+    )
+
+
+def get_parse_pool() -> ThreadPoolExecutor:
+    """
+    Get the thread pool used to parse fetched pages off the event loop.
+    
+    Returns:
+        Shared ThreadPoolExecutor, started on first use
+    """
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="html-parse")
+        return _PARSE_POOL
+
+
+def run_scraper(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a scraper's main() coroutine when the scraper is executed directly.
+    
+    Args:
+        coro: Coroutine to run to completion
+        
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 
 class BaseScraper(ABC):
     """Abstract base class for web scrapers."""
     
-    def __init__(self, max_concurrent_requests: int = 50):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 50,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """
         Initialize base scraper.
         
         Args:
             max_concurrent_requests: Maximum concurrent HTTP requests
+            session: Shared HTTP session to use instead of opening one (left open on exit)
+            semaphore: Shared limit on in-flight HTTP requests across scrapers
         """
         self.max_concurrent_requests = max_concurrent_requests
         self.semaphore = asyncio.Semaphore(max_concurrent_requests)
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self.owns_session = session is None
+        self.request_limit = semaphore if semaphore is not None else contextlib.nullcontext()
         self.logger = get_logger(self.__class__.__name__)
         
         # Common headers
@@ -35,7 +116,10 @@ class BaseScraper(ABC):
     
     async def __aenter__(self):
         """Async context manager entry."""
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent_requests)
+        if not self.owns_session:
+            return self
+        
+        connector = create_connector(self.max_concurrent_requests, limit_per_host=self.max_concurrent_requests)
         timeout = aiohttp.ClientTimeout(total=60)
         self.session = aiohttp.ClientSession(
             connector=connector,
@@ -46,9 +130,25 @@ class BaseScraper(ABC):
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        if self.owns_session and self.session:
             await self.session.close()
     
+    async def run_parser(self, parse: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a synchronous page-parsing function in the shared parse thread pool.
+        
+        Keeps the event loop free to service other requests while a page is parsed.
+        
+        Args:
+            parse: Parsing function to call
+            *args: Arguments passed to the parsing function
+            
+        Returns:
+            The parsing function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_parse_pool(), parse, *args)
+    
     async def fetch_with_retry(
         self, 
         url: str, 
@@ -72,13 +172,14 @@ class BaseScraper(ABC):
                     # Random delay to avoid being blocked
                     await asyncio.sleep(random.uniform(*delay_range))
                     
-                    async with self.session.get(url) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            self.logger.debug(f"Successfully fetched {url}")
-                            return content
-                        else:
-                            self.logger.warning(f"HTTP {response.status} for {url}")
+                    async with self.request_limit:
+                        async with self.session.get(url, headers=self.headers) as response:
+                            if response.status == 200:
+                                content = await response.text()
+                                self.logger.debug(f"Successfully fetched {url}")
+                                return content
+                            else:
+                                self.logger.warning(f"HTTP {response.status} for {url}")
                 
                 except asyncio.TimeoutError:
                     self.logger.warning(f"Timeout for {url} (attempt {attempt + 1}/{max_retries})")
@@ -28,6 +28,20 @@ class Config:
     # Data paths
     data_dir: str = "data"
     
+    # Tavily search cache (re-runs within the TTL skip Tavily round-trips)
+    tavily_cache_enabled: bool = True
+    tavily_cache_ttl: float = 6 * 60 * 60
+    
+    # OpenAI account rate limits used by the request throttle
+    openai_rpm: int = 500
+    openai_tpm: int = 200_000
+    
+    # Send team names the static NFL alias table can't resolve to the LLM
+    enable_llm_fallback: bool = True
+    
+    # Run LLM team-name normalization (both leagues) as OpenAI Batch API jobs (half price, slower)
+    use_batch_api: bool = False
+    
     @classmethod
     def _build_google_credentials_json(cls) -> str:
         """
@@ -98,6 +112,12 @@ class Config:
         nfl_sheet_id = os.getenv("NFL_SHEET_ID")
         openai_key = os.getenv("OPENAI_API_KEY")
         tavily_key = os.getenv("TAVILY_API_KEY")
+        tavily_cache_enabled = os.getenv("TAVILY_CACHE_ENABLED", "true").strip().lower() not in ("0", "false", "no")
+        tavily_cache_ttl = float(os.getenv("TAVILY_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+        openai_rpm = int(os.getenv("OPENAI_RPM", "500"))
+        openai_tpm = int(os.getenv("OPENAI_TPM", "200000"))
+        enable_llm_fallback = os.getenv("ENABLE_LLM_FALLBACK", "true").strip().lower() not in ("0", "false", "no")
+        use_batch_api = os.getenv("USE_BATCH_API", "false").strip().lower() in ("1", "true", "yes")
         
         if not sheet_id:
             raise ValueError("SHEET_ID not found in environment")
@@ -114,7 +134,13 @@ class Config:
             nfl_sheet_id=nfl_sheet_id,
             google_service_account_key=google_key,
             openai_api_key=openai_key,
-            tavily_api_key=tavily_key
+            tavily_api_key=tavily_key,
+            tavily_cache_enabled=tavily_cache_enabled,
+            tavily_cache_ttl=tavily_cache_ttl,
+            openai_rpm=openai_rpm,
+            openai_tpm=openai_tpm,
+            enable_llm_fallback=enable_llm_fallback,
+            use_batch_api=use_batch_api
         )
     
     def get_data_path(self, filename: str, league: str = "ncaaf") -> str:
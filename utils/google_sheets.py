@@ -2,6 +2,7 @@
 
 import json
 import codecs
+import threading
 from typing import Optional
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -10,6 +11,51 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Retries for quota (429, rate-limit 403) and 5xx errors; the client library backs
+# off exponentially with random jitter between attempts
+MAX_RETRIES = 5
+
+# Service account credentials keyed by (key, read_only). Clients built from the same
+# credentials share one OAuth access token instead of each doing its own JWT exchange.
+_CREDENTIALS_CACHE: dict[tuple[str, bool], service_account.Credentials] = {}
+_CREDENTIALS_LOCK = threading.Lock()
+
+
+def get_credentials(config: Config, read_only: bool = True) -> service_account.Credentials:
+    """
+    Get (and cache) service account credentials for the Sheets API.
+    
+    Args:
+        config: Application configuration
+        read_only: If True, use read-only scope; otherwise use full access
+        
+    Returns:
+        Service account credentials shared by every client with the same key and scope
+    """
+    key = (config.google_service_account_key, read_only)
+    with _CREDENTIALS_LOCK:
+        credentials = _CREDENTIALS_CACHE.get(key)
+        if credentials is None:
+            # Parse credentials
+            try:
+                key_decoded = codecs.decode(config.google_service_account_key, 'unicode_escape')
+                credentials_info = json.loads(key_decoded)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                credentials_info = json.loads(config.google_service_account_key)
+            
+            # Set appropriate scope
+            scope = (
+                ['https://www.googleapis.com/auth/spreadsheets.readonly'] 
+                if read_only 
+                else ['https://www.googleapis.com/auth/spreadsheets']
+            )
+            
+            credentials = service_account.Credentials.from_service_account_info(
+                credentials_info, scopes=scope
+            )
+            _CREDENTIALS_CACHE[key] = credentials
+    return credentials
+
 
 class GoogleSheetsClient:
     """Wrapper for Google Sheets API operations."""
@@ -26,31 +72,15 @@ class GoogleSheetsClient:
         self.config = config
         self.sheet_id = sheet_id or config.sheet_id
         
-        # Parse credentials
-        try:
-            key_decoded = codecs.decode(config.google_service_account_key, 'unicode_escape')
-            credentials_info = json.loads(key_decoded)
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            credentials_info = json.loads(config.google_service_account_key)
-        
-        # Set appropriate scope
-        scope = (
-            ['https://www.googleapis.com/auth/spreadsheets.readonly'] 
-            if read_only 
-            else ['https://www.googleapis.com/auth/spreadsheets']
-        )
-        
-        # Create credentials and service
-        credentials = service_account.Credentials.from_service_account_info(
-            credentials_info, scopes=scope
-        )
-        self.service = build('sheets', 'v4', credentials=credentials)
+        # Build the service on shared credentials; the service itself is per client
+        # because its HTTP transport is not thread-safe and the leagues update in parallel
+        self.service = build('sheets', 'v4', credentials=get_credentials(config, read_only))
         
         logger.info(f"Google Sheets client initialized (read_only={read_only})")
     
     def get_sheet_name(self) -> str:
         """Get the first sheet name."""
-        sheets = self.service.spreadsheets().get(spreadsheetId=self.sheet_id).execute()
+        sheets = self.service.spreadsheets().get(spreadsheetId=self.sheet_id).execute(num_retries=MAX_RETRIES)
         return sheets['sheets'][0]['properties']['title']
     
     def read_range(self, range_str: str) -> list:
@@ -66,7 +96,7 @@ class GoogleSheetsClient:
         result = self.service.spreadsheets().values().get(
             spreadsheetId=self.sheet_id, 
             range=range_str
-        ).execute()
+        ).execute(num_retries=MAX_RETRIES)
         return result.get('values', [])
     
     def batch_update(self, updates: list[dict]) -> int:
@@ -87,7 +117,7 @@ class GoogleSheetsClient:
         result = self.service.spreadsheets().values().batchUpdate(
             spreadsheetId=self.sheet_id, 
             body=body
-        ).execute()
+        ).execute(num_retries=MAX_RETRIES)
         
         return result.get('totalUpdatedCells', 0)
 
@@ -0,0 +1,85 @@
+"""JSON read/write helpers backed by orjson, falling back to the stdlib json module."""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch it either way
+JSONDecodeError = json.JSONDecodeError
+
+# Like the stdlib, accept non-string dict keys (e.g. int row numbers) and emit them as strings
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string (UTF-8, non-ASCII kept as-is).
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation instead of compact output
+        
+    Returns:
+        JSON string
+    """
+    return dumpb(obj, indent=indent).decode('utf-8')
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes (non-ASCII kept as-is).
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation instead of compact output
+        
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+
+def load_json(file_path: str) -> Any:
+    """Read and parse a JSON file."""
+    with open(file_path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_json(file_path: str, obj: Any, indent: bool = True) -> None:
+    """
+    Atomically serialize an object to a JSON file (2-space indentation by default).
+    
+    The data is written to a temporary file next to the target and renamed over
+    it, so readers (and crashes mid-write) never see a truncated file. orjson's
+    bytes are written as-is, without a round trip through str.
+    
+    Args:
+        file_path: Destination path
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation instead of compact output
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(dumpb(obj, indent=indent))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
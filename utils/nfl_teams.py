@@ -0,0 +1,101 @@
+"""NFL team name lookup utility."""
+
+import re
+from typing import Optional
+from rapidfuzz import fuzz, process
+
+
+# (city/region, mascot, extra aliases) for all 32 teams
+NFL_TEAMS = [
+    ("Arizona", "Cardinals", ["ARI", "ARZ", "Arizona Cards"]),
+    ("Atlanta", "Falcons", ["ATL"]),
+    ("Baltimore", "Ravens", ["BAL"]),
+    ("Buffalo", "Bills", ["BUF"]),
+    ("Carolina", "Panthers", ["CAR"]),
+    ("Chicago", "Bears", ["CHI"]),
+    ("Cincinnati", "Bengals", ["CIN"]),
+    ("Cleveland", "Browns", ["CLE"]),
+    ("Dallas", "Cowboys", ["DAL"]),
+    ("Denver", "Broncos", ["DEN"]),
+    ("Detroit", "Lions", ["DET"]),
+    ("Green Bay", "Packers", ["GB", "GNB"]),
+    ("Houston", "Texans", ["HOU"]),
+    ("Indianapolis", "Colts", ["IND"]),
+    ("Jacksonville", "Jaguars", ["JAX", "JAC", "Jags"]),
+    ("Kansas City", "Chiefs", ["KC", "KAN"]),
+    ("Las Vegas", "Raiders", ["LV", "LVR", "Oakland", "Oakland Raiders"]),
+    ("Los Angeles", "Chargers", ["LAC", "LA Chargers", "San Diego", "San Diego Chargers"]),
+    ("Los Angeles", "Rams", ["LAR", "LA Rams", "St. Louis Rams"]),
+    ("Miami", "Dolphins", ["MIA"]),
+    ("Minnesota", "Vikings", ["MIN"]),
+    ("New England", "Patriots", ["NE", "NWE", "Pats"]),
+    ("New Orleans", "Saints", ["NO", "NOR"]),
+    ("New York", "Giants", ["NYG", "NY Giants"]),
+    ("New York", "Jets", ["NYJ", "NY Jets"]),
+    ("Philadelphia", "Eagles", ["PHI"]),
+    ("Pittsburgh", "Steelers", ["PIT"]),
+    ("San Francisco", "49ers", ["SF", "SFO", "Niners"]),
+    ("Seattle", "Seahawks", ["SEA"]),
+    ("Tampa Bay", "Buccaneers", ["TB", "TAM", "Bucs", "Tampa"]),
+    ("Tennessee", "Titans", ["TEN"]),
+    ("Washington", "Commanders", ["WAS", "WSH", "Washington Football Team"]),
+]
+
+# Standard mascot names
+NFL_MASCOTS = frozenset(mascot for _, mascot, _ in NFL_TEAMS)
+
+# Cities shared by two teams can't be resolved without the mascot
+_AMBIGUOUS_CITIES = {"New York", "Los Angeles"}
+
+
+def _alias_key(name: str) -> str:
+    """Normalize a team name for alias lookup (lowercase, no punctuation, single spaces)."""
+    return " ".join(re.sub(r"[^a-z0-9 ]", " ", name.lower().replace(".", "")).split())
+
+
+def _build_aliases() -> dict[str, str]:
+    """Build the normalized alias -> mascot table."""
+    aliases = {}
+    for city, mascot, extra_aliases in NFL_TEAMS:
+        names = [mascot, f"{city} {mascot}", *extra_aliases]
+        if city not in _AMBIGUOUS_CITIES:
+            names.append(city)
+        for name in names:
+            aliases[_alias_key(name)] = mascot
+    return aliases
+
+
+NFL_ALIASES = _build_aliases()
+
+# Keys used for typo matching (short abbreviations only ever match exactly)
+_FUZZY_KEYS = [key for key in NFL_ALIASES if len(key) >= 4]
+_AMBIGUOUS_KEYS = {_alias_key(city) for city in _AMBIGUOUS_CITIES} | {"ny", "la"}
+
+
+def lookup_nfl_mascot(team_name: str, score_cutoff: float = 80) -> Optional[str]:
+    """
+    Resolve any NFL team name variation to its standard mascot name.
+    
+    Tries an exact alias lookup (cities, full names, abbreviations), then a
+    fuzzy match to handle typos like "Cincinati".
+    
+    Args:
+        team_name: Raw team name
+        score_cutoff: Minimum fuzzy match score (0-100)
+        
+    Returns:
+        Standard mascot name (e.g., "Ravens"), or None if it can't be resolved
+    """
+    if not team_name:
+        return None
+    
+    key = _alias_key(team_name)
+    if key in NFL_ALIASES:
+        return NFL_ALIASES[key]
+    if not key or key in _AMBIGUOUS_KEYS:
+        return None
+    
+    match = process.extractOne(key, _FUZZY_KEYS, scorer=fuzz.WRatio, score_cutoff=score_cutoff)
+    if match:
+        return NFL_ALIASES[match[0]]
+    return None
@@ -0,0 +1,114 @@
+"""Token-bucket rate limiting for OpenAI API requests."""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str, max_tokens: int = 0) -> int:
+    """
+    Roughly estimate the tokens a request consumes (~4 characters per token).
+    
+    Args:
+        text: All prompt text sent with the request
+        max_tokens: Completion token budget requested
+        
+    Returns:
+        Estimated total token count
+    """
+    return len(text) // 4 + max_tokens
+
+
+class OpenAIThrottle:
+    """Throttle requests to stay within requests-per-minute and tokens-per-minute limits."""
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_retries: int = 6):
+        """
+        Initialize OpenAI throttle.
+        
+        Args:
+            requests_per_minute: Account request limit (RPM)
+            tokens_per_minute: Account token limit (TPM)
+            max_retries: Maximum retries after a rate limit error
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        
+        # Buckets start full and refill continuously
+        self.available_request_capacity = float(requests_per_minute)
+        self.available_token_capacity = float(tokens_per_minute)
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Replenish both buckets for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        
+        self.available_request_capacity = min(
+            self.available_request_capacity + self.requests_per_minute * elapsed / 60,
+            self.requests_per_minute
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + self.tokens_per_minute * elapsed / 60,
+            self.tokens_per_minute
+        )
+    
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until both buckets have capacity, then consume it.
+        
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        # A request larger than the whole bucket could never be dispatched
+        tokens = min(tokens, self.tokens_per_minute)
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+                
+                # Sleep just long enough for the scarcer bucket to refill
+                request_wait = (1 - self.available_request_capacity) * 60 / self.requests_per_minute
+                token_wait = (tokens - self.available_token_capacity) * 60 / self.tokens_per_minute
+                await asyncio.sleep(max(request_wait, token_wait, 0.01))
+    
+    async def run(self, request_func: Callable[[], Awaitable[T]], tokens: int) -> T:
+        """
+        Run a request under the throttle, retrying rate limit errors with backoff.
+        
+        Args:
+            request_func: Zero-argument coroutine function issuing the request
+            tokens: Estimated tokens the request will consume
+            
+        Returns:
+            The request result
+            
+        Raises:
+            RateLimitError: If the request is still rate limited after max_retries
+        """
+        from openai import RateLimitError
+        
+        for attempt in range(self.max_retries + 1):
+            await self.acquire(tokens)
+            try:
+                return await request_func()
+            except RateLimitError:
+                if attempt == self.max_retries:
+                    raise
+                # Exponential backoff with jitter so retries don't fire in lockstep
+                wait_time = min(2 ** attempt, 60) + random.uniform(0, 1)
+                logger.warning(f"OpenAI rate limit hit (attempt {attempt + 1}/{self.max_retries}), retrying in {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)